@@ -6,29 +6,1084 @@ evaluation reports with actionable recommendations for improving digital presenc
 """
 
 import asyncio
+import importlib.util
 import json
 import logging
 import os
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import random
+import sys
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, fields, is_dataclass
+from datetime import datetime
+from functools import cache, lru_cache
+from types import MappingProxyType, ModuleType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+# CrewAI pulls in heavy transitive dependencies, so only check for it here and
+# import it on first use (see _get_crewai)
+CREWAI_AVAILABLE = importlib.util.find_spec("crewai") is not None
+if not CREWAI_AVAILABLE:
+    # Module logger rather than logging.warning, which would configure the root
+    # logger as an import side effect
+    logging.getLogger(__name__).warning("CrewAI not available, some features will be limited")
 
-# Import CrewAI components
 try:
-    from crewai import Agent, Crew, Process, Task
-    from crewai_tools import BaseTool as CrewAIBaseTool
-    CREWAI_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    CREWAI_AVAILABLE = False
-    logging.warning("CrewAI not available, some features will be limited")
+    ORJSON_AVAILABLE = False
 
 # Import local components
 from agents.website_social_media_analyst_config import agents as analyst_agents
 
-from agents.enhanced_base_agent import EnhancedBaseAgent
+from agents.base_agent import load_json_config
+from agents.robust_tool import RetryPolicy
+
+
+@cache
+def _get_crewai() -> ModuleType:
+    """Import CrewAI on first use."""
+    import crewai
+    return crewai
+
+
+# Canonical instances of frozen sub-structures, keyed by their structure
+_SHARED_NODES: Dict[Any, Any] = {}
+
+
+def _deep_freeze(obj: Any, share: bool = True) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples.
+
+    Strings are interned so repeated labels ("High", "SEO Team", "1 week")
+    share one object across all frozen sample data. With ``share``, identical
+    mappings and sequences are also replaced by a single canonical instance
+    that lives for the rest of the process, so only use it for data built a
+    bounded number of times.
+    """
+    return _freeze_node(obj, _SHARED_NODES if share else {})[0]
+
+
+def _freeze_node(obj: Any, table: Dict[Any, Any]) -> Tuple[Any, Any]:
+    """Freeze obj and return it along with a hashable key describing its structure."""
+    if isinstance(obj, dict):
+        entries = [(_freeze_node(key, table), _freeze_node(value, table)) for key, value in obj.items()]
+        node_key = ("mapping", tuple((key[1], value[1]) for key, value in entries))
+        frozen = MappingProxyType({key[0]: value[0] for key, value in entries})
+    elif isinstance(obj, list):
+        items = [_freeze_node(item, table) for item in obj]
+        node_key = ("sequence", tuple(item_key for _, item_key in items))
+        frozen = tuple(item for item, _ in items)
+    elif isinstance(obj, str):
+        return sys.intern(obj), (str, obj)
+    else:
+        try:
+            hash(obj)
+        except TypeError:
+            # Already-frozen mappings and other unhashable leaves are shared as-is
+            return obj, (id, id(obj))
+        return obj, (type(obj), obj)
+    return table.setdefault(node_key, frozen), node_key
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON encoder fallback for the frozen sample data structures."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _thaw(obj: Any) -> Any:
+    """Recursively convert frozen result structures back into plain dicts and lists.
+
+    Applied where results leave the crew, so callers get ordinary JSON-compatible
+    data they can index, mutate and pass to ``json.dumps`` without touching the
+    shared sample constants or cached results.
+    """
+    if isinstance(obj, (dict, MappingProxyType)):
+        return {key: _thaw(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_thaw(item) for item in obj]
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: _thaw(getattr(obj, f.name)) for f in fields(obj)}
+    return obj
+
+
+def _dumps_json(obj: Any) -> str:
+    """Serialize results to indented JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(obj, indent=2, default=_json_default)
+
+
+def _dumps_compact(obj: Any) -> str:
+    """Serialize a value to compact JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_json_default).decode()
+    return json.dumps(obj, default=_json_default)
+
+
+def _cache_key(params: Mapping[str, Any]) -> str:
+    """Build a canonical, order-independent cache key for analysis parameters."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(params, default=str, option=orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+@dataclass(frozen=True, slots=True)
+class VisitShare:
+    """Visits and share of total visits for one traffic channel or device."""
+
+    visits: int
+    percentage: float
+
+
+@dataclass(frozen=True, slots=True)
+class TrafficSourceStats:
+    """Traffic volume, share and trend for one traffic source."""
+
+    traffic: int
+    percentage: float
+    trend: str
+
+
+@dataclass(frozen=True, slots=True)
+class PlatformTraffic:
+    """Referred traffic, share and engagement for one social platform."""
+
+    traffic: int
+    percentage: float
+    engagement: float
+
+
+@dataclass(frozen=True, slots=True)
+class ReferralSource:
+    """Referred traffic and quality score for one referring site."""
+
+    source: str
+    traffic: int
+    quality: int
+
+
+@dataclass(frozen=True, slots=True)
+class CompetitorKeyword:
+    """A keyword where a competitor outranks the podcast."""
+
+    keyword: str
+    competitor: str
+    our_rank: int
+    their_rank: int
+
+
+@dataclass(frozen=True, slots=True)
+class Recommendation:
+    """A single improvement recommendation in the analysis report."""
+
+    recommendation: str
+    impact: str
+    effort: str
+    priority: str
+
+
+@dataclass(frozen=True, slots=True)
+class KeywordRecommendation(Recommendation):
+    """A recommendation that targets specific search keywords."""
+
+    keywords: Tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class PlatformRecommendation:
+    """A recommendation for one social platform, with its current state."""
+
+    platform: str
+    recommendation: str
+    current: str
+    potential_impact: str
+
+
+@dataclass(frozen=True, slots=True)
+class Action:
+    """A scheduled action item in the report's action plan."""
+
+    action: str
+    responsible: str
+    timeline: str
+    resources: str
+    success_metrics: str
+
+
+def _record_table(record_type: type, rows: Tuple[Tuple[Any, ...], ...]) -> Mapping[str, Any]:
+    """Build a read-only ``name -> record`` mapping from ``(name, *fields)`` rows."""
+    return MappingProxyType({name: record_type(*values) for name, *values in rows})
+
+
+_CHANNEL_VISITS = _record_table(VisitShare, (
+    ("organic", 28765, 63.5),
+    ("social", 12456, 27.5),
+    ("direct", 3128, 6.9),
+    ("referral", 938, 2.1),
+))
+
+_DEVICE_VISITS = _record_table(VisitShare, (
+    ("desktop", 24321, 53.7),
+    ("mobile", 18945, 41.8),
+    ("tablet", 2021, 4.5),
+))
+
+_SOURCE_DISTRIBUTION = _record_table(TrafficSourceStats, (
+    ("organic_search", 28765, 63.5, "up_5_percent"),
+    ("social_media", 12456, 27.5, "up_12_percent"),
+    ("direct", 3128, 6.9, "stable"),
+    ("referral", 938, 2.1, "down_3_percent"),
+))
+
+_SOCIAL_MEDIA_TRAFFIC = _record_table(PlatformTraffic, (
+    ("twitter", 3456, 27.7, 4.2),
+    ("instagram", 4231, 33.9, 6.8),
+    ("tiktok", 3124, 25.1, 8.4),
+    ("youtube", 1645, 13.2, 5.3),
+))
+
+
+# Analysis parameters (with defaults) that the parameter-dependent sample
+# generators read; everything else in a request is ignored by them
+_SAMPLE_DATA_PARAMS: Tuple[Tuple[str, Any], ...] = (
+    ("time_period", "last_30_days"),
+)
+
+
+def _sample_data_key(params: Mapping[str, Any]) -> Tuple[Any, ...]:
+    """Reduce analysis parameters to the values the sample generators depend on."""
+    return tuple(params.get(name, default) for name, default in _SAMPLE_DATA_PARAMS)
+
+
+def _call_cached(builder: Any, key: Tuple[Any, ...]) -> Any:
+    """Call an lru_cache-wrapped builder, bypassing the cache for unhashable keys."""
+    try:
+        hash(key)
+    except TypeError:
+        return builder.__wrapped__(*key)
+    return builder(*key)
+
+
+@lru_cache(maxsize=64)
+def _sample_traffic_metrics(time_period: str) -> Mapping[str, Any]:
+    """Build the sample traffic metrics once per time period."""
+    # Not shared: the lru_cache bounds how many of these are alive at once
+    return _deep_freeze({
+        "period": time_period,
+        "total_visits": 45287,
+        "unique_visitors": 32145,
+        "page_views": 128765,
+        "bounce_rate": 42.3,
+        "avg_session_duration": "3:45",
+        "traffic_sources": _CHANNEL_VISITS,
+        "device_distribution": _DEVICE_VISITS
+    }, share=False)
+
+
+# Sample data that does not depend on the analysis parameters, built once at
+# import and shared by every call
+_TECHNICAL_HEALTH: Mapping[str, Any] = _deep_freeze({
+    "broken_links": 8,
+    "server_errors": 2,
+    "javascript_errors": 14,
+    "css_issues": 5,
+    "mobile_responsiveness_score": 92,
+    "page_speed_score": 78,
+    "security_issues": 1
+})
+
+_CONTENT_PATTERNS: Mapping[str, Any] = _deep_freeze({
+    "high_performing_patterns": {
+        "topics": ["funny moments", "guest interviews", "behind the scenes"],
+        "formats": ["short clips", "highlight reels", "guest teasers"],
+        "length": "3-5 minutes for episodes, 45-60 seconds for shorts",
+        "posting_times": ["Tuesday-Thursday evenings", "Weekend mornings"],
+        "guest_types": ["comedians", "industry experts", "fan favorites"]
+    },
+    "emerging_patterns": {
+        "growing_topics": ["production insights", "guest reactions", "audience Q&A"],
+        "new_formats": ["interactive polls", "live reactions", "mini-documentaries"],
+        "trending_guests": ["up-and-coming comedians", "industry disruptors"]
+    },
+    "content_lifecycle": {
+        "initial_spike": "First 48 hours",
+        "sustained_performance": "7-14 days",
+        "evergreen_content": ["Best of compilations", "Guest highlights", "Topic deep dives"],
+        "resurgence_patterns": ["Related to current events", "Guest appearances elsewhere", "Algorithm changes"]
+    }
+})
+
+_SEO_AUDIT: Mapping[str, Any] = _deep_freeze({
+    "technical_seo": {
+        "score": 82,
+        "issues": {
+            "critical": 3,
+            "high": 8,
+            "medium": 15,
+            "low": 22
+        },
+        "mobile_friendliness": 92,
+        "page_speed": 78,
+        "structured_data": 88
+    },
+    "on_page_seo": {
+        "score": 76,
+        "issues": {
+            "missing_title_tags": 4,
+            "duplicate_meta_descriptions": 8,
+            "thin_content": 3,
+            "missing_alt_text": 12
+        },
+        "content_quality": 85,
+        "internal_linking": 68
+    },
+    "off_page_seo": {
+        "score": 64,
+        "backlink_profile": {
+            "total_backlinks": 428,
+            "referring_domains": 124,
+            "domain_authority": 47,
+            "toxic_links": 3
+        },
+        "social_signals": 78
+    },
+    "competitive_analysis": {
+        "competitor_comparison": {
+            "domain_authority": "above_average",
+            "backlink_profile": "below_average",
+            "content_quality": "above_average",
+            "technical_seo": "average"
+        },
+        "opportunity_areas": [
+            "Backlink building",
+            "Content gap analysis",
+            "Featured snippet optimization"
+        ]
+    }
+})
+
+_ON_PAGE_SEO: Mapping[str, Any] = _deep_freeze({
+    "title_tags": {
+        "optimized": 87.2,
+        "missing": 4.3,
+        "too_long": 8.5,
+        "duplicate": 2.1
+    },
+    "meta_descriptions": {
+        "optimized": 72.4,
+        "missing": 12.8,
+        "too_long": 14.8,
+        "duplicate": 5.3
+    },
+    "header_structure": {
+        "proper_h1_usage": 92.1,
+        "logical_hierarchy": 84.3,
+        "keyword_optimization": 76.5
+    },
+    "content_quality": {
+        "unique_content": 94.2,
+        "keyword_optimization": 81.4,
+        "readability": 87.6,
+        "content_length": 78.3
+    },
+    "internal_linking": {
+        "logical_structure": 68.4,
+        "anchor_text_optimization": 52.1,
+        "link_depth": 74.3
+    },
+    "image_optimization": {
+        "alt_text_usage": 62.4,
+        "file_size_optimization": 48.7,
+        "descriptive_filenames": 32.1
+    }
+})
+
+_SEO_PERFORMANCE: Mapping[str, Any] = _deep_freeze({
+    "top_keywords": [
+        {"keyword": "podcast name", "position": 3, "volume": 12500, "ctr": 8.2},
+        {"keyword": "podcast name episode 123", "position": 1, "volume": 8700, "ctr": 12.5},
+        {"keyword": "best comedy podcast", "position": 17, "volume": 6200, "ctr": 4.8}
+    ],
+    "organic_traffic_trend": "up_15_percent",
+    "backlink_profile": {
+        "total_backlinks": 428,
+        "referring_domains": 124,
+        "domain_authority": 47,
+        "toxic_links": 3
+    },
+    "technical_seo_score": 82
+})
+
+_SOCIAL_PERFORMANCE: Mapping[str, Any] = _deep_freeze({
+    "platforms": {
+        "twitter": {
+            "followers": 45287,
+            "growth": 8.2,
+            "engagement_rate": 4.7,
+            "top_post": {"id": "12345", "engagement": 1245, "reach": 8765}
+        },
+        "instagram": {
+            "followers": 87654,
+            "growth": 12.4,
+            "engagement_rate": 6.3,
+            "top_post": {"id": "67890", "engagement": 2456, "reach": 15876}
+        },
+        "tiktok": {
+            "followers": 124567,
+            "growth": 18.7,
+            "engagement_rate": 8.9,
+            "top_post": {"id": "54321", "engagement": 4567, "reach": 28765}
+        },
+        "youtube": {
+            "subscribers": 34567,
+            "growth": 5.3,
+            "views": 1245678,
+            "top_video": {"id": "98765", "views": 45678, "engagement": 1234}
+        }
+    },
+    "content_types": {
+        "episodes": {"engagement_rate": 6.2, "average_views": 8765},
+        "shorts": {"engagement_rate": 12.4, "average_views": 15876},
+        "behind_scenes": {"engagement_rate": 8.7, "average_views": 9876},
+        "promotional": {"engagement_rate": 4.3, "average_views": 5432}
+    }
+})
+
+_CONTENT_ENGAGEMENT: Mapping[str, Any] = _deep_freeze({
+    "episode_engagement": {
+        "average_completion_rate": 72.4,
+        "average_shares": 45.2,
+        "average_comments": 18.7,
+        "top_episodes": [
+            {"id": "123", "title": "Episode 123", "completion_rate": 89.2, "shares": 124, "comments": 45},
+            {"id": "122", "title": "Episode 122", "completion_rate": 85.6, "shares": 98, "comments": 32}
+        ]
+    },
+    "short_form_engagement": {
+        "average_completion_rate": 85.3,
+        "average_shares": 67.8,
+        "average_comments": 24.1,
+        "conversion_to_full_episode": 12.4
+    },
+    "engagement_trends": {
+        "positive": 68.4,
+        "negative": 8.2,
+        "neutral": 23.4
+    }
+})
+
+_AUDIENCE_SENTIMENT: Mapping[str, Any] = _deep_freeze({
+    "overall_sentiment_score": 78.2,
+    "sentiment_distribution": {
+        "positive": 62.4,
+        "negative": 12.8,
+        "neutral": 24.8
+    },
+    "common_topics": [
+        {"topic": "funny moments", "sentiment": 89.2, "mentions": 452},
+        {"topic": "guest appearances", "sentiment": 78.6, "mentions": 321},
+        {"topic": "production quality", "sentiment": 85.3, "mentions": 287}
+    ],
+    "emerging_trends": [
+        "Request for more behind-the-scenes content",
+        "Interest in guest interviews",
+        "Positive response to new format changes"
+    ]
+})
+
+_EPISODE_PERFORMANCE: Mapping[str, Any] = _deep_freeze({
+    "recent_episodes": [
+        {
+            "id": "123",
+            "title": "Episode 123: Special Guest",
+            "release_date": "2024-03-15",
+            "views": 45287,
+            "listens": 32145,
+            "completion_rate": 87.4,
+            "shares": 1245,
+            "comments": 452,
+            "sentiment": 89.2
+        },
+        {
+            "id": "122",
+            "title": "Episode 122: Behind the Scenes",
+            "release_date": "2024-03-08",
+            "views": 38765,
+            "listens": 28432,
+            "completion_rate": 82.6,
+            "shares": 987,
+            "comments": 321,
+            "sentiment": 85.6
+        }
+    ],
+    "performance_trends": {
+        "views_trend": "up_15_percent",
+        "engagement_trend": "up_8_percent",
+        "completion_trend": "stable"
+    },
+    "top_performing_episodes": [
+        {"id": "105", "title": "Episode 105: Viral Moments", "views": 124567, "engagement": 18.7},
+        {"id": "98", "title": "Episode 98: Guest Star", "views": 98765, "engagement": 16.4}
+    ]
+})
+
+_SHORT_FORM_PERFORMANCE: Mapping[str, Any] = _deep_freeze({
+    "platform_comparison": {
+        "tiktok": {
+            "average_views": 15876,
+            "engagement_rate": 12.4,
+            "conversion_rate": 8.7,
+            "top_performing": {"id": "short_45", "views": 45678, "engagement": 18.2}
+        },
+        "instagram_reels": {
+            "average_views": 12456,
+            "engagement_rate": 10.8,
+            "conversion_rate": 6.3,
+            "top_performing": {"id": "reel_32", "views": 38765, "engagement": 15.6}
+        },
+        "youtube_shorts": {
+            "average_views": 9876,
+            "engagement_rate": 9.2,
+            "conversion_rate": 5.1,
+            "top_performing": {"id": "short_18", "views": 24567, "engagement": 12.8}
+        }
+    },
+    "content_patterns": {
+        "best_performing_topics": ["funny moments", "guest reactions", "behind the scenes"],
+        "optimal_length": "45-60 seconds",
+        "best_posting_times": ["weekday evenings", "weekend mornings"],
+        "highest_conversion_topics": ["episode highlights", "guest teasers"]
+    }
+})
+
+_TRAFFIC_PATTERNS: Mapping[str, Any] = _deep_freeze({
+    "daily_patterns": {
+        "peak_hours": ["18:00-21:00", "12:00-14:00"],
+        "low_hours": ["02:00-06:00"],
+        "weekday_vs_weekend": "Weekdays: 62%, Weekends: 38%"
+    },
+    "weekly_patterns": {
+        "highest_traffic_days": ["Tuesday", "Thursday", "Wednesday"],
+        "lowest_traffic_days": ["Sunday", "Saturday"],
+        "content_release_impact": "Episodes increase traffic by 45-60% on release days"
+    },
+    "seasonal_patterns": {
+        "quarterly_trends": {
+            "Q1": {"traffic": "baseline", "growth": 5.2},
+            "Q2": {"traffic": "peak", "growth": 12.8},
+            "Q3": {"traffic": "stable", "growth": 7.4},
+            "Q4": {"traffic": "holiday_spike", "growth": 18.7}
+        },
+        "holiday_impact": {
+            "positive": ["New Year", "Summer", "Holiday Season"],
+            "negative": ["Major sporting events", "Breaking news cycles"]
+        }
+    }
+})
+
+_TRAFFIC_CHANGES: Mapping[str, Any] = _deep_freeze({
+    "recent_changes": {
+        "positive_changes": [
+            {
+                "date_range": "2024-02-15 to 2024-02-22",
+                "change": "+28.4%",
+                "likely_cause": "Episode 123 viral moment",
+                "sustained": True
+            },
+            {
+                "date_range": "2024-01-08 to 2024-01-15",
+                "change": "+15.2%",
+                "likely_cause": "Social media campaign",
+                "sustained": False
+            }
+        ],
+        "negative_changes": [
+            {
+                "date_range": "2023-12-20 to 2023-12-27",
+                "change": "-8.7%",
+                "likely_cause": "Holiday season competition",
+                "recovered": True
+            }
+        ]
+    },
+    "anomaly_detection": {
+        "detected_anomalies": [
+            {
+                "date": "2024-03-03",
+                "type": "traffic_spike",
+                "magnitude": "+45.8%",
+                "duration": "6 hours",
+                "cause_identified": "Viral TikTok clip",
+                "action_taken": "Amplified with paid promotion"
+            }
+        ],
+        "false_positives": 2,
+        "detection_accuracy": 94.2
+    },
+    "correlation_analysis": {
+        "content_traffic_correlation": 0.87,
+        "social_media_correlation": 0.72,
+        "seo_correlation": 0.68,
+        "external_events_correlation": 0.45
+    }
+})
+
+_TRAFFIC_SOURCES: Mapping[str, Any] = _deep_freeze({
+    "source_distribution": _SOURCE_DISTRIBUTION,
+    "social_media_breakdown": _SOCIAL_MEDIA_TRAFFIC,
+    "referral_sources": {
+        "top_sources": [
+            ReferralSource("podcast_directory.com", traffic=452, quality=87),
+            ReferralSource("comedyblog.net", traffic=234, quality=78),
+            ReferralSource("entertainmentnews.org", traffic=156, quality=92)
+        ],
+        "quality_scores": {
+            "high_quality": 62.4,
+            "medium_quality": 28.7,
+            "low_quality": 8.9
+        }
+    },
+    "conversion_rates": {
+        "organic_to_subscriber": 8.2,
+        "social_to_subscriber": 6.4,
+        "direct_to_subscriber": 12.8,
+        "referral_to_subscriber": 9.3
+    }
+})
+
+_KEYWORD_ANALYSIS: Mapping[str, Any] = _deep_freeze({
+    "current_keyword_performance": {
+        "total_keywords": 428,
+        "top_10_rankings": 124,
+        "top_50_rankings": 245,
+        "declining_keywords": 32,
+        "improving_keywords": 87
+    },
+    "keyword_opportunities": {
+        "high_potential": [
+            {"keyword": "best comedy podcast 2024", "volume": 8700, "difficulty": "medium", "potential": "high"},
+            {"keyword": "funny podcast recommendations", "volume": 6200, "difficulty": "low", "potential": "high"}
+        ],
+        "long_tail_opportunities": [
+            {"keyword": "podcast with guest interviews", "volume": 3400, "difficulty": "low", "potential": "medium"},
+            {"keyword": "behind the scenes comedy podcast", "volume": 2800, "difficulty": "low", "potential": "medium"}
+        ]
+    },
+    "competitor_keywords": {
+        "gap_analysis": {
+            "missing_high_volume": 14,
+            "missing_low_competition": 28,
+            "overlap_with_competitors": 62
+        },
+        "top_competitor_keywords": [
+            CompetitorKeyword("top rated comedy podcast", "competitor1", our_rank=18, their_rank=5),
+            CompetitorKeyword("funniest podcast episodes", "competitor2", our_rank=24, their_rank=8)
+        ]
+    },
+    "keyword_recommendations": {
+        "priority_keywords": [
+            "podcast name",
+            "podcast name episode 123",
+            "best comedy podcast",
+            "funny podcast recommendations"
+        ],
+        "content_gap_keywords": [
+            "podcast guest interviews",
+            "comedy podcast behind the scenes",
+            "how podcast is made"
+        ]
+    }
+})
+
+_RECOMMENDATIONS: Mapping[str, Any] = _deep_freeze({
+    "quick_wins": [
+        Recommendation(
+            recommendation="Fix broken links (8 found)",
+            impact="Improve user experience and SEO",
+            effort="Low",
+            priority="High"
+        ),
+        Recommendation(
+            recommendation="Optimize meta descriptions for top 20 pages",
+            impact="Increase click-through rate from search",
+            effort="Medium",
+            priority="High"
+        ),
+        Recommendation(
+            recommendation="Implement proper alt text for all images",
+            impact="Improve accessibility and SEO",
+            effort="Medium",
+            priority="Medium"
+        )
+    ],
+    "strategic_initiatives": [
+        KeywordRecommendation(
+            recommendation="Develop content around high-potential keywords",
+            impact="Increase organic traffic and rankings",
+            effort="High",
+            priority="High",
+            keywords=("best comedy podcast 2024", "funny podcast recommendations")
+        ),
+        Recommendation(
+            recommendation="Build high-quality backlinks from relevant sites",
+            impact="Improve domain authority and search rankings",
+            effort="High",
+            priority="High"
+        ),
+        Recommendation(
+            recommendation="Create more short-form content highlighting viral moments",
+            impact="Increase social media engagement and reach",
+            effort="Medium",
+            priority="High"
+        )
+    ],
+    "long_term_improvements": [
+        Recommendation(
+            recommendation="Implement comprehensive content calendar with SEO optimization",
+            impact="Sustainable organic traffic growth",
+            effort="High",
+            priority="Medium"
+        ),
+        Recommendation(
+            recommendation="Develop guest appearance strategy with cross-promotion",
+            impact="Expand audience reach and credibility",
+            effort="High",
+            priority="Medium"
+        ),
+        Recommendation(
+            recommendation="Build out video content strategy beyond podcast episodes",
+            impact="Diversify content and attract new audiences",
+            effort="High",
+            priority="Medium"
+        )
+    ],
+    "platform_specific": [
+        PlatformRecommendation(
+            platform="TikTok",
+            recommendation="Increase posting frequency to 3-4 times per week",
+            current="1-2 times per week",
+            potential_impact="+25-35% engagement"
+        ),
+        PlatformRecommendation(
+            platform="Instagram",
+            recommendation="Implement Reels strategy with behind-the-scenes content",
+            current="Static posts only",
+            potential_impact="+40-50% reach"
+        ),
+        PlatformRecommendation(
+            platform="YouTube",
+            recommendation="Create dedicated shorts channel for viral moments",
+            current="Occasional shorts on main channel",
+            potential_impact="+30-40% subscriber growth"
+        )
+    ]
+})
+
+_ACTION_PLAN: Mapping[str, Any] = _deep_freeze({
+    "immediate_actions": [
+        Action(
+            action="Fix all broken links",
+            responsible="Web Development Team",
+            timeline="1 week",
+            resources="Developer time (4 hours)",
+            success_metrics="Zero broken links, improved user experience"
+        ),
+        Action(
+            action="Optimize meta descriptions for top 20 pages",
+            responsible="SEO Team",
+            timeline="2 weeks",
+            resources="SEO specialist (8 hours)",
+            success_metrics="10-15% increase in CTR from search"
+        )
+    ],
+    "short_term_actions": [
+        Action(
+            action="Develop and implement content calendar",
+            responsible="Content Team",
+            timeline="4 weeks",
+            resources="Content strategist (12 hours), team coordination",
+            success_metrics="Consistent posting schedule, improved engagement"
+        ),
+        Action(
+            action="Create 5 short-form videos from Episode 123 viral moments",
+            responsible="Video Team",
+            timeline="3 weeks",
+            resources="Video editor (15 hours), social media coordinator",
+            success_metrics="20-30% increase in social media engagement"
+        )
+    ],
+    "long_term_strategy": [
+        Action(
+            action="Implement comprehensive SEO strategy",
+            responsible="SEO Team",
+            timeline="3 months",
+            resources="SEO specialist (40 hours), content team support",
+            success_metrics="25-35% increase in organic traffic"
+        ),
+        Action(
+            action="Develop guest appearance and cross-promotion strategy",
+            responsible="Marketing Team",
+            timeline="2 months",
+            resources="Marketing coordinator (20 hours), outreach efforts",
+            success_metrics="15-20% audience growth, increased credibility"
+        ),
+        Action(
+            action="Build out comprehensive video content strategy",
+            responsible="Video Team",
+            timeline="3 months",
+            resources="Video team (60 hours), equipment if needed",
+            success_metrics="20-30% increase in overall engagement"
+        )
+    ],
+    "monitoring_plan": {
+        "weekly_checkins": "Every Friday at 2 PM",
+        "monthly_reviews": "First Monday of each month",
+        "quarterly_strategy_sessions": "End of each quarter",
+        "success_metrics_review": "Bi-weekly"
+    },
+    "resource_allocation": {
+        "team_hours": {
+            "web_development": 24,
+            "seo": 68,
+            "content": 45,
+            "video": 92,
+            "marketing": 32
+        },
+        "budget_requirements": {
+            "tools_software": 1200,
+            "outsourcing": 800,
+            "promotion": 1500
+        },
+        "external_resources": {
+            "seo_consultant": "Optional for complex issues",
+            "video_production": "Optional for high-quality content"
+        }
+    }
+})
+
+# Composite sections assembled from the shared sub-sections above
+_SOCIAL_MEDIA_ANALYSIS: Mapping[str, Any] = MappingProxyType({
+    "platform_performance": _SOCIAL_PERFORMANCE,
+    "content_engagement": _CONTENT_ENGAGEMENT,
+    "audience_sentiment": _AUDIENCE_SENTIMENT
+})
+
+_CONTENT_ANALYSIS: Mapping[str, Any] = MappingProxyType({
+    "episode_performance": _EPISODE_PERFORMANCE,
+    "short_form_effectiveness": _SHORT_FORM_PERFORMANCE,
+    "content_patterns": _CONTENT_PATTERNS
+})
+
+_TRAFFIC_ANALYSIS: Mapping[str, Any] = MappingProxyType({
+    "traffic_patterns": _TRAFFIC_PATTERNS,
+    "traffic_changes": _TRAFFIC_CHANGES,
+    "source_analysis": _TRAFFIC_SOURCES
+})
+
+_SEO_ANALYSIS: Mapping[str, Any] = MappingProxyType({
+    "seo_audit": _SEO_AUDIT,
+    "keyword_analysis": _KEYWORD_ANALYSIS,
+    "on_page_evaluation": _ON_PAGE_SEO
+})
+
+
+@lru_cache(maxsize=64)
+def _sample_website_analysis(time_period: str) -> Mapping[str, Any]:
+    """Build the sample website analysis section once per time period."""
+    return MappingProxyType({
+        "traffic_metrics": _call_cached(_sample_traffic_metrics, (time_period,)),
+        "seo_performance": _SEO_PERFORMANCE,
+        "technical_health": _TECHNICAL_HEALTH
+    })
+
+# Identities of the frozen sample constants; their indented JSON is encoded once
+# per nesting depth and spliced into report output by _encode_json_bytes
+_FROZEN_SECTION_IDS = frozenset(id(section) for section in (
+    _CHANNEL_VISITS, _DEVICE_VISITS, _SOURCE_DISTRIBUTION, _SOCIAL_MEDIA_TRAFFIC,
+    _TECHNICAL_HEALTH, _CONTENT_PATTERNS, _SEO_AUDIT, _ON_PAGE_SEO,
+    _SEO_PERFORMANCE, _SOCIAL_PERFORMANCE, _CONTENT_ENGAGEMENT, _AUDIENCE_SENTIMENT,
+    _EPISODE_PERFORMANCE, _SHORT_FORM_PERFORMANCE, _TRAFFIC_PATTERNS, _TRAFFIC_CHANGES,
+    _TRAFFIC_SOURCES, _KEYWORD_ANALYSIS, _RECOMMENDATIONS, _ACTION_PLAN,
+    _SOCIAL_MEDIA_ANALYSIS, _CONTENT_ANALYSIS, _TRAFFIC_ANALYSIS, _SEO_ANALYSIS
+))
+_ENCODED_SECTIONS: Dict[Tuple[int, int], bytes] = {}
+
+
+def _encode_json_bytes(obj: Any, depth: int = 0) -> bytes:
+    """Encode obj as indented JSON bytes, reusing the encoding of frozen sections.
+
+    Output is identical to _dumps_json(obj).encode() for the same value.
+
+    Args:
+        obj: Value to encode
+        depth: Nesting depth of obj within the enclosing document
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if id(obj) in _FROZEN_SECTION_IDS:
+        key = (id(obj), depth)
+        encoded = _ENCODED_SECTIONS.get(key)
+        if encoded is None:
+            encoded = _dumps_json(obj).encode().replace(b"\n", b"\n" + b"  " * depth)
+            _ENCODED_SECTIONS[key] = encoded
+        return encoded
+    if isinstance(obj, dict) and obj and all(isinstance(k, str) for k in obj):
+        indent = b"\n" + b"  " * (depth + 1)
+        members = b",".join(
+            indent + _dumps_compact(key).encode() + b": " + _encode_json_bytes(value, depth + 1)
+            for key, value in obj.items()
+        )
+        return b"{" + members + b"\n" + b"  " * depth + b"}"
+    return _dumps_json(obj).encode().replace(b"\n", b"\n" + b"  " * depth)
+
+
+# Result section each analyst agent's workflow steps are routed to
+_AGENT_TO_SECTION = {
+    "website_analyst": "website_analysis",
+    "social_media_analyst": "social_media_analysis",
+    "content_analyst": "content_analysis",
+    "traffic_analyst": "traffic_analysis",
+    "seo_specialist": "seo_analysis",
+}
+
+# Report generator actions replace a whole result section
+_REPORT_ACTION_TO_SECTION = {
+    "generate_recommendations": "recommendations",
+    "create_implementation_roadmap": "action_plan",
+}
+
+
+# How long a comprehensive analysis result stays fresh, by analysis time period
+_RESULT_TTL_SECONDS = {
+    "today": 60.0,
+    "last_24_hours": 60.0,
+    "last_7_days": 900.0,
+}
+_DEFAULT_RESULT_TTL_SECONDS = 3600.0
+_RESULT_CACHE_MAXSIZE = 256
+
+
+class _KickoffRateLimiter:
+    """Token bucket shared by every crew kickoff in the process.
+
+    Thread-safe, so crews driven from ``run_batch`` worker threads (each with its
+    own event loop) draw from the same budget.
+    """
+
+    __slots__ = ("_capacity", "_tokens", "_fill_rate", "_updated", "_lock")
+
+    def __init__(self, max_rate: float, time_period: float):
+        self._capacity = max_rate
+        self._tokens = max_rate
+        self._fill_rate = max_rate / time_period
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._fill_rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self._fill_rate
+
+
+# Keep kickoffs under typical LLM provider limits and back off when they are hit anyway
+_KICKOFF_RATE_LIMITER = _KickoffRateLimiter(max_rate=25, time_period=60.0)
+_KICKOFF_RETRY_POLICY = RetryPolicy(
+    max_attempts=6,
+    backoff_factor=2.0,
+    initial_delay=1.0,
+    max_delay=30.0,
+    retryable_errors=['RateLimitError']
+)
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    """Check whether an LLM provider error means the request was rate limited."""
+    if getattr(error, 'status_code', None) == 429:
+        return True
+    return any(cls.__name__ in _KICKOFF_RETRY_POLICY.retryable_errors for cls in type(error).__mro__)
+
+# (agent name, description, expected output) for each independent analyst task
+_ANALYST_TASK_SPECS = (
+    (
+        "website_analyst",
+        "Analyze website traffic, SEO performance, and technical health",
+        "Comprehensive website analysis report with recommendations",
+    ),
+    (
+        "social_media_analyst",
+        "Analyze social media performance, engagement, and content effectiveness",
+        "Comprehensive social media analysis report with recommendations",
+    ),
+    (
+        "content_analyst",
+        "Analyze content performance across platforms and identify patterns",
+        "Comprehensive content analysis report with recommendations",
+    ),
+    (
+        "traffic_analyst",
+        "Analyze traffic patterns, detect changes, and correlate with content",
+        "Comprehensive traffic analysis report with recommendations",
+    ),
+    (
+        "seo_specialist",
+        "Conduct SEO audit, analyze keywords, and provide optimization recommendations",
+        "Comprehensive SEO analysis report with recommendations",
+    ),
+)
+
+# Agents making up the crew: the analysts in task order, then the report generator
+_CREW_AGENT_ORDER = tuple(agent_name for agent_name, _, _ in _ANALYST_TASK_SPECS) + ("report_generator",)
 
 
 class WebsiteSocialMediaAnalysisCrew:
-    """Comprehensive website and social media analysis crew."""
+    """Comprehensive website and social media analysis crew.
+
+    Sample data returned by the ``_generate_sample_*`` methods is shared between
+    calls and read-only (``MappingProxyType``, tuples and frozen records). The
+    public ``run_*`` methods convert results back to plain dicts and lists.
+    """
+
+    # Crews may be created per request, so skip the per-instance __dict__
+    __slots__ = (
+        "config_path",
+        "agents",
+        "crewai_agents",
+        "_agent_list",
+        "crew",
+        "logger",
+        "config",
+        "_result_cache",
+        "_result_cache_lock",
+        "_inflight",
+        "rate_limit_hits",
+    )
+
+    # Sample data generator for each result section, used when a workflow leaves it empty
+    _SECTION_FALLBACKS = {
+        "website_analysis": "_generate_sample_website_analysis",
+        "social_media_analysis": "_generate_sample_social_media_analysis",
+        "content_analysis": "_generate_sample_content_analysis",
+        "traffic_analysis": "_generate_sample_traffic_analysis",
+        "seo_analysis": "_generate_sample_seo_analysis",
+        "recommendations": "_generate_sample_recommendations",
+        "action_plan": "_generate_sample_action_plan",
+    }
 
     def __init__(self, config_path: Optional[str] = None):
         """Initialize the analysis crew.
@@ -38,9 +1093,21 @@ class WebsiteSocialMediaAnalysisCrew:
         """
         self.config_path = config_path or "agents/website_social_media_analyst_config.json"
         self.agents = {}
+        self.crewai_agents = {}
+        self._agent_list: Optional[Tuple[Any, ...]] = None
         self.crew = None
         self.logger = logging.getLogger(__name__)
 
+        # Recent comprehensive analysis results, keyed on canonical params
+        self._result_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+
+        # Analyses currently running, so identical concurrent requests share one run
+        self._inflight: Dict[str, Future] = {}
+
+        # Number of provider rate-limit errors hit by crew kickoffs, for tuning
+        self.rate_limit_hits = 0
+
         # Load configuration
         self.config = self._load_config()
 
@@ -53,25 +1120,31 @@ class WebsiteSocialMediaAnalysisCrew:
         self.logger.info("Website & Social Media Analysis Crew initialized")
 
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from file."""
+        """Load configuration from file.
+
+        The parsed config is cached and shared with the enhanced agents that read
+        the same file, so it must be treated as read-only.
+        """
         try:
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
+            return load_json_config(self.config_path)
         except Exception as e:
-            self.logger.error(f"Failed to load config: {e}")
+            self.logger.error("Failed to load config: %s", e)
             raise
 
     def _initialize_agents(self) -> None:
         """Initialize all analysis agents."""
+        # Deferred so importing this module does not load every AI framework
+        from agents.enhanced_base_agent import EnhancedBaseAgent
+
         # Initialize enhanced agents
         for agent_name, agent_config in self.config['agents'].items():
             if agent_name != 'website_social_media_crew':  # Skip the crew itself
                 try:
                     agent = EnhancedBaseAgent(agent_name, self.config_path)
                     self.agents[agent_name] = agent
-                    self.logger.info(f"Initialized {agent_name} agent")
+                    self.logger.info("Initialized %s agent", agent_name)
                 except Exception as e:
-                    self.logger.error(f"Failed to initialize {agent_name}: {e}")
+                    self.logger.error("Failed to initialize %s: %s", agent_name, e)
 
         # Initialize CrewAI agents if available
         if CREWAI_AVAILABLE:
@@ -79,31 +1152,29 @@ class WebsiteSocialMediaAnalysisCrew:
 
     def _initialize_crewai_agents(self) -> None:
         """Initialize CrewAI agents for direct CrewAI workflow execution."""
-        # Create CrewAI tools from enhanced agent tools
-        crewai_tools = {}
+        # Create CrewAI tools from enhanced agent tools, grouped by owning agent
+        crewai_tools_by_agent: Dict[str, List[Any]] = defaultdict(list)
 
         for agent_name, agent in self.agents.items():
-            for tool_name, tool in agent.tools.items():
+            for tool in agent.tools.values():
                 if hasattr(tool, 'create_crewai_tool'):
-                    crewai_tool = tool.create_crewai_tool(tool.execute)
+                    # Reuse the wrapper the enhanced agent already created, if any
+                    crewai_tool = getattr(tool, 'crewai_tool', None) or tool.create_crewai_tool(tool.execute)
                     if crewai_tool:
-                        tool_key = f"{agent_name}_{tool_name}"
-                        crewai_tools[tool_key] = crewai_tool
+                        crewai_tools_by_agent[agent_name].append(crewai_tool)
 
         # Create CrewAI agents
+        crewai = _get_crewai()
         self.crewai_agents = {}
 
         for agent_name, agent_config in self.config['agents'].items():
             if agent_name != 'website_social_media_crew':
                 try:
                     # Get tools for this agent
-                    agent_tools = [
-                        tool for tool_name, tool in crewai_tools.items()
-                        if tool_name.startswith(agent_name)
-                    ]
+                    agent_tools = crewai_tools_by_agent.get(agent_name, [])
 
                     # Create CrewAI agent
-                    crewai_agent = Agent(
+                    crewai_agent = crewai.Agent(
                         role=agent_config['role'],
                         goal=agent_config['system_prompt'],
                         backstory=f"Specialized {agent_name} for podcast digital presence analysis",
@@ -113,113 +1184,256 @@ class WebsiteSocialMediaAnalysisCrew:
                     )
 
                     self.crewai_agents[agent_name] = crewai_agent
-                    self.logger.info(f"Initialized CrewAI agent for {agent_name}")
+                    self.logger.info("Initialized CrewAI agent for %s", agent_name)
 
                 except Exception as e:
-                    self.logger.error(f"Failed to initialize CrewAI agent for {agent_name}: {e}")
+                    self.logger.error("Failed to initialize CrewAI agent for %s: %s", agent_name, e)
+
+        # Freeze the crew's agent order once
+        missing = [name for name in _CREW_AGENT_ORDER if name not in self.crewai_agents]
+        if missing:
+            self.logger.error("Missing CrewAI agents for crew setup: %s", missing)
+        else:
+            self._agent_list = tuple(self.crewai_agents[name] for name in _CREW_AGENT_ORDER)
 
     def _setup_crew(self) -> None:
-        """Set up the main analysis crew."""
+        """Set up the main analysis crew.
+
+        The five analyst tasks are independent of each other and run with
+        ``async_execution`` so the sequential process starts them together. The
+        report task takes all of them as context, which makes it the join point.
+        """
         if not CREWAI_AVAILABLE:
             self.logger.warning("CrewAI not available, crew setup skipped")
             return
 
+        if self._agent_list is None:
+            self.logger.warning("CrewAI agents not available, crew setup skipped")
+            return
+
         try:
-            # Create tasks for each agent
-            tasks = []
-
-            # Website Analysis Task
-            website_task = Task(
-                description="Analyze website traffic, SEO performance, and technical health",
-                agent=self.crewai_agents['website_analyst'],
-                expected_output="Comprehensive website analysis report with recommendations"
-            )
-            tasks.append(website_task)
+            self.crew = self._build_crew(self._agent_list)
 
-            # Social Media Analysis Task
-            social_task = Task(
-                description="Analyze social media performance, engagement, and content effectiveness",
-                agent=self.crewai_agents['social_media_analyst'],
-                expected_output="Comprehensive social media analysis report with recommendations"
-            )
-            tasks.append(social_task)
+            self.logger.info("Website & Social Media Analysis Crew setup complete")
 
-            # Content Analysis Task
-            content_task = Task(
-                description="Analyze content performance across platforms and identify patterns",
-                agent=self.crewai_agents['content_analyst'],
-                expected_output="Comprehensive content analysis report with recommendations"
-            )
-            tasks.append(content_task)
+        except Exception as e:
+            self.logger.error("Failed to setup crew: %s", e)
 
-            # Traffic Analysis Task
-            traffic_task = Task(
-                description="Analyze traffic patterns, detect changes, and correlate with content",
-                agent=self.crewai_agents['traffic_analyst'],
-                expected_output="Comprehensive traffic analysis report with recommendations"
-            )
-            tasks.append(traffic_task)
+    @staticmethod
+    def _build_crew(agents: Tuple[Any, ...]) -> Any:
+        """Build the analysis crew for a set of CrewAI agents.
 
-            # SEO Analysis Task
-            seo_task = Task(
-                description="Conduct SEO audit, analyze keywords, and provide optimization recommendations",
-                agent=self.crewai_agents['seo_specialist'],
-                expected_output="Comprehensive SEO analysis report with recommendations"
-            )
-            tasks.append(seo_task)
+        Args:
+            agents: Agents in ``_CREW_AGENT_ORDER``
 
-            # Report Generation Task
-            report_task = Task(
-                description="Compile all analysis results and generate comprehensive report",
-                agent=self.crewai_agents['report_generator'],
-                expected_output="Final comprehensive evaluation report with actionable recommendations"
-            )
-            tasks.append(report_task)
-
-            # Create the crew
-            self.crew = Crew(
-                agents=list(self.crewai_agents.values()),
-                tasks=tasks,
-                process=Process.sequential,
-                verbose=True,
-                memory=True
+        Returns:
+            CrewAI crew running the analyst tasks concurrently, then the report task
+        """
+        crewai = _get_crewai()
+        *analyst_agents, report_agent = agents
+
+        # Analyst tasks run concurrently; hierarchical processes reject async tasks
+        analyst_tasks = [
+            crewai.Task(
+                description=description,
+                agent=agent,
+                expected_output=expected_output,
+                async_execution=True
             )
+            for agent, (_, description, expected_output) in zip(analyst_agents, _ANALYST_TASK_SPECS)
+        ]
+
+        # Report Generation Task, waiting on every analyst task
+        report_task = crewai.Task(
+            description="Compile all analysis results and generate comprehensive report",
+            agent=report_agent,
+            expected_output="Final comprehensive evaluation report with actionable recommendations",
+            context=analyst_tasks
+        )
+
+        return crewai.Crew(
+            agents=list(agents),
+            tasks=analyst_tasks + [report_task],
+            process=crewai.Process.sequential,
+            verbose=True,
+            memory=True
+        )
+
+    def run_comprehensive_analysis(
+        self, analysis_params: Dict[str, Any], bypass_cache: bool = False, as_json: bool = False
+    ) -> Union[Dict[str, Any], bytes]:
+        """Run comprehensive digital presence analysis.
 
-            self.logger.info("Website & Social Media Analysis Crew setup complete")
+        Synchronous wrapper around :meth:`run_comprehensive_analysis_async`; must not
+        be called from inside a running event loop.
 
-        except Exception as e:
-            self.logger.error(f"Failed to setup crew: {e}")
+        Args:
+            analysis_params: Parameters for the analysis including time periods, focus areas, etc.
+            bypass_cache: Run the crew even if a fresh cached result exists
+            as_json: Return the result as indented JSON bytes (see to_json_bytes)
 
-    def run_comprehensive_analysis(self, analysis_params: Dict[str, Any]) -> Dict[str, Any]:
-        """Run comprehensive digital presence analysis.
+        Returns:
+            Dictionary with comprehensive analysis results, or its JSON encoding
+        """
+        result = asyncio.run(self._run_comprehensive_analysis(analysis_params, bypass_cache))
+        return self.to_json_bytes(result) if as_json else _thaw(result)
+
+    def run_batch(self, params_list: List[Dict[str, Any]], max_workers: int = 8) -> List[Dict[str, Any]]:
+        """Run comprehensive analysis for several parameter sets concurrently.
+
+        Crew kickoffs spend most of their time waiting on LLM API calls, so a thread
+        pool lets those waits overlap. Keep ``max_workers`` within the provider's
+        concurrency limits.
+
+        Args:
+            params_list: Analysis parameters, one entry per analysis to run
+            max_workers: Maximum number of analyses running at the same time
+
+        Returns:
+            List of analysis results in the same order as ``params_list``
+        """
+        if not params_list:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(params_list))) as executor:
+            return list(executor.map(self.run_comprehensive_analysis, params_list))
+
+    async def run_comprehensive_analysis_async(
+        self, analysis_params: Dict[str, Any], bypass_cache: bool = False
+    ) -> Dict[str, Any]:
+        """Run comprehensive digital presence analysis without blocking the event loop.
+
+        The crew runs its analyst tasks concurrently (see :meth:`_setup_crew`), so the
+        analysis phase takes roughly as long as the slowest analyst rather than the
+        sum of all of them.
+
+        Successful results are cached per parameter set for a TTL that depends on
+        the analysis ``time_period`` (see ``_RESULT_TTL_SECONDS``).
 
         Args:
             analysis_params: Parameters for the analysis including time periods, focus areas, etc.
+            bypass_cache: Run the crew even if a fresh cached result exists
 
         Returns:
-            Dictionary with comprehensive analysis results
+            Dictionary with comprehensive analysis results, as plain dicts and lists
         """
+        return _thaw(await self._run_comprehensive_analysis(analysis_params, bypass_cache))
+
+    async def _run_comprehensive_analysis(
+        self, analysis_params: Dict[str, Any], bypass_cache: bool
+    ) -> Dict[str, Any]:
+        """Run or reuse a comprehensive analysis; the result may hold shared frozen data."""
         if not self.crew:
             return {"error": "Crew not available", "success": False}
 
+        cache_key = _cache_key(analysis_params)
+        if not bypass_cache:
+            cached = self._get_cached_result(cache_key, analysis_params)
+            if cached is not None:
+                return cached
+
+        # Coalesce concurrent requests for the same analysis onto a single crew run
+        with self._result_cache_lock:
+            inflight = self._inflight.get(cache_key)
+            is_owner = inflight is None
+            if is_owner:
+                inflight = self._inflight[cache_key] = Future()
+
+        if not is_owner:
+            return await asyncio.wrap_future(inflight)
+
+        try:
+            analysis_result = await self._execute_analysis(analysis_params, cache_key)
+            inflight.set_result(analysis_result)
+            return analysis_result
+        finally:
+            if not inflight.done():
+                inflight.cancel()
+            with self._result_cache_lock:
+                self._inflight.pop(cache_key, None)
+
+    async def _execute_analysis(self, analysis_params: Dict[str, Any], cache_key: str) -> Dict[str, Any]:
+        """Kick off the crew and structure its results."""
         try:
             # Execute the crew workflow
-            result = self.crew.kickoff(inputs=analysis_params)
+            result = await self._kickoff_with_backoff(analysis_params)
 
             # Process and structure the results
             structured_result = self._process_crew_results(result, analysis_params)
 
-            return {
+            analysis_result = {
                 "success": True,
                 "results": structured_result,
                 "analysis_period": analysis_params.get("time_period", "last_30_days"),
                 "timestamp": datetime.now().isoformat()
             }
+            self._store_result(cache_key, analysis_result)
+            return analysis_result
 
         except Exception as e:
-            self.logger.error(f"Comprehensive analysis failed: {e}")
+            self.logger.error("Comprehensive analysis failed: %s", e)
             return {"error": str(e), "success": False}
 
+    async def _kickoff_with_backoff(self, inputs: Dict[str, Any]) -> Any:
+        """Kick off the crew within the shared rate limit, retrying when rate limited.
+
+        Each attempt runs on a fresh copy of the crew: CrewAI crews and tasks keep
+        per-run state (task outputs, usage metrics, memory), so concurrent analyses
+        such as those started by :meth:`run_batch` must not share one instance.
+
+        Rate-limit errors are retried with jittered exponential backoff according to
+        ``_KICKOFF_RETRY_POLICY``; any other error is raised immediately.
+        """
+        policy = _KICKOFF_RETRY_POLICY
+
+        for attempt in range(policy.max_attempts):
+            wait = _KICKOFF_RATE_LIMITER.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            try:
+                return await self.crew.copy().kickoff_async(inputs=inputs)
+            except Exception as e:
+                if not _is_rate_limit_error(e) or attempt == policy.max_attempts - 1:
+                    raise
+
+                self.rate_limit_hits += 1
+                delay = min(
+                    policy.max_delay,
+                    policy.initial_delay * policy.backoff_factor ** attempt + random.uniform(0, 1)
+                )
+                self.logger.warning(
+                    "Crew kickoff rate limited (rate_limit_hits=%d), retrying in %.1fs",
+                    self.rate_limit_hits, delay
+                )
+                await asyncio.sleep(delay)
+
+    def _get_cached_result(self, cache_key: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return a cached analysis result if it is still within its TTL."""
+        ttl = _RESULT_TTL_SECONDS.get(
+            params.get("time_period", "last_30_days"), _DEFAULT_RESULT_TTL_SECONDS
+        )
+        with self._result_cache_lock:
+            entry = self._result_cache.get(cache_key)
+            if entry is None:
+                return None
+
+            stored_at, result = entry
+            if time.monotonic() - stored_at >= ttl:
+                del self._result_cache[cache_key]
+                return None
+
+            self._result_cache.move_to_end(cache_key)
+            return result
+
+    def _store_result(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """Cache an analysis result, evicting the least recently used entries."""
+        with self._result_cache_lock:
+            self._result_cache[cache_key] = (time.monotonic(), result)
+            self._result_cache.move_to_end(cache_key)
+            while len(self._result_cache) > _RESULT_CACHE_MAXSIZE:
+                self._result_cache.popitem(last=False)
+
     def _process_crew_results(self, raw_results: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Process raw crew results into structured format.
 
@@ -278,15 +1492,38 @@ class WebsiteSocialMediaAnalysisCrew:
 
         return structured_results
 
-    def run_enhanced_analysis(self, analysis_params: Dict[str, Any]) -> Dict[str, Any]:
+    def to_json_bytes(self, analysis_result: Dict[str, Any]) -> bytes:
+        """Serialize an analysis result to indented JSON bytes.
+
+        Sections that are shared sample constants are encoded once and reused,
+        so only the per-request parts of the report go through the encoder.
+
+        Args:
+            analysis_result: Result returned by one of the run_* methods
+
+        Returns:
+            UTF-8 encoded JSON, identical to _dumps_json output
+        """
+        return _encode_json_bytes(analysis_result)
+
+    def run_enhanced_analysis(
+        self, analysis_params: Dict[str, Any], as_json: bool = False
+    ) -> Union[Dict[str, Any], bytes]:
         """Run enhanced analysis using the enhanced base agent framework.
 
         Args:
             analysis_params: Parameters for the analysis
+            as_json: Return the result as indented JSON bytes (see to_json_bytes)
 
         Returns:
-            Dictionary with enhanced analysis results
+            Dictionary with enhanced analysis results as plain dicts and lists,
+            or its JSON encoding
         """
+        result = self._run_enhanced_analysis(analysis_params)
+        return self.to_json_bytes(result) if as_json else _thaw(result)
+
+    def _run_enhanced_analysis(self, analysis_params: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute the enhanced workflow and structure its results."""
         try:
             # Use the website_social_media_crew agent to orchestrate the workflow
             crew_agent = self.agents.get('website_social_media_crew')
@@ -314,7 +1551,7 @@ class WebsiteSocialMediaAnalysisCrew:
                 return workflow_result
 
         except Exception as e:
-            self.logger.error(f"Enhanced analysis failed: {e}")
+            self.logger.error("Enhanced analysis failed: %s", e)
             return {"error": str(e), "success": False}
 
     def _process_enhanced_results(self, workflow_result: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, Any]:
@@ -327,751 +1564,136 @@ class WebsiteSocialMediaAnalysisCrew:
         Returns:
             Structured results dictionary
         """
-        # Extract results from each framework
-        structured_results = {
-            "website_analysis": {},
-            "social_media_analysis": {},
-            "content_analysis": {},
-            "traffic_analysis": {},
-            "seo_analysis": {},
-            "recommendations": {},
-            "action_plan": {},
-            "framework_results": workflow_result.get("framework_results", {})
-        }
+        # Collect results from each agent, grouped by result section
+        sections: Dict[str, Any] = defaultdict(dict)
 
-        # Process each agent's results
         for step_key, step_result in workflow_result.get("results", {}).items():
-            if step_result.get("success"):
-                agent_action = step_key.split('.')
-                if len(agent_action) == 2:
-                    agent_name, action = agent_action
-                    result_data = step_result.get("result", {})
-
-                    if agent_name == "website_analyst":
-                        structured_results["website_analysis"][action] = result_data
-                    elif agent_name == "social_media_analyst":
-                        structured_results["social_media_analysis"][action] = result_data
-                    elif agent_name == "content_analyst":
-                        structured_results["content_analysis"][action] = result_data
-                    elif agent_name == "traffic_analyst":
-                        structured_results["traffic_analysis"][action] = result_data
-                    elif agent_name == "seo_specialist":
-                        structured_results["seo_analysis"][action] = result_data
-                    elif agent_name == "report_generator":
-                        if action == "generate_recommendations":
-                            structured_results["recommendations"] = result_data
-                        elif action == "create_implementation_roadmap":
-                            structured_results["action_plan"] = result_data
-
-        # Add any missing sections with sample data
-        if not structured_results["website_analysis"]:
-            structured_results["website_analysis"] = self._generate_sample_website_analysis(params)
-
-        if not structured_results["social_media_analysis"]:
-            structured_results["social_media_analysis"] = self._generate_sample_social_media_analysis(params)
-
-        if not structured_results["content_analysis"]:
-            structured_results["content_analysis"] = self._generate_sample_content_analysis(params)
-
-        if not structured_results["traffic_analysis"]:
-            structured_results["traffic_analysis"] = self._generate_sample_traffic_analysis(params)
-
-        if not structured_results["seo_analysis"]:
-            structured_results["seo_analysis"] = self._generate_sample_seo_analysis(params)
-
-        if not structured_results["recommendations"]:
-            structured_results["recommendations"] = self._generate_sample_recommendations(params)
-
-        if not structured_results["action_plan"]:
-            structured_results["action_plan"] = self._generate_sample_action_plan(params)
+            if not step_result.get("success"):
+                continue
+
+            agent_name, sep, action = step_key.partition('.')
+            if not sep or '.' in action:
+                continue
+
+            result_data = step_result.get("result", {})
+            if agent_name == "report_generator":
+                section = _REPORT_ACTION_TO_SECTION.get(action)
+                if section:
+                    sections[section] = result_data
+            else:
+                section = _AGENT_TO_SECTION.get(agent_name)
+                if section:
+                    sections[section][action] = result_data
+
+        # Fill any missing sections with sample data
+        structured_results: Dict[str, Any] = {}
+        for section, generator_name in self._SECTION_FALLBACKS.items():
+            structured_results[section] = sections.get(section) or getattr(self, generator_name)(params)
+        structured_results["framework_results"] = workflow_result.get("framework_results", {})
 
         return structured_results
 
-    # Sample data generation methods (would be replaced with real data in production)
+    # Sample data generation methods (would be replaced with real data in production).
+    # Results are shared between calls, so they are returned as read-only mappings.
 
-    def _generate_sample_traffic_metrics(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_sample_traffic_metrics(self, params: Dict[str, Any]) -> Mapping[str, Any]:
         """Generate sample traffic metrics."""
-        time_period = params.get("time_period", "last_30_days")
-        return {
-            "period": time_period,
-            "total_visits": 45287,
-            "unique_visitors": 32145,
-            "page_views": 128765,
-            "bounce_rate": 42.3,
-            "avg_session_duration": "3:45",
-            "traffic_sources": {
-                "organic": {"visits": 28765, "percentage": 63.5},
-                "social": {"visits": 12456, "percentage": 27.5},
-                "direct": {"visits": 3128, "percentage": 6.9},
-                "referral": {"visits": 938, "percentage": 2.1}
-            },
-            "device_distribution": {
-                "desktop": {"visits": 24321, "percentage": 53.7},
-                "mobile": {"visits": 18945, "percentage": 41.8},
-                "tablet": {"visits": 2021, "percentage": 4.5}
-            }
-        }
+        return _call_cached(_sample_traffic_metrics, _sample_data_key(params))
 
-    def _generate_sample_seo_performance(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_sample_seo_performance(self, params: Dict[str, Any]) -> Mapping[str, Any]:
         """Generate sample SEO performance data."""
-        return {
-            "top_keywords": [
-                {"keyword": "podcast name", "position": 3, "volume": 12500, "ctr": 8.2},
-                {"keyword": "podcast name episode 123", "position": 1, "volume": 8700, "ctr": 12.5},
-                {"keyword": "best comedy podcast", "position": 17, "volume": 6200, "ctr": 4.8}
-            ],
-            "organic_traffic_trend": "up_15_percent",
-            "backlink_profile": {
-                "total_backlinks": 428,
-                "referring_domains": 124,
-                "domain_authority": 47,
-                "toxic_links": 3
-            },
-            "technical_seo_score": 82
-        }
+        return _SEO_PERFORMANCE
 
-    def _generate_sample_technical_health(self) -> Dict[str, Any]:
+    def _generate_sample_technical_health(self) -> Mapping[str, Any]:
         """Generate sample technical health data."""
-        return {
-            "broken_links": 8,
-            "server_errors": 2,
-            "javascript_errors": 14,
-            "css_issues": 5,
-            "mobile_responsiveness_score": 92,
-            "page_speed_score": 78,
-            "security_issues": 1
-        }
+        return _TECHNICAL_HEALTH
 
-    def _generate_sample_social_performance(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_sample_social_performance(self, params: Dict[str, Any]) -> Mapping[str, Any]:
         """Generate sample social media performance data."""
-        return {
-            "platforms": {
-                "twitter": {
-                    "followers": 45287,
-                    "growth": 8.2,
-                    "engagement_rate": 4.7,
-                    "top_post": {"id": "12345", "engagement": 1245, "reach": 8765}
-                },
-                "instagram": {
-                    "followers": 87654,
-                    "growth": 12.4,
-                    "engagement_rate": 6.3,
-                    "top_post": {"id": "67890", "engagement": 2456, "reach": 15876}
-                },
-                "tiktok": {
-                    "followers": 124567,
-                    "growth": 18.7,
-                    "engagement_rate": 8.9,
-                    "top_post": {"id": "54321", "engagement": 4567, "reach": 28765}
-                },
-                "youtube": {
-                    "subscribers": 34567,
-                    "growth": 5.3,
-                    "views": 1245678,
-                    "top_video": {"id": "98765", "views": 45678, "engagement": 1234}
-                }
-            },
-            "content_types": {
-                "episodes": {"engagement_rate": 6.2, "average_views": 8765},
-                "shorts": {"engagement_rate": 12.4, "average_views": 15876},
-                "behind_scenes": {"engagement_rate": 8.7, "average_views": 9876},
-                "promotional": {"engagement_rate": 4.3, "average_views": 5432}
-            }
-        }
+        return _SOCIAL_PERFORMANCE
 
-    def _generate_sample_content_engagement(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_sample_content_engagement(self, params: Dict[str, Any]) -> Mapping[str, Any]:
         """Generate sample content engagement data."""
-        return {
-            "episode_engagement": {
-                "average_completion_rate": 72.4,
-                "average_shares": 45.2,
-                "average_comments": 18.7,
-                "top_episodes": [
-                    {"id": "123", "title": "Episode 123", "completion_rate": 89.2, "shares": 124, "comments": 45},
-                    {"id": "122", "title": "Episode 122", "completion_rate": 85.6, "shares": 98, "comments": 32}
-                ]
-            },
-            "short_form_engagement": {
-                "average_completion_rate": 85.3,
-                "average_shares": 67.8,
-                "average_comments": 24.1,
-                "conversion_to_full_episode": 12.4
-            },
-            "engagement_trends": {
-                "positive": 68.4,
-                "negative": 8.2,
-                "neutral": 23.4
-            }
-        }
+        return _CONTENT_ENGAGEMENT
 
-    def _generate_sample_audience_sentiment(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_sample_audience_sentiment(self, params: Dict[str, Any]) -> Mapping[str, Any]:
         """Generate sample audience sentiment data."""
-        return {
-            "overall_sentiment_score": 78.2,
-            "sentiment_distribution": {
-                "positive": 62.4,
-                "negative": 12.8,
-                "neutral": 24.8
-            },
-            "common_topics": [
-                {"topic": "funny moments", "sentiment": 89.2, "mentions": 452},
-                {"topic": "guest appearances", "sentiment": 78.6, "mentions": 321},
-                {"topic": "production quality", "sentiment": 85.3, "mentions": 287}
-            ],
-            "emerging_trends": [
-                "Request for more behind-the-scenes content",
-                "Interest in guest interviews",
-                "Positive response to new format changes"
-            ]
-        }
+        return _AUDIENCE_SENTIMENT
 
-    def _generate_sample_episode_performance(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_sample_episode_performance(self, params: Dict[str, Any]) -> Mapping[str, Any]:
         """Generate sample episode performance data."""
-        return {
-            "recent_episodes": [
-                {
-                    "id": "123",
-                    "title": "Episode 123: Special Guest",
-                    "release_date": "2024-03-15",
-                    "views": 45287,
-                    "listens": 32145,
-                    "completion_rate": 87.4,
-                    "shares": 1245,
-                    "comments": 452,
-                    "sentiment": 89.2
-                },
-                {
-                    "id": "122",
-                    "title": "Episode 122: Behind the Scenes",
-                    "release_date": "2024-03-08",
-                    "views": 38765,
-                    "listens": 28432,
-                    "completion_rate": 82.6,
-                    "shares": 987,
-                    "comments": 321,
-                    "sentiment": 85.6
-                }
-            ],
-            "performance_trends": {
-                "views_trend": "up_15_percent",
-                "engagement_trend": "up_8_percent",
-                "completion_trend": "stable"
-            },
-            "top_performing_episodes": [
-                {"id": "105", "title": "Episode 105: Viral Moments", "views": 124567, "engagement": 18.7},
-                {"id": "98", "title": "Episode 98: Guest Star", "views": 98765, "engagement": 16.4}
-            ]
-        }
+        return _EPISODE_PERFORMANCE
 
-    def _generate_sample_short_form_performance(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_sample_short_form_performance(self, params: Dict[str, Any]) -> Mapping[str, Any]:
         """Generate sample short form content performance data."""
-        return {
-            "platform_comparison": {
-                "tiktok": {
-                    "average_views": 15876,
-                    "engagement_rate": 12.4,
-                    "conversion_rate": 8.7,
-                    "top_performing": {"id": "short_45", "views": 45678, "engagement": 18.2}
-                },
-                "instagram_reels": {
-                    "average_views": 12456,
-                    "engagement_rate": 10.8,
-                    "conversion_rate": 6.3,
-                    "top_performing": {"id": "reel_32", "views": 38765, "engagement": 15.6}
-                },
-                "youtube_shorts": {
-                    "average_views": 9876,
-                    "engagement_rate": 9.2,
-                    "conversion_rate": 5.1,
-                    "top_performing": {"id": "short_18", "views": 24567, "engagement": 12.8}
-                }
-            },
-            "content_patterns": {
-                "best_performing_topics": ["funny moments", "guest reactions", "behind the scenes"],
-                "optimal_length": "45-60 seconds",
-                "best_posting_times": ["weekday evenings", "weekend mornings"],
-                "highest_conversion_topics": ["episode highlights", "guest teasers"]
-            }
-        }
+        return _SHORT_FORM_PERFORMANCE
 
-    def _generate_sample_content_patterns(self) -> Dict[str, Any]:
+    def _generate_sample_content_patterns(self) -> Mapping[str, Any]:
         """Generate sample content patterns data."""
-        return {
-            "high_performing_patterns": {
-                "topics": ["funny moments", "guest interviews", "behind the scenes"],
-                "formats": ["short clips", "highlight reels", "guest teasers"],
-                "length": "3-5 minutes for episodes, 45-60 seconds for shorts",
-                "posting_times": ["Tuesday-Thursday evenings", "Weekend mornings"],
-                "guest_types": ["comedians", "industry experts", "fan favorites"]
-            },
-            "emerging_patterns": {
-                "growing_topics": ["production insights", "guest reactions", "audience Q&A"],
-                "new_formats": ["interactive polls", "live reactions", "mini-documentaries"],
-                "trending_guests": ["up-and-coming comedians", "industry disruptors"]
-            },
-            "content_lifecycle": {
-                "initial_spike": "First 48 hours",
-                "sustained_performance": "7-14 days",
-                "evergreen_content": ["Best of compilations", "Guest highlights", "Topic deep dives"],
-                "resurgence_patterns": ["Related to current events", "Guest appearances elsewhere", "Algorithm changes"]
-            }
-        }
+        return _CONTENT_PATTERNS
 
-    def _generate_sample_traffic_patterns(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_sample_traffic_patterns(self, params: Dict[str, Any]) -> Mapping[str, Any]:
         """Generate sample traffic patterns data."""
-        return {
-            "daily_patterns": {
-                "peak_hours": ["18:00-21:00", "12:00-14:00"],
-                "low_hours": ["02:00-06:00"],
-                "weekday_vs_weekend": "Weekdays: 62%, Weekends: 38%"
-            },
-            "weekly_patterns": {
-                "highest_traffic_days": ["Tuesday", "Thursday", "Wednesday"],
-                "lowest_traffic_days": ["Sunday", "Saturday"],
-                "content_release_impact": "Episodes increase traffic by 45-60% on release days"
-            },
-            "seasonal_patterns": {
-                "quarterly_trends": {
-                    "Q1": {"traffic": "baseline", "growth": 5.2},
-                    "Q2": {"traffic": "peak", "growth": 12.8},
-                    "Q3": {"traffic": "stable", "growth": 7.4},
-                    "Q4": {"traffic": "holiday_spike", "growth": 18.7}
-                },
-                "holiday_impact": {
-                    "positive": ["New Year", "Summer", "Holiday Season"],
-                    "negative": ["Major sporting events", "Breaking news cycles"]
-                }
-            }
-        }
+        return _TRAFFIC_PATTERNS
 
-    def _generate_sample_traffic_changes(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_sample_traffic_changes(self, params: Dict[str, Any]) -> Mapping[str, Any]:
         """Generate sample traffic changes data."""
-        return {
-            "recent_changes": {
-                "positive_changes": [
-                    {
-                        "date_range": "2024-02-15 to 2024-02-22",
-                        "change": "+28.4%",
-                        "likely_cause": "Episode 123 viral moment",
-                        "sustained": True
-                    },
-                    {
-                        "date_range": "2024-01-08 to 2024-01-15",
-                        "change": "+15.2%",
-                        "likely_cause": "Social media campaign",
-                        "sustained": False
-                    }
-                ],
-                "negative_changes": [
-                    {
-                        "date_range": "2023-12-20 to 2023-12-27",
-                        "change": "-8.7%",
-                        "likely_cause": "Holiday season competition",
-                        "recovered": True
-                    }
-                ]
-            },
-            "anomaly_detection": {
-                "detected_anomalies": [
-                    {
-                        "date": "2024-03-03",
-                        "type": "traffic_spike",
-                        "magnitude": "+45.8%",
-                        "duration": "6 hours",
-                        "cause_identified": "Viral TikTok clip",
-                        "action_taken": "Amplified with paid promotion"
-                    }
-                ],
-                "false_positives": 2,
-                "detection_accuracy": 94.2
-            },
-            "correlation_analysis": {
-                "content_traffic_correlation": 0.87,
-                "social_media_correlation": 0.72,
-                "seo_correlation": 0.68,
-                "external_events_correlation": 0.45
-            }
-        }
+        return _TRAFFIC_CHANGES
 
-    def _generate_sample_traffic_sources(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_sample_traffic_sources(self, params: Dict[str, Any]) -> Mapping[str, Any]:
         """Generate sample traffic sources data."""
-        return {
-            "source_distribution": {
-                "organic_search": {"traffic": 28765, "percentage": 63.5, "trend": "up_5_percent"},
-                "social_media": {"traffic": 12456, "percentage": 27.5, "trend": "up_12_percent"},
-                "direct": {"traffic": 3128, "percentage": 6.9, "trend": "stable"},
-                "referral": {"traffic": 938, "percentage": 2.1, "trend": "down_3_percent"}
-            },
-            "social_media_breakdown": {
-                "twitter": {"traffic": 3456, "percentage": 27.7, "engagement": 4.2},
-                "instagram": {"traffic": 4231, "percentage": 33.9, "engagement": 6.8},
-                "tiktok": {"traffic": 3124, "percentage": 25.1, "engagement": 8.4},
-                "youtube": {"traffic": 1645, "percentage": 13.2, "engagement": 5.3}
-            },
-            "referral_sources": {
-                "top_sources": [
-                    {"source": "podcast_directory.com", "traffic": 452, "quality": 87},
-                    {"source": "comedyblog.net", "traffic": 234, "quality": 78},
-                    {"source": "entertainmentnews.org", "traffic": 156, "quality": 92}
-                ],
-                "quality_scores": {
-                    "high_quality": 62.4,
-                    "medium_quality": 28.7,
-                    "low_quality": 8.9
-                }
-            },
-            "conversion_rates": {
-                "organic_to_subscriber": 8.2,
-                "social_to_subscriber": 6.4,
-                "direct_to_subscriber": 12.8,
-                "referral_to_subscriber": 9.3
-            }
-        }
+        return _TRAFFIC_SOURCES
 
-    def _generate_sample_seo_audit(self) -> Dict[str, Any]:
+    def _generate_sample_seo_audit(self) -> Mapping[str, Any]:
         """Generate sample SEO audit data."""
-        return {
-            "technical_seo": {
-                "score": 82,
-                "issues": {
-                    "critical": 3,
-                    "high": 8,
-                    "medium": 15,
-                    "low": 22
-                },
-                "mobile_friendliness": 92,
-                "page_speed": 78,
-                "structured_data": 88
-            },
-            "on_page_seo": {
-                "score": 76,
-                "issues": {
-                    "missing_title_tags": 4,
-                    "duplicate_meta_descriptions": 8,
-                    "thin_content": 3,
-                    "missing_alt_text": 12
-                },
-                "content_quality": 85,
-                "internal_linking": 68
-            },
-            "off_page_seo": {
-                "score": 64,
-                "backlink_profile": {
-                    "total_backlinks": 428,
-                    "referring_domains": 124,
-                    "domain_authority": 47,
-                    "toxic_links": 3
-                },
-                "social_signals": 78
-            },
-            "competitive_analysis": {
-                "competitor_comparison": {
-                    "domain_authority": "above_average",
-                    "backlink_profile": "below_average",
-                    "content_quality": "above_average",
-                    "technical_seo": "average"
-                },
-                "opportunity_areas": [
-                    "Backlink building",
-                    "Content gap analysis",
-                    "Featured snippet optimization"
-                ]
-            }
-        }
+        return _SEO_AUDIT
 
-    def _generate_sample_keyword_analysis(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_sample_keyword_analysis(self, params: Dict[str, Any]) -> Mapping[str, Any]:
         """Generate sample keyword analysis data."""
-        return {
-            "current_keyword_performance": {
-                "total_keywords": 428,
-                "top_10_rankings": 124,
-                "top_50_rankings": 245,
-                "declining_keywords": 32,
-                "improving_keywords": 87
-            },
-            "keyword_opportunities": {
-                "high_potential": [
-                    {"keyword": "best comedy podcast 2024", "volume": 8700, "difficulty": "medium", "potential": "high"},
-                    {"keyword": "funny podcast recommendations", "volume": 6200, "difficulty": "low", "potential": "high"}
-                ],
-                "long_tail_opportunities": [
-                    {"keyword": "podcast with guest interviews", "volume": 3400, "difficulty": "low", "potential": "medium"},
-                    {"keyword": "behind the scenes comedy podcast", "volume": 2800, "difficulty": "low", "potential": "medium"}
-                ]
-            },
-            "competitor_keywords": {
-                "gap_analysis": {
-                    "missing_high_volume": 14,
-                    "missing_low_competition": 28,
-                    "overlap_with_competitors": 62
-                },
-                "top_competitor_keywords": [
-                    {"keyword": "top rated comedy podcast", "competitor": "competitor1", "our_rank": 18, "their_rank": 5},
-                    {"keyword": "funniest podcast episodes", "competitor": "competitor2", "our_rank": 24, "their_rank": 8}
-                ]
-            },
-            "keyword_recommendations": {
-                "priority_keywords": [
-                    "podcast name",
-                    "podcast name episode 123",
-                    "best comedy podcast",
-                    "funny podcast recommendations"
-                ],
-                "content_gap_keywords": [
-                    "podcast guest interviews",
-                    "comedy podcast behind the scenes",
-                    "how podcast is made"
-                ]
-            }
-        }
+        return _KEYWORD_ANALYSIS
 
-    def _generate_sample_on_page_seo(self) -> Dict[str, Any]:
+    def _generate_sample_on_page_seo(self) -> Mapping[str, Any]:
         """Generate sample on-page SEO data."""
-        return {
-            "title_tags": {
-                "optimized": 87.2,
-                "missing": 4.3,
-                "too_long": 8.5,
-                "duplicate": 2.1
-            },
-            "meta_descriptions": {
-                "optimized": 72.4,
-                "missing": 12.8,
-                "too_long": 14.8,
-                "duplicate": 5.3
-            },
-            "header_structure": {
-                "proper_h1_usage": 92.1,
-                "logical_hierarchy": 84.3,
-                "keyword_optimization": 76.5
-            },
-            "content_quality": {
-                "unique_content": 94.2,
-                "keyword_optimization": 81.4,
-                "readability": 87.6,
-                "content_length": 78.3
-            },
-            "internal_linking": {
-                "logical_structure": 68.4,
-                "anchor_text_optimization": 52.1,
-                "link_depth": 74.3
-            },
-            "image_optimization": {
-                "alt_text_usage": 62.4,
-                "file_size_optimization": 48.7,
-                "descriptive_filenames": 32.1
-            }
-        }
+        return _ON_PAGE_SEO
 
-    def _generate_sample_recommendations(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_sample_recommendations(self, params: Dict[str, Any]) -> Mapping[str, Any]:
         """Generate sample recommendations."""
-        return {
-            "quick_wins": [
-                {
-                    "recommendation": "Fix broken links (8 found)",
-                    "impact": "Improve user experience and SEO",
-                    "effort": "Low",
-                    "priority": "High"
-                },
-                {
-                    "recommendation": "Optimize meta descriptions for top 20 pages",
-                    "impact": "Increase click-through rate from search",
-                    "effort": "Medium",
-                    "priority": "High"
-                },
-                {
-                    "recommendation": "Implement proper alt text for all images",
-                    "impact": "Improve accessibility and SEO",
-                    "effort": "Medium",
-                    "priority": "Medium"
-                }
-            ],
-            "strategic_initiatives": [
-                {
-                    "recommendation": "Develop content around high-potential keywords",
-                    "impact": "Increase organic traffic and rankings",
-                    "effort": "High",
-                    "priority": "High",
-                    "keywords": ["best comedy podcast 2024", "funny podcast recommendations"]
-                },
-                {
-                    "recommendation": "Build high-quality backlinks from relevant sites",
-                    "impact": "Improve domain authority and search rankings",
-                    "effort": "High",
-                    "priority": "High"
-                },
-                {
-                    "recommendation": "Create more short-form content highlighting viral moments",
-                    "impact": "Increase social media engagement and reach",
-                    "effort": "Medium",
-                    "priority": "High"
-                }
-            ],
-            "long_term_improvements": [
-                {
-                    "recommendation": "Implement comprehensive content calendar with SEO optimization",
-                    "impact": "Sustainable organic traffic growth",
-                    "effort": "High",
-                    "priority": "Medium"
-                },
-                {
-                    "recommendation": "Develop guest appearance strategy with cross-promotion",
-                    "impact": "Expand audience reach and credibility",
-                    "effort": "High",
-                    "priority": "Medium"
-                },
-                {
-                    "recommendation": "Build out video content strategy beyond podcast episodes",
-                    "impact": "Diversify content and attract new audiences",
-                    "effort": "High",
-                    "priority": "Medium"
-                }
-            ],
-            "platform_specific": [
-                {
-                    "platform": "TikTok",
-                    "recommendation": "Increase posting frequency to 3-4 times per week",
-                    "current": "1-2 times per week",
-                    "potential_impact": "+25-35% engagement"
-                },
-                {
-                    "platform": "Instagram",
-                    "recommendation": "Implement Reels strategy with behind-the-scenes content",
-                    "current": "Static posts only",
-                    "potential_impact": "+40-50% reach"
-                },
-                {
-                    "platform": "YouTube",
-                    "recommendation": "Create dedicated shorts channel for viral moments",
-                    "current": "Occasional shorts on main channel",
-                    "potential_impact": "+30-40% subscriber growth"
-                }
-            ]
-        }
+        return _RECOMMENDATIONS
 
-    def _generate_sample_action_plan(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_sample_action_plan(self, params: Dict[str, Any]) -> Mapping[str, Any]:
         """Generate sample action plan."""
-        return {
-            "immediate_actions": [
-                {
-                    "action": "Fix all broken links",
-                    "responsible": "Web Development Team",
-                    "timeline": "1 week",
-                    "resources": "Developer time (4 hours)",
-                    "success_metrics": "Zero broken links, improved user experience"
-                },
-                {
-                    "action": "Optimize meta descriptions for top 20 pages",
-                    "responsible": "SEO Team",
-                    "timeline": "2 weeks",
-                    "resources": "SEO specialist (8 hours)",
-                    "success_metrics": "10-15% increase in CTR from search"
-                }
-            ],
-            "short_term_actions": [
-                {
-                    "action": "Develop and implement content calendar",
-                    "responsible": "Content Team",
-                    "timeline": "4 weeks",
-                    "resources": "Content strategist (12 hours), team coordination",
-                    "success_metrics": "Consistent posting schedule, improved engagement"
-                },
-                {
-                    "action": "Create 5 short-form videos from Episode 123 viral moments",
-                    "responsible": "Video Team",
-                    "timeline": "3 weeks",
-                    "resources": "Video editor (15 hours), social media coordinator",
-                    "success_metrics": "20-30% increase in social media engagement"
-                }
-            ],
-            "long_term_strategy": [
-                {
-                    "action": "Implement comprehensive SEO strategy",
-                    "responsible": "SEO Team",
-                    "timeline": "3 months",
-                    "resources": "SEO specialist (40 hours), content team support",
-                    "success_metrics": "25-35% increase in organic traffic"
-                },
-                {
-                    "action": "Develop guest appearance and cross-promotion strategy",
-                    "responsible": "Marketing Team",
-                    "timeline": "2 months",
-                    "resources": "Marketing coordinator (20 hours), outreach efforts",
-                    "success_metrics": "15-20% audience growth, increased credibility"
-                },
-                {
-                    "action": "Build out comprehensive video content strategy",
-                    "responsible": "Video Team",
-                    "timeline": "3 months",
-                    "resources": "Video team (60 hours), equipment if needed",
-                    "success_metrics": "20-30% increase in overall engagement"
-                }
-            ],
-            "monitoring_plan": {
-                "weekly_checkins": "Every Friday at 2 PM",
-                "monthly_reviews": "First Monday of each month",
-                "quarterly_strategy_sessions": "End of each quarter",
-                "success_metrics_review": "Bi-weekly"
-            },
-            "resource_allocation": {
-                "team_hours": {
-                    "web_development": 24,
-                    "seo": 68,
-                    "content": 45,
-                    "video": 92,
-                    "marketing": 32
-                },
-                "budget_requirements": {
-                    "tools_software": 1200,
-                    "outsourcing": 800,
-                    "promotion": 1500
-                },
-                "external_resources": {
-                    "seo_consultant": "Optional for complex issues",
-                    "video_production": "Optional for high-quality content"
-                }
-            }
-        }
+        return _ACTION_PLAN
 
-    def _generate_sample_website_analysis(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_sample_website_analysis(self, params: Dict[str, Any]) -> Mapping[str, Any]:
         """Generate sample website analysis data."""
-        return {
-            "traffic_metrics": self._generate_sample_traffic_metrics(params),
-            "seo_performance": self._generate_sample_seo_performance(params),
-            "technical_health": self._generate_sample_technical_health()
-        }
+        return _call_cached(_sample_website_analysis, _sample_data_key(params))
 
-    def _generate_sample_social_media_analysis(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_sample_social_media_analysis(self, params: Dict[str, Any]) -> Mapping[str, Any]:
         """Generate sample social media analysis data."""
-        return {
-            "platform_performance": self._generate_sample_social_performance(params),
-            "content_engagement": self._generate_sample_content_engagement(params),
-            "audience_sentiment": self._generate_sample_audience_sentiment(params)
-        }
+        return _SOCIAL_MEDIA_ANALYSIS
 
-    def _generate_sample_content_analysis(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_sample_content_analysis(self, params: Dict[str, Any]) -> Mapping[str, Any]:
         """Generate sample content analysis data."""
-        return {
-            "episode_performance": self._generate_sample_episode_performance(params),
-            "short_form_effectiveness": self._generate_sample_short_form_performance(params),
-            "content_patterns": self._generate_sample_content_patterns()
-        }
+        return _CONTENT_ANALYSIS
 
-    def _generate_sample_traffic_analysis(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_sample_traffic_analysis(self, params: Dict[str, Any]) -> Mapping[str, Any]:
         """Generate sample traffic analysis data."""
-        return {
-            "traffic_patterns": self._generate_sample_traffic_patterns(params),
-            "traffic_changes": self._generate_sample_traffic_changes(params),
-            "source_analysis": self._generate_sample_traffic_sources(params)
-        }
+        return _TRAFFIC_ANALYSIS
 
-    def _generate_sample_seo_analysis(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_sample_seo_analysis(self, params: Dict[str, Any]) -> Mapping[str, Any]:
         """Generate sample SEO analysis data."""
-        return {
-            "seo_audit": self._generate_sample_seo_audit(),
-            "keyword_analysis": self._generate_sample_keyword_analysis(params),
-            "on_page_evaluation": self._generate_sample_on_page_seo()
-        }
+        return _SEO_ANALYSIS
+
+
+# Example analysis parameters for the demo below
+_DEMO_PARAMS: Mapping[str, Any] = MappingProxyType({
+    "time_period": "last_90_days",
+    "focus_areas": ("website_performance", "social_media_engagement", "content_effectiveness"),
+    "platforms": ("twitter", "instagram", "tiktok", "youtube"),
+    "content_types": ("episodes", "shorts", "behind_scenes"),
+    "comparison_period": "previous_90_days"
+})
+
 
 # Example usage
 if __name__ == "__main__":
@@ -1080,23 +1702,14 @@ if __name__ == "__main__":
 
     # Create analysis crew
     crew = WebsiteSocialMediaAnalysisCrew()
-
-    # Example analysis parameters
-    analysis_params = {
-        "time_period": "last_90_days",
-        "focus_areas": ["website_performance", "social_media_engagement", "content_effectiveness"],
-        "platforms": ["twitter", "instagram", "tiktok", "youtube"],
-        "content_types": ["episodes", "shorts", "behind_scenes"],
-        "comparison_period": "previous_90_days"
-    }
+    analysis_params = dict(_DEMO_PARAMS)
 
     # Run comprehensive analysis
     if CREWAI_AVAILABLE:
-        results = crew.run_comprehensive_analysis(analysis_params)
-        print("Comprehensive Analysis Results:")
-        print(json.dumps(results, indent=2))
+        results = crew.run_comprehensive_analysis(analysis_params, as_json=True)
+        print("Comprehensive Analysis Results:", flush=True)
     else:
         # Fallback to enhanced analysis
-        results = crew.run_enhanced_analysis(analysis_params)
-        print("Enhanced Analysis Results:")
-        print(json.dumps(results, indent=2))
+        results = crew.run_enhanced_analysis(analysis_params, as_json=True)
+        print("Enhanced Analysis Results:", flush=True)
+    sys.stdout.buffer.write(results + b"\n")
@@ -17,9 +17,48 @@ from typing import Any, Dict, List, Optional, Callable
 from pathlib import Path
 from collections import defaultdict
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from agents.robust_tool import RobustTool, ToolResult
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+@lru_cache(maxsize=32)
+def _load_json_config_cached(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a JSON config file; ``mtime`` is only part of the cache key."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def load_json_config(config_path: str) -> Dict[str, Any]:
+    """Load a JSON configuration file, reusing the parsed result until it changes.
+
+    Parsed configs are cached on ``(path, mtime)`` so agents sharing one config file
+    only read and parse it once. The returned dict is shared and must not be mutated.
+
+    Args:
+        config_path: Path to the JSON configuration file
+
+    Returns:
+        Configuration dictionary
+
+    Raises:
+        FileNotFoundError: If config file doesn't exist
+        json.JSONDecodeError: If config file is invalid JSON
+    """
+    config_file = Path(config_path)
+    if not config_file.exists():
+        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+
+    resolved = config_file.resolve()
+    return _load_json_config_cached(str(resolved), resolved.stat().st_mtime)
+
 
 @dataclass
 class ConfidenceMetrics:
@@ -418,12 +457,7 @@ class BaseAgent(ABC):
             FileNotFoundError: If config file doesn't exist
             json.JSONDecodeError: If config file is invalid JSON
         """
-        config_file = Path(self.config_path)
-        if not config_file.exists():
-            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
-
-        with open(config_file, 'r') as f:
-            return json.load(f)
+        return load_json_config(self.config_path)
 
     @abstractmethod
     def _initialize_tools(self) -> Dict[str, AgentTool]:
@@ -742,12 +776,7 @@ class WorkflowOrchestrator:
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from agents_config.json."""
-        config_file = Path(self.config_path)
-        if not config_file.exists():
-            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
-
-        with open(config_file, 'r') as f:
-            return json.load(f)
+        return load_json_config(self.config_path)
 
     def get_agent(self, agent_name: str) -> BaseAgent:
         """Get or create an agent instance.
@@ -17,12 +17,28 @@ import os
 import json
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from agents.base_agent import BaseAgent
 from agents.robust_tool import RobustTool
 
 
+# Connection pool sizing for the shared MCP session; one pool per MCP host
+_HTTP_POOL_CONNECTIONS = 4
+_HTTP_POOL_MAXSIZE = 16
+
+
+def _create_http_session() -> requests.Session:
+    """Create a keep-alive session with a bounded connection pool."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=_HTTP_POOL_CONNECTIONS, pool_maxsize=_HTTP_POOL_MAXSIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Content-Type": "application/json"})
+    return session
+
+
 class ContentAutomationAgent(BaseAgent):
     """Content Automation Agent for cross-platform distribution and YouTube clip generation."""
     
@@ -36,6 +52,9 @@ class ContentAutomationAgent(BaseAgent):
         self.mcp_servers = self._load_mcp_servers()
         self.platform_configs = self._load_platform_configs()
         
+        # Shared session so MCP calls reuse TCP/TLS connections
+        self.http_session = _create_http_session()
+        
         # Initialize tools
         self.tools = {
             "content_distributor": RobustTool(
@@ -532,10 +551,9 @@ class ContentAutomationAgent(BaseAgent):
             }
             
             # Send request
-            response = requests.post(
+            response = self.http_session.post(
                 f"{mcp_server['url']}{endpoint}",
                 json=payload,
-                headers={"Content-Type": "application/json"},
                 timeout=30
             )
             
@@ -609,10 +627,9 @@ class ContentAutomationAgent(BaseAgent):
             }
             
             # Send to video processing MCP server
-            response = requests.post(
+            response = self.http_session.post(
                 f"{self.mcp_servers['video_processing']['url']}/api/analyze",
                 json=payload,
-                headers={"Content-Type": "application/json"},
                 timeout=60
             )
             
@@ -948,10 +965,9 @@ class ContentAutomationAgent(BaseAgent):
                 mcp_server = self.mcp_servers["video_processing"]
                 endpoint = "/api/analytics"
             
-            response = requests.post(
+            response = self.http_session.post(
                 f"{mcp_server['url']}{endpoint}",
                 json=payload,
-                headers={"Content-Type": "application/json"},
                 timeout=30
             )
             
@@ -969,6 +985,10 @@ class ContentAutomationAgent(BaseAgent):
                 "error": f"Tracking error: {str(e)}"
             }
     
+    def close(self) -> None:
+        """Close the shared HTTP session and release pooled connections."""
+        self.http_session.close()
+    
     def get_automation_status(self) -> Dict[str, Any]:
         """Get current automation system status."""
         return {
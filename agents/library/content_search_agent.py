@@ -14,18 +14,621 @@ The agent integrates with existing transcription, analysis, and video processing
 tools to provide deep, context-aware search capabilities.
 """
 
+import copy
+import heapq
 import json
-import os
+import logging
 import re
+import sys
+import threading
 import time
-from collections import defaultdict
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict, defaultdict, namedtuple
+from collections.abc import Sequence
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
 from agents.base_agent import AgentTool, BaseAgent
-from agents.robust_tool import RobustTool, ToolResult
+from agents.robust_tool import RobustTool, ToolResult, ValidationError
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+_TOKEN_RE = re.compile(r'\w+')
+
+# Distinct words whose candidate segments each TranscriptIndex remembers
+_MAX_CACHED_WORDS = 1024
+
+# Per-transcript Bloom filter over character trigrams: 4 KiB, three probes
+_BLOOM_GRAM = 3
+_BLOOM_BITS = 1 << 15
+
+def _bloom_bits(gram: str) -> Tuple[int, int, int]:
+    """Split one hash of gram into three bit positions in the Bloom filter."""
+    h = hash(gram)
+    return h & (_BLOOM_BITS - 1), (h >> 15) & (_BLOOM_BITS - 1), (h >> 30) & (_BLOOM_BITS - 1)
+
+class SegmentArray(Sequence):
+    """Parsed transcript segments stored as parallel arrays.
+
+    Start and end times live in contiguous ``array('d')`` buffers and texts in
+    one list, so scans touch a few compact objects instead of a dict per
+    segment. Indexing still yields the familiar segment dict, built on demand.
+    """
+
+    __slots__ = ('start_times', 'end_times', 'texts')
+
+    def __init__(self):
+        """Create an empty segment array."""
+        self.start_times = array('d')
+        self.end_times = array('d')
+        self.texts: List[str] = []
+
+    def append(self, start_time: float, end_time: float, text: str) -> None:
+        """Add a segment."""
+        self.start_times.append(start_time)
+        self.end_times.append(end_time)
+        self.texts.append(text)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        return {
+            'start_time': self.start_times[index],
+            'end_time': self.end_times[index],
+            'text': self.texts[index]
+        }
+
+class TranscriptIndex:
+    """Inverted index from lowercased tokens to the segments of one transcript."""
+
+    __slots__ = ('segments', 'lowered_texts', 'postings', '_vocabulary', '_token_starts', '_token_postings',
+                 '_word_candidates', '_start_times', '_end_times', '_time_ordered', '_bloom')
+
+    def __init__(self, segments: SegmentArray):
+        """Index the parsed segments of a transcript."""
+        self.segments = segments
+        self.lowered_texts = [text.lower() for text in segments.texts]
+
+        # When both segment time arrays are non-decreasing, time-range filters
+        # reduce to two binary searches
+        self._start_times = segments.start_times
+        self._end_times = segments.end_times
+        self._time_ordered = all(
+            times[i] <= times[i + 1]
+            for times in (self._start_times, self._end_times)
+            for i in range(len(times) - 1)
+        )
+
+        # A term can only occur in the transcript if all of its trigrams do, so
+        # most absent terms are ruled out without touching the postings
+        grams = set()
+        for text in self.lowered_texts:
+            grams.update(text[i:i + _BLOOM_GRAM] for i in range(len(text) - _BLOOM_GRAM + 1))
+        self._bloom = bytearray(_BLOOM_BITS // 8)
+        for gram in grams:
+            for bit in _bloom_bits(gram):
+                self._bloom[bit >> 3] |= 1 << (bit & 7)
+
+        postings: Dict[str, List[int]] = defaultdict(list)
+        for segment_id, text in enumerate(self.lowered_texts):
+            for token in set(_TOKEN_RE.findall(text)):
+                postings[token].append(segment_id)
+        self.postings = {token: array('I', ids) for token, ids in postings.items()}
+
+        # Tokens get integer ids and are laid out in one newline-separated string,
+        # so finding the tokens that contain a word is a C-level str.find scan
+        self._token_postings = list(self.postings.values())
+        self._token_starts = array('I')
+        offset = 0
+        for token in self.postings:
+            self._token_starts.append(offset)
+            offset += len(token) + 1
+        self._vocabulary = '\n'.join(self.postings)
+        self._word_candidates: Dict[str, frozenset] = {}
+
+    def may_contain(self, term: str) -> bool:
+        """Check whether term may occur in the transcript.
+
+        Args:
+            term: Search term, matched case-insensitively
+
+        Returns:
+            False only if the term is certainly absent; terms shorter than a
+            trigram always may occur
+        """
+        term = term.lower()
+        bloom = self._bloom
+        for i in range(len(term) - _BLOOM_GRAM + 1):
+            for bit in _bloom_bits(term[i:i + _BLOOM_GRAM]):
+                if not bloom[bit >> 3] & (1 << (bit & 7)):
+                    return False
+        return True
+
+    def candidates(self, term: str) -> Optional[Set[int]]:
+        """Get the segments that may contain term as a substring.
+
+        Every word in the term must occur inside some token of a matching segment,
+        so intersecting the postings of those tokens gives a superset of the
+        matches without scanning segment text.
+
+        Args:
+            term: Search term, matched case-insensitively
+
+        Returns:
+            Candidate segment ids, or None if the term has no word characters
+            and every segment has to be scanned
+        """
+        words = _TOKEN_RE.findall(term.lower())
+        if not words:
+            return None
+
+        candidates: Optional[Set[int]] = None
+        for word in words:
+            word_ids = self._candidates_for_word(word)
+            candidates = set(word_ids) if candidates is None else candidates & word_ids
+            if not candidates:
+                break
+        return candidates
+
+    def segments_in_range(self, start_time: float, end_time: float) -> Optional[range]:
+        """Get the ids of segments overlapping [start_time, end_time].
+
+        Args:
+            start_time: Range start in seconds
+            end_time: Range end in seconds
+
+        Returns:
+            Contiguous range of segment ids, or None if segments are not in time
+            order and each one has to be checked
+        """
+        if not self._time_ordered:
+            return None
+        first = bisect_left(self._end_times, start_time)
+        last = bisect_right(self._start_times, end_time)
+        return range(first, max(first, last))
+
+    def _candidates_for_word(self, word: str) -> frozenset:
+        """Get the segments with a token containing word, memoized per word."""
+        cached = self._word_candidates.get(word)
+        if cached is not None:
+            return cached
+
+        word_ids: Set[int] = set()
+        vocabulary = self._vocabulary
+        position = vocabulary.find(word)
+        while position != -1:
+            token_id = bisect_right(self._token_starts, position) - 1
+            word_ids.update(self._token_postings[token_id])
+            # Continue after this token; one hit per token is enough
+            next_token = token_id + 1
+            if next_token == len(self._token_starts):
+                break
+            position = vocabulary.find(word, self._token_starts[next_token])
+
+        if len(self._word_candidates) >= _MAX_CACHED_WORDS:
+            # Evict the oldest word to keep the memo bounded
+            self._word_candidates.pop(next(iter(self._word_candidates)), None)
+        cached = self._word_candidates[word] = frozenset(word_ids)
+        return cached
+
+_SEGMENT_RE = re.compile(r'\[([^\]\n]+)\](.*)')
+_CLOCK_RE = re.compile(r'\s*(?:(?:(\d+):)?(\d+):)?(\d+(?:\.\d+)?)\s*')
+
+logger = logging.getLogger(__name__)
+
+# Malformed transcript timestamps are reported once per process
+_malformed_timestamp_logged = False
+
+@lru_cache(maxsize=4096)
+def _parse_clock(time_str: str) -> Optional[float]:
+    """Convert an [[H:]M:]S time string to seconds, or None if it is malformed."""
+    clock = _CLOCK_RE.fullmatch(time_str)
+    if clock is None:
+        return None
+    hours, minutes, seconds = clock.groups()
+    return int(hours or 0) * 3600 + int(minutes or 0) * 60 + float(seconds)
+
+def _parse_transcript(transcript: str) -> SegmentArray:
+    """Parse transcript into segments with timestamps."""
+    global _malformed_timestamp_logged
+    segments = SegmentArray()
+
+    # One match per line: the first [timestamp] and the text after it
+    for match in _SEGMENT_RE.finditer(transcript):
+        start_time = _parse_clock(match.group(1))
+        if start_time is None:
+            if not _malformed_timestamp_logged:
+                _malformed_timestamp_logged = True
+                logger.warning("Skipping transcript segment with malformed timestamp %r", match.group(1))
+            continue
+
+        # Assume each segment is about 15 seconds
+        segments.append(start_time, start_time + 15.0, match.group(2).strip())
+
+    return segments
+
+def _parse_time(time_str: str) -> float:
+    """Convert time string to seconds; malformed times count as 0.0."""
+    seconds = _parse_clock(time_str) if isinstance(time_str, str) else None
+    return 0.0 if seconds is None else seconds
+
+@lru_cache(maxsize=128)
+def _build_matcher(terms: Tuple[str, ...]) -> re.Pattern:
+    """Compile lowercased search terms into one alternation for a single-pass scan."""
+    # Longest first so a term is never shadowed by one of its prefixes
+    return re.compile('|'.join(map(re.escape, sorted(terms, key=len, reverse=True))))
+
+@lru_cache(maxsize=128)
+def _build_automaton(terms: Tuple[str, ...]) -> Optional[Any]:
+    """Build an Aho-Corasick automaton reporting every lowercased term in one pass.
+
+    Returns None when pyahocorasick is not installed or a term is empty, in
+    which case callers fall back to plain substring checks.
+    """
+    if not AHOCORASICK_AVAILABLE or not terms or not all(terms):
+        return None
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+@lru_cache(maxsize=256)
+def _transcript_index(transcript: str) -> TranscriptIndex:
+    """Parse and index a transcript once; transcripts are immutable strings."""
+    return TranscriptIndex(_parse_transcript(transcript))
+
+class SegmentTimeline:
+    """Start and end times of an episode's segment records, for range lookups.
+
+    Segments in time order are bisected directly. Otherwise the ids are sorted
+    by start time and laid out as an implicit interval tree: the middle of
+    every id range is a node annotated with the latest end time below it.
+    """
+
+    __slots__ = ('start_times', 'end_times', 'ordered', '_last_first', '_by_start', '_max_end')
+
+    def __init__(self, segments: List[Dict[str, Any]]):
+        """Extract the times of segment records once."""
+        self.start_times = array('d', (segment['start_time'] for segment in segments))
+        self.end_times = array('d', (segment['end_time'] for segment in segments))
+        # First segment id of the previous lookup; successive queries usually
+        # move forward in time, so it bounds the next search
+        self._last_first = 0
+
+        # Bisecting is only exact when both time columns are non-decreasing and
+        # no segment ends before it starts
+        starts, ends = self.start_times, self.end_times
+        self.ordered = all(starts[i] <= ends[i] for i in range(len(starts))) and all(
+            times[i] <= times[i + 1] for times in (starts, ends) for i in range(len(times) - 1)
+        )
+        self._by_start: List[int] = []
+        self._max_end = array('d')
+        if not self.ordered:
+            self._build_tree()
+
+    def _build_tree(self) -> None:
+        """Sort segment ids by start time and annotate the implicit tree nodes."""
+        starts, ends = self.start_times, self.end_times
+        by_start = self._by_start = sorted(range(len(starts)), key=starts.__getitem__)
+        max_end = self._max_end = array('d', (ends[i] for i in by_start))
+
+        def annotate(lo: int, hi: int) -> float:
+            if lo >= hi:
+                return float('-inf')
+            mid = (lo + hi) // 2
+            max_end[mid] = max(max_end[mid], annotate(lo, mid), annotate(mid + 1, hi))
+            return max_end[mid]
+
+        annotate(0, len(by_start))
+
+    def overlapping(self, start_time: float, end_time: float) -> Sequence[int]:
+        """Get the ids of segments overlapping [start_time, end_time].
+
+        Args:
+            start_time: Window start in seconds
+            end_time: Window end in seconds
+
+        Returns:
+            Ascending segment ids: a contiguous range when the segments are in
+            time order, otherwise a list found through the interval tree
+        """
+        if not self.ordered:
+            return self._tree_overlapping(start_time, end_time)
+
+        # The previous first id is a lower bound whenever the segment before it
+        # ends before this window starts, and an upper bound otherwise
+        ends = self.end_times
+        last_first = min(self._last_first, len(ends))
+        if last_first and ends[last_first - 1] < start_time:
+            first = bisect_left(ends, start_time, last_first)
+        else:
+            first = bisect_left(ends, start_time, 0, last_first) if last_first else bisect_left(ends, start_time)
+        self._last_first = first
+        return range(first, bisect_right(self.start_times, end_time, first))
+
+    def _tree_overlapping(self, start_time: float, end_time: float) -> List[int]:
+        """Find overlapping segments of an unordered timeline via the interval tree."""
+        starts, ends = self.start_times, self.end_times
+        by_start, max_end = self._by_start, self._max_end
+        found = []
+        pending = [(0, len(by_start))]
+        while pending:
+            lo, hi = pending.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            # Nothing below this node ends late enough to overlap
+            if max_end[mid] < start_time:
+                continue
+            pending.append((lo, mid))
+            segment_id = by_start[mid]
+            # Later-starting subtrees only matter if this node starts in time
+            if starts[segment_id] <= end_time:
+                if ends[segment_id] >= start_time:
+                    found.append(segment_id)
+                pending.append((mid + 1, hi))
+        found.sort()
+        return found
+
+# Per-episode lists of records that loaded indexes freeze into tuples
+_INDEX_RECORD_KEYS = ('segments', 'jokes', 'scenes')
+
+def _freeze_index(index: Dict[str, Any]) -> Mapping[str, Any]:
+    """Make a loaded index read-only down to its episodes so one copy can be shared.
+
+    The index, its episodes and their record lists become read-only views and
+    tuples. The records stay dicts, and results copy the nested values they
+    hand out so callers never edit the shared index.
+    """
+    episodes = {
+        episode_id: MappingProxyType({
+            key: tuple(value) if key in _INDEX_RECORD_KEYS else value
+            for key, value in episode_data.items()
+        })
+        for episode_id, episode_data in index['episodes'].items()
+    }
+    return MappingProxyType({**index, 'episodes': MappingProxyType(episodes)})
+
+def _attach_timelines(index: Dict[str, Any]) -> Dict[str, Any]:
+    """Attach a SegmentTimeline to every episode of a loaded index, in place."""
+    for episode_data in index['episodes'].values():
+        episode_data['_timeline'] = SegmentTimeline(episode_data.get('segments', []))
+    return index
+
+def _episode_timeline(episode_data: Dict[str, Any]) -> SegmentTimeline:
+    """Get the timeline attached at load, building one for foreign episode data."""
+    timeline = episode_data.get('_timeline')
+    if timeline is None:
+        timeline = SegmentTimeline(episode_data.get('segments', []))
+    return timeline
+
+class ContextColumns:
+    """Per-segment context fields of an episode, extracted once into columns."""
+
+    __slots__ = ('texts_lower', 'people', 'locations', 'activities')
+
+    def __init__(self, segments: List[Dict[str, Any]]):
+        """Extract the fields context search scores on from segment records."""
+        contexts = [segment.get('context', {}) for segment in segments]
+        self.texts_lower = [segment['text'].lower() for segment in segments]
+        self.people = [frozenset(context.get('people', [])) for context in contexts]
+        self.locations = [context.get('location', '') for context in contexts]
+        self.activities = [context.get('activity', '') for context in contexts]
+
+def _attach_context_columns(index: Dict[str, Any]) -> Dict[str, Any]:
+    """Attach ContextColumns to every episode of a loaded context index, in place."""
+    for episode_data in index['episodes'].values():
+        episode_data['_columns'] = ContextColumns(episode_data.get('segments', []))
+    return index
+
+class SceneColumns:
+    """Lowercased location fields of an episode's scenes, extracted once."""
+
+    __slots__ = ('locations_lower', 'descriptions_lower', 'location_ids', 'timeline')
+
+    def __init__(self, scenes: List[Dict[str, Any]]):
+        """Lowercase the scene fields location search matches against."""
+        self.timeline = SegmentTimeline(scenes)
+        self.locations_lower = [scene.get('location', '').lower() for scene in scenes]
+        self.descriptions_lower = [scene.get('description', '').lower() for scene in scenes]
+
+        # Inverted map from each distinct location to the scenes filmed there
+        self.location_ids: Dict[str, List[int]] = defaultdict(list)
+        for scene_id, location in enumerate(self.locations_lower):
+            self.location_ids[location].append(scene_id)
+
+    def matching_ids(self, query_lower: str) -> List[int]:
+        """Get the scenes whose location or description contains query_lower.
+
+        Locations are checked once per distinct location rather than per
+        scene; only scenes not already matched by location scan descriptions.
+
+        Args:
+            query_lower: Lowercased location query
+
+        Returns:
+            Matching scene ids in scene order
+        """
+        scene_ids = set(self.location_ids.get(query_lower, ()))
+        for location, ids in self.location_ids.items():
+            if location != query_lower and query_lower in location:
+                scene_ids.update(ids)
+        scene_ids.update(
+            scene_id for scene_id, description in enumerate(self.descriptions_lower)
+            if scene_id not in scene_ids and query_lower in description
+        )
+        return sorted(scene_ids)
+
+def _attach_scene_columns(index: Dict[str, Any]) -> Dict[str, Any]:
+    """Attach SceneColumns to every episode of a loaded location index, in place."""
+    for episode_data in index['episodes'].values():
+        episode_data['_scene_columns'] = SceneColumns(episode_data.get('scenes', []))
+    return index
+
+class SegmentFeatures:
+    """Lowercased scoring features of an episode's segments for advanced search.
+
+    Topics, joke topics, people and locations each get their own bit space:
+    every distinct lowercased term of the field gets one bit, and each
+    segment's list becomes a bitmask over them, so a criterion is scored for
+    all segments with ANDs and popcounts on small ints. The postings map each
+    term to the segments it can score on.
+    """
+
+    __slots__ = ('term_bits', 'topic_masks', 'joke_topic_masks', 'people_masks', 'location_masks',
+                 'context_tokens', 'start_times', 'end_times', 'durations', 'postings')
+
+    def __init__(self, segments: List[Dict[str, Any]]):
+        """Extract the features advanced search scores on from segment records."""
+        self.term_bits: Dict[str, Dict[str, int]] = {
+            'topics': {}, 'joke_topics': {}, 'people': {}, 'locations': {}
+        }
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+        contexts = [segment.get('context', {}) for segment in segments]
+        self.topic_masks = [
+            self._mask('topics', segment.get('topics', []), i) for i, segment in enumerate(segments)
+        ]
+        # Joke topics only count on segments flagged as jokes
+        self.joke_topic_masks = [
+            self._mask('joke_topics', segment.get('joke_topics', []), i) if segment.get('joke', False) else 0
+            for i, segment in enumerate(segments)
+        ]
+        self.people_masks = [
+            self._mask('people', context.get('people', []), i) for i, context in enumerate(contexts)
+        ]
+        self.location_masks = [
+            self._mask('locations', (context.get('location', ''),), i) for i, context in enumerate(contexts)
+        ]
+        # Words of each segment's location and people, for free-text context queries
+        self.context_tokens = [
+            frozenset(_TOKEN_RE.findall(' '.join((context.get('location', ''), *context.get('people', []))).lower()))
+            for context in contexts
+        ]
+        self.start_times = [segment['start_time'] for segment in segments]
+        self.end_times = [segment['end_time'] for segment in segments]
+        self.durations = [segment['end_time'] - segment['start_time'] for segment in segments]
+
+    def candidates(self, terms_lower: Iterable[str]) -> List[int]:
+        """Get the ids of segments any of the given terms can score on, in order."""
+        segment_ids = set()
+        for term in terms_lower:
+            segment_ids.update(self.postings.get(term, ()))
+        return sorted(segment_ids)
+
+    def _mask(self, field: str, terms: Iterable[str], segment_id: int) -> int:
+        """Get the bitmask of a segment's terms, assigning bits to terms not seen yet."""
+        bits = self.term_bits[field]
+        mask = 0
+        for term in terms:
+            term = term.lower()
+            bit = bits.get(term)
+            if bit is None:
+                bit = bits[term] = 1 << len(bits)
+            mask |= bit
+            posting = self.postings[term]
+            if not posting or posting[-1] != segment_id:
+                posting.append(segment_id)
+        return mask
+
+    def query_masks(self, field: str, terms_lower: List[str]) -> List[Tuple[int, int]]:
+        """Group the query terms present in a field by how often they were given.
+
+        Args:
+            field: 'topics', 'joke_topics', 'people' or 'locations'
+            terms_lower: Lowercased query terms, repeats included
+
+        Returns:
+            (repeat count, bitmask) pairs; the number of query terms a segment
+            matches is the sum of count * popcount(segment mask & bitmask)
+        """
+        bits = self.term_bits[field]
+        masks: Dict[int, int] = defaultdict(int)
+        for term, count in Counter(terms_lower).items():
+            bit = bits.get(term)
+            if bit is not None:
+                masks[count] |= bit
+        return list(masks.items())
+
+# A scored segment of advanced search; the result dict is only built for the
+# hits that make the final top results
+SegmentHit = namedtuple('SegmentHit', ['score', 'episode_id', 'segment_id', 'hit_number', 'score_details'])
+
+def _attach_segment_features(index: Dict[str, Any]) -> Dict[str, Any]:
+    """Attach SegmentFeatures to every episode of a loaded comprehensive index, in place."""
+    for episode_data in index['episodes'].values():
+        episode_data['_features'] = SegmentFeatures(episode_data.get('segments', []))
+    return index
+
+class _ContextView(Sequence):
+    """Read-only view of the segments surrounding a search hit.
+
+    Holds only a reference to the shared segment list and the window bounds,
+    and builds context entries as it is iterated or indexed. Results expose
+    the materialized list, so they stay plain JSON data.
+    """
+
+    __slots__ = ('segments', 'current_index', 'start', 'stop')
+
+    def __init__(self, segments: SegmentArray, current_index: int, window_size: int):
+        """Describe the window of ``window_size`` segments on each side of a hit."""
+        window_size = max(0, window_size)
+        self.segments = segments
+        self.current_index = current_index
+        self.start = max(0, current_index - window_size)
+        self.stop = min(len(segments), current_index + window_size + 1)
+
+    def __len__(self) -> int:
+        return self.stop - self.start - 1
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(len(self))[position]]
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError('context index out of range')
+
+        index = self.start + position
+        placement = 'before'
+        if index >= self.current_index:
+            index += 1
+            placement = 'after'
+        segments = self.segments
+        return {
+            'position': placement,
+            'text': segments.texts[index],
+            'time': f"{segments.start_times[index]:.1f}-{segments.end_times[index]:.1f}"
+        }
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (_ContextView, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"_ContextView({list(self)!r})"
 
 class ContentSearchAgentTool(AgentTool):
     """Custom AgentTool that takes a RobustTool implementation."""
@@ -86,6 +689,196 @@ class ContentSearchAgent(BaseAgent):
             )
         }
 
+# Callers opt in to reusing results for identical queries against the same
+# index by passing a positive cache_ttl
+_RESULT_CACHE_MAXSIZE = 256
+_DEFAULT_CACHE_TTL = 0.0
+
+def _freeze_schema(schema: Any) -> Any:
+    """Make a validation schema read-only so one copy can serve every tool instance."""
+    if isinstance(schema, dict):
+        return MappingProxyType({key: _freeze_schema(value) for key, value in schema.items()})
+    if isinstance(schema, list):
+        return tuple(_freeze_schema(item) for item in schema)
+    return schema
+
+_CACHE_TTL_SCHEMA = {
+    'type': 'number',
+    'default': _DEFAULT_CACHE_TTL,
+    'minimum': 0,
+    'description': 'Seconds a cached result for identical parameters stays valid (0, the default, disables caching)'
+}
+
+def _cache_ttl(parameters: Mapping[str, Any]) -> float:
+    """Return the requested cache lifetime, rejecting values that are not seconds."""
+    ttl = parameters.get('cache_ttl', _DEFAULT_CACHE_TTL)
+    if isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or not ttl >= 0:
+        raise ValidationError(f"Parameter cache_ttl must be a non-negative number, got {ttl!r}")
+    return float(ttl)
+
+class SearchResultCache:
+    """Thread-safe LRU cache of search results keyed by tool, index and parameters.
+
+    Results are deep-copied on the way in and out, so callers never share
+    nested lists or dicts with the cache or with each other.
+    """
+
+    def __init__(self, maxsize: int = _RESULT_CACHE_MAXSIZE):
+        """Create an empty cache holding at most ``maxsize`` results."""
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[Tuple[str, int, str], Tuple[float, Any, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(tool_name: str, index: Any, parameters: Mapping[str, Any]) -> Tuple[str, int, str]:
+        """Normalize parameters into a hashable cache key."""
+        params = {name: value for name, value in parameters.items() if name != 'cache_ttl'}
+        return tool_name, id(index), json.dumps(params, sort_keys=True, default=str)
+
+    def get(self, tool_name: str, index: Any, parameters: Mapping[str, Any]) -> Optional[Any]:
+        """Return a copy of the fresh cached result for these parameters, if any."""
+        ttl = _cache_ttl(parameters)
+        if ttl <= 0:
+            return None
+
+        key = self._key(tool_name, index, parameters)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, _, result = entry
+            if time.monotonic() - stored_at >= ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(result)
+
+    def put(self, tool_name: str, index: Any, parameters: Mapping[str, Any], result: Any) -> Any:
+        """Cache a copy of a result for these parameters and return the original."""
+        if _cache_ttl(parameters) <= 0:
+            return result
+
+        key = self._key(tool_name, index, parameters)
+        stored = copy.deepcopy(result)
+        with self._lock:
+            # The entry keeps its index alive, so the id in its key cannot be reused
+            self._entries[key] = (time.monotonic(), index, stored)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def invalidate(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+
+_SEARCH_RESULTS = SearchResultCache()
+
+_RAW_BYTES_SCHEMA = {
+    'type': 'boolean',
+    'default': False,
+    'description': 'Return the result as UTF-8 JSON bytes instead of a dict'
+}
+
+def encode_search_result(result: Dict[str, Any]) -> bytes:
+    """Encode a search result as compact UTF-8 JSON, with orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(result)
+    return json.dumps(result, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _search_response(parameters: Mapping[str, Any], result: Dict[str, Any]) -> Any:
+    """Return result, encoded straight to bytes when the caller set raw_bytes."""
+    if parameters.get('raw_bytes', False):
+        return encode_search_result(result)
+    return result
+
+def _prepare_joke_index(joke_index: Dict[str, Any]) -> Dict[str, Any]:
+    """Prepare a loaded joke index for searching, in place.
+
+    Interns the titles, deliveries and topics repeated across joke hits and
+    attaches each joke's lowercased topics as a frozenset, so queries match
+    topics by set intersection instead of lowercasing per joke.
+    """
+    for episode_data in joke_index['episodes'].values():
+        if 'title' in episode_data:
+            episode_data['title'] = sys.intern(episode_data['title'])
+        for joke in episode_data.get('jokes', []):
+            if 'delivery' in joke:
+                joke['delivery'] = sys.intern(joke['delivery'])
+            if 'topics' in joke:
+                joke['topics'] = [sys.intern(topic) for topic in joke['topics']]
+            joke['_topics_lower'] = frozenset(topic.lower() for topic in joke.get('topics', []))
+    return joke_index
+
+# Query state of a topic search, resolved once per request rather than per episode
+TopicSearchPlan = namedtuple('TopicSearchPlan', ['lowered_terms', 'matcher', 'relevance_by_count', 'time_bounds'])
+
+def _plan_topic_search(search_terms: List[str], time_range: Optional[Dict[str, str]]) -> TopicSearchPlan:
+    """Lowercase the terms, build their matcher and parse the time range once."""
+    lowered_terms = [term.lower() for term in search_terms]
+    unique_terms = tuple(sorted(set(lowered_terms)))
+
+    # Relevance depends only on how many terms a segment matches, so score
+    # every possible count once instead of per hit
+    term_count = len(search_terms)
+    relevance_by_count = [found * 10 for found in range(term_count + 1)]
+    relevance_by_count[term_count] *= 1.5  # Bonus for matching all terms
+
+    time_bounds = None
+    if time_range:
+        time_bounds = (_parse_time(time_range.get('start_time', '00:00:00')),
+                       _parse_time(time_range.get('end_time', '23:59:59')))
+
+    return TopicSearchPlan(lowered_terms, _build_matcher(unique_terms), relevance_by_count, time_bounds)
+
+_TOPIC_SEARCH_SCHEMA = _freeze_schema({
+    'type': 'object',
+    'required': ['search_terms'],
+    'properties': {
+        'search_terms': {
+            'type': 'array',
+            'items': {'type': 'string'},
+            'description': 'Topics or keywords to search for'
+        },
+        'episode_ids': {
+            'type': 'array',
+            'items': {'type': 'string'},
+            'description': 'Specific episode IDs to search (optional)'
+        },
+        'time_range': {
+            'type': 'object',
+            'properties': {
+                'start_time': {'type': 'string', 'format': 'time'},
+                'end_time': {'type': 'string', 'format': 'time'}
+            },
+            'description': 'Time range to search within episodes'
+        },
+        'min_duration': {
+            'type': 'number',
+            'default': 10.0,
+            'description': 'Minimum duration for search results in seconds'
+        },
+        'max_results': {
+            'type': 'integer',
+            'default': 20,
+            'description': 'Maximum number of results to return'
+        },
+        'include_context': {
+            'type': 'boolean',
+            'default': True,
+            'description': 'Include surrounding context in results'
+        },
+        'context_window': {
+            'type': 'integer',
+            'default': 3,
+            'description': 'Number of sentences before/after to include as context'
+        },
+        'cache_ttl': _CACHE_TTL_SCHEMA,
+        'raw_bytes': _RAW_BYTES_SCHEMA
+    }
+})
+
 class TopicSearchTool(RobustTool):
     """Tool for searching content by topics and conversations."""
 
@@ -94,53 +887,12 @@ class TopicSearchTool(RobustTool):
             name="search_by_topic",
             description="Search episodes and transcripts for specific topics and conversations"
         )
+        self._search_index: Optional[Dict[str, Any]] = None
 
     def _define_validation_schema(self) -> Dict[str, Any]:
         """Define validation schema for topic search."""
-        return {
-            'type': 'object',
-            'required': ['search_terms'],
-            'properties': {
-                'search_terms': {
-                    'type': 'array',
-                    'items': {'type': 'string'},
-                    'description': 'Topics or keywords to search for'
-                },
-                'episode_ids': {
-                    'type': 'array',
-                    'items': {'type': 'string'},
-                    'description': 'Specific episode IDs to search (optional)'
-                },
-                'time_range': {
-                    'type': 'object',
-                    'properties': {
-                        'start_time': {'type': 'string', 'format': 'time'},
-                        'end_time': {'type': 'string', 'format': 'time'}
-                    },
-                    'description': 'Time range to search within episodes'
-                },
-                'min_duration': {
-                    'type': 'number',
-                    'default': 10.0,
-                    'description': 'Minimum duration for search results in seconds'
-                },
-                'max_results': {
-                    'type': 'integer',
-                    'default': 20,
-                    'description': 'Maximum number of results to return'
-                },
-                'include_context': {
-                    'type': 'boolean',
-                    'default': True,
-                    'description': 'Include surrounding context in results'
-                },
-                'context_window': {
-                    'type': 'integer',
-                    'default': 3,
-                    'description': 'Number of sentences before/after to include as context'
-                }
-            }
-        }
+        return _TOPIC_SEARCH_SCHEMA
+
 
     def _define_fallback_strategies(self) -> List[Dict[str, Any]]:
         """Define fallback strategies."""
@@ -165,6 +917,10 @@ class TopicSearchTool(RobustTool):
 
         # Load search index or create temporary one
         search_index = self._load_or_create_search_index()
+        cached = _SEARCH_RESULTS.get(self.name, search_index, parameters)
+        if cached is not None:
+            return cached
+        plan = _plan_topic_search(search_terms, time_range)
 
         results = []
         processed_episodes = 0
@@ -177,7 +933,7 @@ class TopicSearchTool(RobustTool):
             processed_episodes += 1
             episode_results = self._search_episode_for_topics(
                 episode_data, search_terms, time_range, min_duration,
-                include_context, context_window
+                include_context, context_window, plan
             )
 
             # Add episode info to each result
@@ -192,20 +948,30 @@ class TopicSearchTool(RobustTool):
             if len(results) >= max_results:
                 break
 
-        # Sort results by relevance
-        results.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
+        # Select the most relevant results without sorting every hit
+        top_results = heapq.nlargest(max_results, results, key=lambda x: x.get('relevance_score', 0))
 
-        return {
+        return _SEARCH_RESULTS.put(self.name, search_index, parameters, _search_response(parameters, {
             'search_terms': search_terms,
             'results_found': len(results),
             'episodes_searched': processed_episodes,
-            'results': results[:max_results],
+            'results': top_results,
             'search_type': 'topic_search',
             'timestamp': datetime.now().isoformat()
-        }
+        }))
 
     def _load_or_create_search_index(self) -> Dict[str, Any]:
-        """Load existing search index or create a temporary one."""
+        """Load existing search index or create a temporary one.
+
+        The temporary index is built once per tool instance, so searches do
+        not rebuild it or take a fresh ``last_updated`` stamp every call.
+        """
+        if self._search_index is None:
+            self._search_index = self._create_search_index()
+        return self._search_index
+
+    def _create_search_index(self) -> Dict[str, Any]:
+        """Create the temporary search index."""
         # In a real implementation, this would load from a persistent index
         # For now, we'll create a mock index structure
         return {
@@ -260,39 +1026,66 @@ class TopicSearchTool(RobustTool):
 
     def _search_episode_for_topics(self, episode_data: Dict[str, Any], search_terms: List[str],
                                  time_range: Optional[Dict[str, str]], min_duration: float,
-                                 include_context: bool, context_window: int) -> List[Dict[str, Any]]:
-        """Search a single episode for topics."""
+                                 include_context: bool, context_window: int,
+                                 plan: Optional[TopicSearchPlan] = None) -> List[Dict[str, Any]]:
+        """Search a single episode for topics.
+
+        ``plan`` is the request's TopicSearchPlan; it is built here when the
+        caller has not already done so.
+        """
         transcript = episode_data['transcript']
         results = []
+        if plan is None:
+            plan = _plan_topic_search(search_terms, time_range)
 
-        # Parse transcript into segments with timestamps
-        segments = self._parse_transcript_segments(transcript)
+        # Parsed segments and token postings are built once per transcript
+        index = _transcript_index(transcript)
+        segments = index.segments
 
-        # Search each segment
-        for i, segment in enumerate(segments):
-            segment_text = segment['text'].lower()
-            segment_start = segment['start_time']
-            segment_end = segment['end_time']
+        # Skip the episode outright when none of the terms can occur in it
+        if not any(map(index.may_contain, search_terms)):
+            return results
 
-            # Check time range filter
-            if time_range:
-                start_time = self._parse_time(time_range.get('start_time', '00:00:00'))
-                end_time = self._parse_time(time_range.get('end_time', '23:59:59'))
+        # Only segments sharing tokens with a search term can match it
+        candidate_ids: Optional[Set[int]] = set()
+        for term in search_terms:
+            term_ids = index.candidates(term)
+            if term_ids is None:
+                candidate_ids = None
+                break
+            candidate_ids |= term_ids
+        segment_ids = range(len(segments)) if candidate_ids is None else sorted(candidate_ids)
+
+        if time_range:
+            start_time, end_time = plan.time_bounds
+            in_range = index.segments_in_range(start_time, end_time)
+            if in_range is not None:
+                segment_ids = (
+                    in_range if candidate_ids is None
+                    else [i for i in segment_ids if in_range.start <= i < in_range.stop]
+                )
+
+        lowered_terms = plan.lowered_terms
+        matcher = plan.matcher
+        relevance_by_count = plan.relevance_by_count
+
+        # Search each candidate segment
+        for i in segment_ids:
+            segment_text = index.lowered_texts[i]
+            segment_start = segments.start_times[i]
+            segment_end = segments.end_times[i]
 
-                if segment_end < start_time or segment_start > end_time:
-                    continue
+            # Check time range filter
+            if time_range and (segment_end < start_time or segment_start > end_time):
+                continue
 
-            # Check if segment contains any search terms
-            found_terms = []
-            for term in search_terms:
-                if term.lower() in segment_text:
-                    found_terms.append(term)
+            # One scan rules out segments without any term before checking each one
+            if not matcher.search(segment_text):
+                continue
+            found_terms = [term for term, lowered in zip(search_terms, lowered_terms) if lowered in segment_text]
 
             if found_terms:
-                # Calculate relevance score
-                relevance_score = len(found_terms) * 10
-                if len(found_terms) == len(search_terms):
-                    relevance_score *= 1.5  # Bonus for matching all terms
+                relevance_score = relevance_by_count[len(found_terms)]
 
                 # Get context if requested
                 context = []
@@ -304,7 +1097,7 @@ class TopicSearchTool(RobustTool):
                     'start_time': segment_start,
                     'end_time': segment_end,
                     'duration': segment_end - segment_start,
-                    'text': segment['text'],
+                    'text': segments.texts[i],
                     'found_terms': found_terms,
                     'relevance_score': relevance_score,
                     'context': context
@@ -314,72 +1107,14 @@ class TopicSearchTool(RobustTool):
 
         return results
 
-    def _parse_transcript_segments(self, transcript: str) -> List[Dict[str, Any]]:
+    def _parse_transcript_segments(self, transcript: str) -> SegmentArray:
         """Parse transcript into segments with timestamps."""
-        segments = []
-        lines = transcript.split('\n')
-
-        for line in lines:
-            if '[' in line and ']' in line:
-                # Extract timestamp and text
-                timestamp_match = re.search(r'\[([^\]]+)\]', line)
-                if timestamp_match:
-                    timestamp = timestamp_match.group(1)
-                    text = line[timestamp_match.end():].strip()
-
-                    # Parse timestamp
-                    try:
-                        start_time = self._parse_time(timestamp)
-                        # Assume each segment is about 15 seconds
-                        end_time = start_time + 15.0
-
-                        segments.append({
-                            'start_time': start_time,
-                            'end_time': end_time,
-                            'text': text
-                        })
-                    except:
-                        continue
-
-        return segments
-
-    def _parse_time(self, time_str: str) -> float:
-        """Convert time string to seconds."""
-        try:
-            parts = time_str.split(':')
-            if len(parts) == 3:
-                return float(parts[0]) * 3600 + float(parts[1]) * 60 + float(parts[2])
-            elif len(parts) == 2:
-                return float(parts[0]) * 60 + float(parts[1])
-            else:
-                return float(parts[0])
-        except:
-            return 0.0
+        return _transcript_index(transcript).segments
 
-    def _get_context_segments(self, segments: List[Dict[str, Any]], current_index: int,
+    def _get_context_segments(self, segments: SegmentArray, current_index: int,
                              window_size: int) -> List[Dict[str, Any]]:
-        """Get context segments around the current segment."""
-        context = []
-
-        # Get previous segments
-        start_index = max(0, current_index - window_size)
-        for i in range(start_index, current_index):
-            context.append({
-                'position': 'before',
-                'text': segments[i]['text'],
-                'time': f"{segments[i]['start_time']:.1f}-{segments[i]['end_time']:.1f}"
-            })
-
-        # Get next segments
-        end_index = min(len(segments), current_index + window_size + 1)
-        for i in range(current_index + 1, end_index):
-            context.append({
-                'position': 'after',
-                'text': segments[i]['text'],
-                'time': f"{segments[i]['start_time']:.1f}-{segments[i]['end_time']:.1f}"
-            })
-
-        return context
+        """Get the context segments around the current segment."""
+        return list(_ContextView(segments, current_index, window_size))
 
     def _fallback_basic_search(self, error: Exception, parameters: Dict[str, Any], execution_id: str) -> ToolResult:
         """Fallback to basic text search."""
@@ -414,6 +1149,101 @@ class TopicSearchTool(RobustTool):
             execution_id=execution_id
         )
 
+@lru_cache(maxsize=1)
+def _joke_index() -> Mapping[str, Any]:
+    """Joke index shared by every tool instance, built on first use."""
+    return _freeze_index(_prepare_joke_index({
+        'episodes': {
+            'ep002': {
+                'title': 'Comedy Night Live',
+                'jokes': [
+                    {
+                        'start_time': 30.0,
+                        'end_time': 45.0,
+                        'text': "Why don't scientists trust atoms? Because they make up everything!",
+                        'topics': ['science', 'atoms'],
+                        'type': 'one-liner',
+                        'laughter_score': 0.87,
+                        'setup': "Let's start with some science jokes",
+                        'delivery': 'Jared'
+                    },
+                    {
+                        'start_time': 120.0,
+                        'end_time': 135.0,
+                        'text': "Why did the scarecrow win an award? Because he was outstanding in his field!",
+                        'topics': ['farming', 'awards'],
+                        'type': 'pun',
+                        'laughter_score': 0.92,
+                        'setup': "Here's a farming joke for you",
+                        'delivery': 'Sarah'
+                    },
+                    {
+                        'start_time': 210.0,
+                        'end_time': 225.0,
+                        'text': "Why was the computer cold? It left its Windows open!",
+                        'topics': ['technology', 'computers'],
+                        'type': 'tech',
+                        'laughter_score': 0.78,
+                        'setup': "Let's talk about technology jokes",
+                        'delivery': 'Jared'
+                    }
+                ]
+            }
+        },
+        'index_type': 'joke_index',
+        'last_updated': datetime.now().isoformat()
+    }))
+
+_JOKE_SEARCH_SCHEMA = _freeze_schema({
+    'type': 'object',
+    'required': ['topics'],
+    'properties': {
+        'topics': {
+            'type': 'array',
+            'items': {'type': 'string'},
+            'description': 'Topics to search jokes about'
+        },
+        'joke_types': {
+            'type': 'array',
+            'items': {
+                'type': 'string',
+                'enum': ['puns', 'one-liners', 'stories', 'observational', 'all']
+            },
+            'default': ['all'],
+            'description': 'Types of jokes to search for'
+        },
+        'min_laughter': {
+            'type': 'number',
+            'default': 0.5,
+            'minimum': 0,
+            'maximum': 1,
+            'description': 'Minimum laughter confidence score'
+        },
+        'episode_ids': {
+            'type': 'array',
+            'items': {'type': 'string'},
+            'description': 'Specific episode IDs to search'
+        },
+        'max_results': {
+            'type': 'integer',
+            'default': 15,
+            'description': 'Maximum number of joke results to return'
+        },
+        'include_setup': {
+            'type': 'boolean',
+            'default': True,
+            'description': 'Include joke setup/context in results'
+        },
+        'compact_strings': {
+            'type': 'boolean',
+            'default': False,
+            'description': 'Reference repeated titles, deliveries and topics by index into a shared dictionary'
+        },
+        'cache_ttl': _CACHE_TTL_SCHEMA,
+        'raw_bytes': _RAW_BYTES_SCHEMA
+    }
+})
+
 class JokeSearchTool(RobustTool):
     """Tool for searching jokes and humorous content."""
 
@@ -425,48 +1255,8 @@ class JokeSearchTool(RobustTool):
 
     def _define_validation_schema(self) -> Dict[str, Any]:
         """Define validation schema for joke search."""
-        return {
-            'type': 'object',
-            'required': ['topics'],
-            'properties': {
-                'topics': {
-                    'type': 'array',
-                    'items': {'type': 'string'},
-                    'description': 'Topics to search jokes about'
-                },
-                'joke_types': {
-                    'type': 'array',
-                    'items': {
-                        'type': 'string',
-                        'enum': ['puns', 'one-liners', 'stories', 'observational', 'all']
-                    },
-                    'default': ['all'],
-                    'description': 'Types of jokes to search for'
-                },
-                'min_laughter': {
-                    'type': 'number',
-                    'default': 0.5,
-                    'minimum': 0,
-                    'maximum': 1,
-                    'description': 'Minimum laughter confidence score'
-                },
-                'episode_ids': {
-                    'type': 'array',
-                    'items': {'type': 'string'},
-                    'description': 'Specific episode IDs to search'
-                },
-                'max_results': {
-                    'type': 'integer',
-                    'default': 15,
-                    'description': 'Maximum number of joke results to return'
-                },
-                'include_setup': {
-                    'type': 'boolean',
-                    'default': True,
-                    'description': 'Include joke setup/context in results'
-                }
-            }
-        }
+        return _JOKE_SEARCH_SCHEMA
+
 
     def _define_fallback_strategies(self) -> List[Dict[str, Any]]:
         """Define fallback strategies."""
@@ -480,9 +1270,13 @@ class JokeSearchTool(RobustTool):
         episode_ids = parameters.get('episode_ids', [])
         max_results = parameters.get('max_results', 15)
         include_setup = parameters.get('include_setup', True)
+        compact_strings = parameters.get('compact_strings', False)
 
         # Load joke index
         joke_index = self._load_joke_index()
+        cached = _SEARCH_RESULTS.get(self.name, joke_index, parameters)
+        if cached is not None:
+            return cached
 
         results = []
         processed_episodes = 0
@@ -508,62 +1302,57 @@ class JokeSearchTool(RobustTool):
             if len(results) >= max_results:
                 break
 
-        # Sort by laughter score
-        results.sort(key=lambda x: x.get('laughter_score', 0), reverse=True)
+        # Select the highest laughter scores without sorting every hit
+        top_results = heapq.nlargest(max_results, results, key=lambda x: x.get('laughter_score', 0))
 
-        return {
+        response = {
             'topics': topics,
             'joke_types': joke_types,
             'results_found': len(results),
             'episodes_searched': processed_episodes,
-            'results': results[:max_results],
+            'results': top_results,
             'search_type': 'joke_search',
             'timestamp': datetime.now().isoformat()
         }
-
-    def _load_joke_index(self) -> Dict[str, Any]:
+        if compact_strings:
+            response['results'], response['dictionary'] = self._compact_results(response['results'])
+
+        return _SEARCH_RESULTS.put(self.name, joke_index, parameters, _search_response(parameters, response))
+
+    def _compact_results(self, results: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Replace repeated strings in joke results with indexes into a shared table.
+
+        Args:
+            results: Joke results as built by _search_episode_for_jokes
+
+        Returns:
+            Results with episode_ref, delivery_ref and topic_refs in place of
+            episode_title, delivery and topics, and the table they index
+        """
+        dictionary: List[str] = []
+        refs: Dict[str, int] = {}
+
+        def ref(value: str) -> int:
+            if value not in refs:
+                refs[value] = len(dictionary)
+                dictionary.append(value)
+            return refs[value]
+
+        compacted = []
+        for result in results:
+            result = dict(result)
+            if 'episode_title' in result:
+                result['episode_ref'] = ref(result.pop('episode_title'))
+            result['delivery_ref'] = ref(result.pop('delivery'))
+            result['topic_refs'] = [ref(topic) for topic in result.pop('topics')]
+            compacted.append(result)
+
+        return compacted, dictionary
+
+    def _load_joke_index(self) -> Mapping[str, Any]:
         """Load joke index."""
-        return {
-            'episodes': {
-                'ep002': {
-                    'title': 'Comedy Night Live',
-                    'jokes': [
-                        {
-                            'start_time': 30.0,
-                            'end_time': 45.0,
-                            'text': "Why don't scientists trust atoms? Because they make up everything!",
-                            'topics': ['science', 'atoms'],
-                            'type': 'one-liner',
-                            'laughter_score': 0.87,
-                            'setup': "Let's start with some science jokes",
-                            'delivery': 'Jared'
-                        },
-                        {
-                            'start_time': 120.0,
-                            'end_time': 135.0,
-                            'text': "Why did the scarecrow win an award? Because he was outstanding in his field!",
-                            'topics': ['farming', 'awards'],
-                            'type': 'pun',
-                            'laughter_score': 0.92,
-                            'setup': "Here's a farming joke for you",
-                            'delivery': 'Sarah'
-                        },
-                        {
-                            'start_time': 210.0,
-                            'end_time': 225.0,
-                            'text': "Why was the computer cold? It left its Windows open!",
-                            'topics': ['technology', 'computers'],
-                            'type': 'tech',
-                            'laughter_score': 0.78,
-                            'setup': "Let's talk about technology jokes",
-                            'delivery': 'Jared'
-                        }
-                    ]
-                }
-            },
-            'index_type': 'joke_index',
-            'last_updated': datetime.now().isoformat()
-        }
+        return _joke_index()
+
 
     def _search_episode_for_jokes(self, episode_data: Dict[str, Any], topics: List[str],
                                  joke_types: List[str], min_laughter: float,
@@ -571,15 +1360,21 @@ class JokeSearchTool(RobustTool):
         """Search a single episode for jokes."""
         jokes = episode_data.get('jokes', [])
         results = []
+        topics_lower = frozenset(topic.lower() for topic in topics)
+        wanted_types = set(joke_types)
+        all_types = 'all' in wanted_types
 
         for joke in jokes:
             # Check if joke matches topics
             joke_topics = joke.get('topics', [])
-            topic_match = any(topic.lower() in [jt.lower() for jt in joke_topics] for topic in topics)
+            joke_topics_lower = joke.get('_topics_lower')
+            if joke_topics_lower is None:
+                joke_topics_lower = frozenset(jt.lower() for jt in joke_topics)
+            topic_match = not topics_lower.isdisjoint(joke_topics_lower)
 
             # Check joke type
             joke_type = joke.get('type', 'all')
-            type_match = joke_type in joke_types or 'all' in joke_types
+            type_match = all_types or joke_type in wanted_types
 
             # Check laughter score
             laughter_match = joke.get('laughter_score', 0) >= min_laughter
@@ -591,7 +1386,7 @@ class JokeSearchTool(RobustTool):
                     'end_time': joke['end_time'],
                     'duration': joke['end_time'] - joke['start_time'],
                     'text': joke['text'],
-                    'topics': joke_topics,
+                    'topics': list(joke_topics),
                     'type': joke_type,
                     'laughter_score': joke['laughter_score'],
                     'delivery': joke.get('delivery', 'unknown')
@@ -604,6 +1399,102 @@ class JokeSearchTool(RobustTool):
 
         return results
 
+_CONTEXT_PERSON_PATTERNS = ('jared', 'sarah', 'host', 'guest')
+_CONTEXT_LOCATION_PATTERNS = ('stage', 'studio', 'audience', 'backstage')
+
+# Every phrase the context parser recognizes. None is a prefix of another, so a
+# lookahead alternation reports each occurrence, overlapping ones included, in
+# one pass over the query
+_CONTEXT_PHRASE_RE = re.compile('(?=(%s))' % '|'.join(map(re.escape, sorted(
+    {*_CONTEXT_PERSON_PATTERNS, *_CONTEXT_LOCATION_PATTERNS, 'live', 'on stage', 'performing'},
+    key=len, reverse=True
+))))
+
+@lru_cache(maxsize=1)
+def _context_index() -> Mapping[str, Any]:
+    """Context index shared by every tool instance, built on first use."""
+    return _freeze_index(_attach_context_columns(_attach_timelines({
+        'episodes': {
+            'ep002': {
+                'title': 'Comedy Night Live',
+                'segments': [
+                    {
+                        'start_time': 0.0,
+                        'end_time': 60.0,
+                        'text': "Jared: Welcome to comedy night! Let's start with some jokes.",
+                        'context': {
+                            'location': 'stage',
+                            'people': ['Jared'],
+                            'activity': 'introduction',
+                            'audience': 'live'
+                        }
+                    },
+                    {
+                        'start_time': 60.0,
+                        'end_time': 120.0,
+                        'text': "Jared: Why don't scientists trust atoms? Because they make up everything!",
+                        'context': {
+                            'location': 'stage',
+                            'people': ['Jared'],
+                            'activity': 'joke_telling',
+                            'audience': 'live',
+                            'audience_reaction': 'laughter'
+                        }
+                    },
+                    {
+                        'start_time': 180.0,
+                        'end_time': 240.0,
+                        'text': "Sarah: Here's a farming joke for you. Why did the scarecrow win an award?",
+                        'context': {
+                            'location': 'stage',
+                            'people': ['Sarah'],
+                            'activity': 'joke_telling',
+                            'audience': 'live'
+                        }
+                    }
+                ]
+            }
+        },
+        'index_type': 'context_index',
+        'last_updated': datetime.now().isoformat()
+    })))
+
+_CONTEXT_SEARCH_SCHEMA = _freeze_schema({
+    'type': 'object',
+    'required': ['context_query'],
+    'properties': {
+        'context_query': {
+            'type': 'string',
+            'description': 'Context to search for (e.g., "Jared live on stage")'
+        },
+        'episode_ids': {
+            'type': 'array',
+            'items': {'type': 'string'},
+            'description': 'Specific episode IDs to search'
+        },
+        'time_range': {
+            'type': 'object',
+            'properties': {
+                'start_time': {'type': 'string', 'format': 'time'},
+                'end_time': {'type': 'string', 'format': 'time'}
+            },
+            'description': 'Time range to search within episodes'
+        },
+        'max_results': {
+            'type': 'integer',
+            'default': 10,
+            'description': 'Maximum number of results to return'
+        },
+        'include_surrounding': {
+            'type': 'boolean',
+            'default': True,
+            'description': 'Include surrounding content for context'
+        },
+        'cache_ttl': _CACHE_TTL_SCHEMA,
+        'raw_bytes': _RAW_BYTES_SCHEMA
+    }
+})
+
 class ContextSearchTool(RobustTool):
     """Tool for searching content by context."""
 
@@ -615,39 +1506,8 @@ class ContextSearchTool(RobustTool):
 
     def _define_validation_schema(self) -> Dict[str, Any]:
         """Define validation schema for context search."""
-        return {
-            'type': 'object',
-            'required': ['context_query'],
-            'properties': {
-                'context_query': {
-                    'type': 'string',
-                    'description': 'Context to search for (e.g., "Jared live on stage")'
-                },
-                'episode_ids': {
-                    'type': 'array',
-                    'items': {'type': 'string'},
-                    'description': 'Specific episode IDs to search'
-                },
-                'time_range': {
-                    'type': 'object',
-                    'properties': {
-                        'start_time': {'type': 'string', 'format': 'time'},
-                        'end_time': {'type': 'string', 'format': 'time'}
-                    },
-                    'description': 'Time range to search within episodes'
-                },
-                'max_results': {
-                    'type': 'integer',
-                    'default': 10,
-                    'description': 'Maximum number of results to return'
-                },
-                'include_surrounding': {
-                    'type': 'boolean',
-                    'default': True,
-                    'description': 'Include surrounding content for context'
-                }
-            }
-        }
+        return _CONTEXT_SEARCH_SCHEMA
+
 
     def _define_fallback_strategies(self) -> List[Dict[str, Any]]:
         """Define fallback strategies."""
@@ -666,6 +1526,9 @@ class ContextSearchTool(RobustTool):
 
         # Load context index
         context_index = self._load_context_index()
+        cached = _SEARCH_RESULTS.get(self.name, context_index, parameters)
+        if cached is not None:
+            return cached
 
         results = []
         processed_episodes = 0
@@ -691,18 +1554,18 @@ class ContextSearchTool(RobustTool):
             if len(results) >= max_results:
                 break
 
-        # Sort by relevance
-        results.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
+        # Select the most relevant results without sorting every hit
+        top_results = heapq.nlargest(max_results, results, key=lambda x: x.get('relevance_score', 0))
 
-        return {
+        return _SEARCH_RESULTS.put(self.name, context_index, parameters, _search_response(parameters, {
             'context_query': context_query,
             'parsed_context': parsed_context,
             'results_found': len(results),
             'episodes_searched': processed_episodes,
-            'results': results[:max_results],
+            'results': top_results,
             'search_type': 'context_search',
             'timestamp': datetime.now().isoformat()
-        }
+        }))
 
     def _parse_context_query(self, query: str) -> Dict[str, Any]:
         """Parse context query into searchable components."""
@@ -718,76 +1581,34 @@ class ContextSearchTool(RobustTool):
             'raw_query': query_lower
         }
 
-        # Simple NLP parsing (would be enhanced with proper NLP in real implementation)
-        if 'jared' in query_lower:
+        # Simple NLP parsing (would be enhanced with proper NLP in real implementation);
+        # a single scan reports every known phrase in the query
+        found = set(_CONTEXT_PHRASE_RE.findall(query_lower))
+
+        if 'jared' in found:
             parsed['people'].append('Jared')
 
-        if 'stage' in query_lower or 'live' in query_lower:
+        if 'stage' in found or 'live' in found:
             parsed['locations'].append('stage')
 
-        if 'on stage' in query_lower or 'performing' in query_lower:
+        if 'on stage' in found or 'performing' in found:
             parsed['actions'].append('performing')
 
         # Extract more patterns
-        person_patterns = ['jared', 'sarah', 'host', 'guest']
-        for pattern in person_patterns:
-            if pattern in query_lower and pattern not in parsed['people']:
+        for pattern in _CONTEXT_PERSON_PATTERNS:
+            if pattern in found and pattern not in parsed['people']:
                 parsed['people'].append(pattern.title())
 
-        location_patterns = ['stage', 'studio', 'audience', 'backstage']
-        for pattern in location_patterns:
-            if pattern in query_lower and pattern not in parsed['locations']:
+        for pattern in _CONTEXT_LOCATION_PATTERNS:
+            if pattern in found and pattern not in parsed['locations']:
                 parsed['locations'].append(pattern)
 
         return parsed
 
-    def _load_context_index(self) -> Dict[str, Any]:
+    def _load_context_index(self) -> Mapping[str, Any]:
         """Load context index."""
-        return {
-            'episodes': {
-                'ep002': {
-                    'title': 'Comedy Night Live',
-                    'segments': [
-                        {
-                            'start_time': 0.0,
-                            'end_time': 60.0,
-                            'text': "Jared: Welcome to comedy night! Let's start with some jokes.",
-                            'context': {
-                                'location': 'stage',
-                                'people': ['Jared'],
-                                'activity': 'introduction',
-                                'audience': 'live'
-                            }
-                        },
-                        {
-                            'start_time': 60.0,
-                            'end_time': 120.0,
-                            'text': "Jared: Why don't scientists trust atoms? Because they make up everything!",
-                            'context': {
-                                'location': 'stage',
-                                'people': ['Jared'],
-                                'activity': 'joke_telling',
-                                'audience': 'live',
-                                'audience_reaction': 'laughter'
-                            }
-                        },
-                        {
-                            'start_time': 180.0,
-                            'end_time': 240.0,
-                            'text': "Sarah: Here's a farming joke for you. Why did the scarecrow win an award?",
-                            'context': {
-                                'location': 'stage',
-                                'people': ['Sarah'],
-                                'activity': 'joke_telling',
-                                'audience': 'live'
-                            }
-                        }
-                    ]
-                }
-            },
-            'index_type': 'context_index',
-            'last_updated': datetime.now().isoformat()
-        }
+        return _context_index()
+
 
     def _search_episode_context(self, episode_data: Dict[str, Any], parsed_context: Dict[str, Any],
                               time_range: Optional[Dict[str, str]], include_surrounding: bool) -> List[Dict[str, Any]]:
@@ -795,44 +1616,70 @@ class ContextSearchTool(RobustTool):
         segments = episode_data.get('segments', [])
         results = []
 
-        for segment in segments:
-            segment_context = segment.get('context', {})
-            segment_text = segment['text'].lower()
-
-            # Check time range
-            if time_range:
-                start_time = self._parse_time(time_range.get('start_time', '00:00:00'))
-                end_time = self._parse_time(time_range.get('end_time', '23:59:59'))
-
-                if segment['end_time'] < start_time or segment['start_time'] > end_time:
-                    continue
+        if time_range:
+            start_time = _parse_time(time_range.get('start_time', '00:00:00'))
+            end_time = _parse_time(time_range.get('end_time', '23:59:59'))
+
+        # Lowercase the query parts once rather than per segment
+        people_lower = [person.lower() for person in parsed_context['people']]
+        locations_lower = [location.lower() for location in parsed_context['locations']]
+        actions_lower = [action.lower() for action in parsed_context['actions']]
+        raw_query = parsed_context['raw_query']
+
+        # With several needles, one automaton pass finds all of them in a
+        # segment's text instead of a substring scan per needle
+        needles = tuple(sorted({*people_lower, *locations_lower, *actions_lower, raw_query}))
+        automaton = _build_automaton(needles) if len(needles) > 1 else None
+
+        # Only segments overlapping the time range are candidates
+        segment_ids = range(len(segments))
+        if time_range:
+            segment_ids = _episode_timeline(episode_data).overlapping(start_time, end_time)
+
+        columns = episode_data.get('_columns')
+        if columns is None:
+            columns = ContextColumns(segments)
+        query_people = parsed_context['people']
+
+        for i in segment_ids:
+            segment = segments[i]
+            segment_text = columns.texts_lower[i]
+            segment_people = columns.people[i]
+            segment_location = columns.locations[i]
+            segment_activity = columns.activities[i]
+
+            # Needle membership in the text: substring checks, or the set of
+            # needles the automaton found
+            text_hits = segment_text
+            if automaton is not None:
+                text_hits = {needle for _, needle in automaton.iter(segment_text)}
 
             # Calculate context match score
             match_score = 0
 
             # Check people match
-            for person in parsed_context['people']:
-                if person.lower() in segment_context.get('people', []):
+            for person in people_lower:
+                if person in segment_people:
                     match_score += 2
-                elif person.lower() in segment_text:
+                elif person in text_hits:
                     match_score += 1
 
             # Check location match
-            for location in parsed_context['locations']:
-                if location.lower() in segment_context.get('location', ''):
+            for location in locations_lower:
+                if location in segment_location:
                     match_score += 2
-                elif location.lower() in segment_text:
+                elif location in text_hits:
                     match_score += 1
 
             # Check activity match
-            for action in parsed_context['actions']:
-                if action.lower() in segment_context.get('activity', ''):
+            for action in actions_lower:
+                if action in segment_activity:
                     match_score += 1.5
-                elif action.lower() in segment_text:
+                elif action in text_hits:
                     match_score += 0.5
 
             # Check raw query match
-            if parsed_context['raw_query'] in segment_text:
+            if raw_query in text_hits:
                 match_score += 3
 
             if match_score > 0:
@@ -842,25 +1689,24 @@ class ContextSearchTool(RobustTool):
                     'end_time': segment['end_time'],
                     'duration': segment['end_time'] - segment['start_time'],
                     'text': segment['text'],
-                    'context': segment_context,
+                    'context': copy.deepcopy(segment.get('context', {})),
                     'relevance_score': match_score * 10,
                     'match_details': {
-                        'people_match': any(p in segment_context.get('people', []) for p in parsed_context['people']),
-                        'location_match': any(l in segment_context.get('location', '') for l in parsed_context['locations']),
-                        'activity_match': any(a in segment_context.get('activity', '') for a in parsed_context['actions'])
+                        'people_match': not segment_people.isdisjoint(query_people),
+                        'location_match': any(l in segment_location for l in parsed_context['locations']),
+                        'activity_match': any(a in segment_activity for a in parsed_context['actions'])
                     }
                 }
 
                 if include_surrounding:
-                    result['surrounding_context'] = self._get_surrounding_context(segments, segment)
+                    result['surrounding_context'] = self._get_surrounding_context(segments, i)
 
                 results.append(result)
 
         return results
 
-    def _get_surrounding_context(self, segments: List[Dict[str, Any]], current_segment: Dict[str, Any]) -> Dict[str, Any]:
-        """Get surrounding context for a segment."""
-        current_index = segments.index(current_segment)
+    def _get_surrounding_context(self, segments: List[Dict[str, Any]], current_index: int) -> Dict[str, Any]:
+        """Get surrounding context for the segment at current_index."""
         context = {}
 
         # Get previous segment
@@ -879,18 +1725,98 @@ class ContextSearchTool(RobustTool):
 
         return context
 
-    def _parse_time(self, time_str: str) -> float:
-        """Convert time string to seconds."""
-        try:
-            parts = time_str.split(':')
-            if len(parts) == 3:
-                return float(parts[0]) * 3600 + float(parts[1]) * 60 + float(parts[2])
-            elif len(parts) == 2:
-                return float(parts[0]) * 60 + float(parts[1])
-            else:
-                return float(parts[0])
-        except:
-            return 0.0
+@lru_cache(maxsize=1)
+def _timestamp_index() -> Mapping[str, Any]:
+    """Timestamp index shared by every tool instance, built on first use."""
+    return _freeze_index(_attach_timelines({
+        'episodes': {
+            'ep001': {
+                'title': 'The Future of AI',
+                'duration': 3600,
+                'segments': [
+                    {'start_time': 0.0, 'end_time': 60.0, 'text': 'Introduction to AI'},
+                    {'start_time': 60.0, 'end_time': 300.0, 'text': 'Machine learning discussion'},
+                    {'start_time': 300.0, 'end_time': 600.0, 'text': 'Ethical implications of AI'},
+                    {'start_time': 600.0, 'end_time': 1200.0, 'text': 'Future predictions'},
+                    {'start_time': 1200.0, 'end_time': 1800.0, 'text': 'Q&A session'}
+                ]
+            },
+            'ep002': {
+                'title': 'Comedy Night Live',
+                'duration': 2400,
+                'segments': [
+                    {'start_time': 0.0, 'end_time': 60.0, 'text': 'Welcome and introduction'},
+                    {'start_time': 60.0, 'end_time': 120.0, 'text': 'First joke segment'},
+                    {'start_time': 120.0, 'end_time': 180.0, 'text': 'Second joke segment'},
+                    {'start_time': 180.0, 'end_time': 240.0, 'text': 'Closing remarks'}
+                ]
+            }
+        },
+        'index_type': 'timestamp_index',
+        'last_updated': datetime.now().isoformat()
+    }))
+
+_TIMESTAMP_SEARCH_SCHEMA = _freeze_schema({
+    'type': 'object',
+    'required': ['time_specification'],
+    'properties': {
+        'time_specification': {
+            'type': 'object',
+            'oneOf': [
+                {
+                    'properties': {
+                        'exact_time': {'type': 'string', 'format': 'time'}
+                    },
+                    'required': ['exact_time']
+                },
+                {
+                    'properties': {
+                        'time_range': {
+                            'type': 'object',
+                            'properties': {
+                                'start_time': {'type': 'string', 'format': 'time'},
+                                'end_time': {'type': 'string', 'format': 'time'}
+                            },
+                            'required': ['start_time', 'end_time']
+                        }
+                    },
+                    'required': ['time_range']
+                },
+                {
+                    'properties': {
+                        'relative_time': {
+                            'type': 'object',
+                            'properties': {
+                                'position': {'type': 'string', 'enum': ['start', 'middle', 'end']},
+                                'percentage': {'type': 'number', 'minimum': 0, 'maximum': 100}
+                            },
+                            'required': ['position']
+                        }
+                    },
+                    'required': ['relative_time']
+                }
+            ],
+            'description': 'Time specification for search'
+        },
+        'episode_ids': {
+            'type': 'array',
+            'items': {'type': 'string'},
+            'description': 'Specific episode IDs to search'
+        },
+        'search_radius': {
+            'type': 'number',
+            'default': 30.0,
+            'description': 'Search radius around timestamp in seconds'
+        },
+        'max_results': {
+            'type': 'integer',
+            'default': 5,
+            'description': 'Maximum number of results to return'
+        },
+        'cache_ttl': _CACHE_TTL_SCHEMA,
+        'raw_bytes': _RAW_BYTES_SCHEMA
+    }
+})
 
 class TimestampSearchTool(RobustTool):
     """Tool for searching content by timestamps."""
@@ -903,65 +1829,8 @@ class TimestampSearchTool(RobustTool):
 
     def _define_validation_schema(self) -> Dict[str, Any]:
         """Define validation schema for timestamp search."""
-        return {
-            'type': 'object',
-            'required': ['time_specification'],
-            'properties': {
-                'time_specification': {
-                    'type': 'object',
-                    'oneOf': [
-                        {
-                            'properties': {
-                                'exact_time': {'type': 'string', 'format': 'time'}
-                            },
-                            'required': ['exact_time']
-                        },
-                        {
-                            'properties': {
-                                'time_range': {
-                                    'type': 'object',
-                                    'properties': {
-                                        'start_time': {'type': 'string', 'format': 'time'},
-                                        'end_time': {'type': 'string', 'format': 'time'}
-                                    },
-                                    'required': ['start_time', 'end_time']
-                                }
-                            },
-                            'required': ['time_range']
-                        },
-                        {
-                            'properties': {
-                                'relative_time': {
-                                    'type': 'object',
-                                    'properties': {
-                                        'position': {'type': 'string', 'enum': ['start', 'middle', 'end']},
-                                        'percentage': {'type': 'number', 'minimum': 0, 'maximum': 100}
-                                    },
-                                    'required': ['position']
-                                }
-                            },
-                            'required': ['relative_time']
-                        }
-                    ],
-                    'description': 'Time specification for search'
-                },
-                'episode_ids': {
-                    'type': 'array',
-                    'items': {'type': 'string'},
-                    'description': 'Specific episode IDs to search'
-                },
-                'search_radius': {
-                    'type': 'number',
-                    'default': 30.0,
-                    'description': 'Search radius around timestamp in seconds'
-                },
-                'max_results': {
-                    'type': 'integer',
-                    'default': 5,
-                    'description': 'Maximum number of results to return'
-                }
-            }
-        }
+        return _TIMESTAMP_SEARCH_SCHEMA
+
 
     def _define_fallback_strategies(self) -> List[Dict[str, Any]]:
         """Define fallback strategies."""
@@ -976,12 +1845,15 @@ class TimestampSearchTool(RobustTool):
 
         # Load timestamp index
         timestamp_index = self._load_timestamp_index()
+        cached = _SEARCH_RESULTS.get(self.name, timestamp_index, parameters)
+        if cached is not None:
+            return cached
 
         results = []
         processed_episodes = 0
 
-        # Determine target time(s)
-        target_times = self._get_target_times(time_spec, timestamp_index)
+        # Determine target time span(s)
+        target_spans = self._get_target_spans(time_spec, timestamp_index)
 
         # Search through episodes
         for episode_id, episode_data in timestamp_index['episodes'].items():
@@ -990,7 +1862,7 @@ class TimestampSearchTool(RobustTool):
 
             processed_episodes += 1
             episode_results = self._search_episode_timestamps(
-                episode_data, target_times, search_radius
+                episode_data, target_spans, search_radius
             )
 
             # Add episode info
@@ -1005,57 +1877,35 @@ class TimestampSearchTool(RobustTool):
             if len(results) >= max_results:
                 break
 
-        return {
+        return _SEARCH_RESULTS.put(self.name, timestamp_index, parameters, _search_response(parameters, {
             'time_specification': time_spec,
             'results_found': len(results),
             'episodes_searched': processed_episodes,
             'results': results[:max_results],
             'search_type': 'timestamp_search',
             'timestamp': datetime.now().isoformat()
-        }
+        }))
 
-    def _load_timestamp_index(self) -> Dict[str, Any]:
+    def _load_timestamp_index(self) -> Mapping[str, Any]:
         """Load timestamp index."""
-        return {
-            'episodes': {
-                'ep001': {
-                    'title': 'The Future of AI',
-                    'duration': 3600,
-                    'segments': [
-                        {'start_time': 0.0, 'end_time': 60.0, 'text': 'Introduction to AI'},
-                        {'start_time': 60.0, 'end_time': 300.0, 'text': 'Machine learning discussion'},
-                        {'start_time': 300.0, 'end_time': 600.0, 'text': 'Ethical implications of AI'},
-                        {'start_time': 600.0, 'end_time': 1200.0, 'text': 'Future predictions'},
-                        {'start_time': 1200.0, 'end_time': 1800.0, 'text': 'Q&A session'}
-                    ]
-                },
-                'ep002': {
-                    'title': 'Comedy Night Live',
-                    'duration': 2400,
-                    'segments': [
-                        {'start_time': 0.0, 'end_time': 60.0, 'text': 'Welcome and introduction'},
-                        {'start_time': 60.0, 'end_time': 120.0, 'text': 'First joke segment'},
-                        {'start_time': 120.0, 'end_time': 180.0, 'text': 'Second joke segment'},
-                        {'start_time': 180.0, 'end_time': 240.0, 'text': 'Closing remarks'}
-                    ]
-                }
-            },
-            'index_type': 'timestamp_index',
-            'last_updated': datetime.now().isoformat()
-        }
+        return _timestamp_index()
 
-    def _get_target_times(self, time_spec: Dict[str, Any], index: Dict[str, Any]) -> List[float]:
-        """Get target times from time specification."""
+
+    def _get_target_spans(self, time_spec: Dict[str, Any], index: Dict[str, Any]) -> List[Tuple[float, float]]:
+        """Get target (start, end) spans in seconds from time specification.
+
+        Exact and relative times are zero-length spans; a time range is a
+        single span, so segments anywhere inside it are found too.
+        """
         target_times = []
 
         if 'exact_time' in time_spec:
-            target_times.append(self._parse_time(time_spec['exact_time']))
+            target_times.append(_parse_time(time_spec['exact_time']))
         elif 'time_range' in time_spec:
-            start_time = self._parse_time(time_spec['time_range']['start_time'])
-            end_time = self._parse_time(time_spec['time_range']['end_time'])
+            start_time = _parse_time(time_spec['time_range']['start_time'])
+            end_time = _parse_time(time_spec['time_range']['end_time'])
             # For range, we'll search the entire range
-            target_times.append(start_time)
-            target_times.append(end_time)
+            return [(start_time, end_time)]
         elif 'relative_time' in time_spec:
             rel_spec = time_spec['relative_time']
             if 'percentage' in rel_spec:
@@ -1078,56 +1928,143 @@ class TimestampSearchTool(RobustTool):
                         target_time = duration * 0.9  # 90% in
                     target_times.append(target_time)
 
-        return target_times
+        return [(target_time, target_time) for target_time in target_times]
 
-    def _search_episode_timestamps(self, episode_data: Dict[str, Any], target_times: List[float],
+    def _search_episode_timestamps(self, episode_data: Dict[str, Any], target_spans: List[Tuple[float, float]],
                                   search_radius: float) -> List[Dict[str, Any]]:
-        """Search episode for content around target timestamps."""
+        """Search episode for content around target timestamps.
+
+        Each segment is reported once, for the target span it is closest to.
+        """
         segments = episode_data.get('segments', [])
-        results = []
+        timeline = _episode_timeline(episode_data)
+        results: Dict[int, Dict[str, Any]] = {}
 
-        for target_time in target_times:
-            # Find segments within search radius of target time
-            for segment in segments:
+        for target_start, target_end in target_spans:
+            window_start = target_start - search_radius
+            window_end = target_end + search_radius
+
+            # Only segments overlapping the search window are candidates
+            segment_ids = range(len(segments))
+            if search_radius >= 0:
+                segment_ids = timeline.overlapping(window_start, window_end)
+
+            # Find segments within search radius of the target span
+            for i in segment_ids:
+                segment = segments[i]
                 segment_start = segment['start_time']
                 segment_end = segment['end_time']
 
-                # Check if target time is within this segment or nearby
-                if (abs(segment_start - target_time) <= search_radius or
-                    abs(segment_end - target_time) <= search_radius or
-                    (segment_start <= target_time <= segment_end)):
-
-                    # Calculate distance from target
-                    if target_time <= segment_start:
-                        distance = segment_start - target_time
-                    elif target_time >= segment_end:
-                        distance = target_time - segment_end
-                    else:
-                        distance = 0
-
-                    results.append({
-                        'target_time': target_time,
-                        'segment_start': segment_start,
-                        'segment_end': segment_end,
-                        'distance_from_target': distance,
-                        'text': segment['text'],
-                        'relevance_score': max(0, 10 - (distance / search_radius * 10))
-                    })
+                # Gap in seconds between the segment and the target span, 0.0 if
+                # they overlap; one max instead of a branch per case
+                distance = float(max(0.0, segment_start - target_end, target_start - segment_end))
+                if distance > search_radius:
+                    continue
 
-        return results
+                previous = results.get(i)
+                if previous is not None and previous['distance_from_target'] <= distance:
+                    continue
 
-    def _parse_time(self, time_str: str) -> float:
-        """Convert time string to seconds."""
-        try:
-            parts = time_str.split(':')
-            if len(parts) == 3:
-                return float(parts[0]) * 3600 + float(parts[1]) * 60 + float(parts[2])
-            elif len(parts) == 2:
-                return float(parts[0]) * 60 + float(parts[1])
-            else:
-                return float(parts[0])
-        except:
-            return 0.0
+                result = {
+                    'target_time': target_start,
+                    'segment_start': segment_start,
+                    'segment_end': segment_end,
+                    'distance_from_target': distance,
+                    'text': segment['text'],
+                    'relevance_score': max(0, 10 - (distance / search_radius * 10))
+                }
+                if target_end != target_start:
+                    result['target_end_time'] = target_end
+                results[i] = result
+
+        return list(results.values())
+
+@lru_cache(maxsize=1)
+def _location_index() -> Mapping[str, Any]:
+    """Location index shared by every tool instance, built on first use."""
+    return _freeze_index(_attach_scene_columns({
+        'episodes': {
+            'ep002': {
+                'title': 'Comedy Night Live',
+                'scenes': [
+                    {
+                        'start_time': 0.0,
+                        'end_time': 600.0,
+                        'location': 'stage',
+                        'description': 'Comedians performing on stage',
+                        'people': ['Jared', 'Sarah'],
+                        'visual_context': {
+                            'camera_angle': 'wide',
+                            'lighting': 'spotlight',
+                            'audience_visible': True
+                        }
+                    },
+                    {
+                        'start_time': 600.0,
+                        'end_time': 900.0,
+                        'location': 'backstage',
+                        'description': 'Comedians preparing backstage',
+                        'people': ['Jared', 'Sarah', 'Crew'],
+                        'visual_context': {
+                            'camera_angle': 'close-up',
+                            'lighting': 'natural',
+                            'audience_visible': False
+                        }
+                    },
+                    {
+                        'start_time': 900.0,
+                        'end_time': 1200.0,
+                        'location': 'audience',
+                        'description': 'Audience reactions and interactions',
+                        'people': ['Audience'],
+                        'visual_context': {
+                            'camera_angle': 'wide',
+                            'lighting': 'house_lights',
+                            'audience_visible': True
+                        }
+                    }
+                ]
+            }
+        },
+        'index_type': 'location_index',
+        'last_updated': datetime.now().isoformat()
+    }))
+
+_LOCATION_SEARCH_SCHEMA = _freeze_schema({
+    'type': 'object',
+    'required': ['location_query'],
+    'properties': {
+        'location_query': {
+            'type': 'string',
+            'description': 'Location to search for (e.g., "stage", "studio", "audience")'
+        },
+        'episode_ids': {
+            'type': 'array',
+            'items': {'type': 'string'},
+            'description': 'Specific episode IDs to search'
+        },
+        'time_range': {
+            'type': 'object',
+            'properties': {
+                'start_time': {'type': 'string', 'format': 'time'},
+                'end_time': {'type': 'string', 'format': 'time'}
+            },
+            'description': 'Time range to search within episodes'
+        },
+        'max_results': {
+            'type': 'integer',
+            'default': 10,
+            'description': 'Maximum number of results to return'
+        },
+        'include_visual_context': {
+            'type': 'boolean',
+            'default': True,
+            'description': 'Include visual context information if available'
+        },
+        'cache_ttl': _CACHE_TTL_SCHEMA,
+        'raw_bytes': _RAW_BYTES_SCHEMA
+    }
+})
 
 class LocationSearchTool(RobustTool):
     """Tool for searching content by location and scene context."""
@@ -1140,39 +2077,8 @@ class LocationSearchTool(RobustTool):
 
     def _define_validation_schema(self) -> Dict[str, Any]:
         """Define validation schema for location search."""
-        return {
-            'type': 'object',
-            'required': ['location_query'],
-            'properties': {
-                'location_query': {
-                    'type': 'string',
-                    'description': 'Location to search for (e.g., "stage", "studio", "audience")'
-                },
-                'episode_ids': {
-                    'type': 'array',
-                    'items': {'type': 'string'},
-                    'description': 'Specific episode IDs to search'
-                },
-                'time_range': {
-                    'type': 'object',
-                    'properties': {
-                        'start_time': {'type': 'string', 'format': 'time'},
-                        'end_time': {'type': 'string', 'format': 'time'}
-                    },
-                    'description': 'Time range to search within episodes'
-                },
-                'max_results': {
-                    'type': 'integer',
-                    'default': 10,
-                    'description': 'Maximum number of results to return'
-                },
-                'include_visual_context': {
-                    'type': 'boolean',
-                    'default': True,
-                    'description': 'Include visual context information if available'
-                }
-            }
-        }
+        return _LOCATION_SEARCH_SCHEMA
+
 
     def _define_fallback_strategies(self) -> List[Dict[str, Any]]:
         """Define fallback strategies."""
@@ -1188,6 +2094,9 @@ class LocationSearchTool(RobustTool):
 
         # Load location index
         location_index = self._load_location_index()
+        cached = _SEARCH_RESULTS.get(self.name, location_index, parameters)
+        if cached is not None:
+            return cached
 
         results = []
         processed_episodes = 0
@@ -1213,67 +2122,22 @@ class LocationSearchTool(RobustTool):
             if len(results) >= max_results:
                 break
 
-        # Sort by relevance
-        results.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
+        # Select the most relevant results without sorting every hit
+        top_results = heapq.nlargest(max_results, results, key=lambda x: x.get('relevance_score', 0))
 
-        return {
+        return _SEARCH_RESULTS.put(self.name, location_index, parameters, _search_response(parameters, {
             'location_query': location_query,
             'results_found': len(results),
             'episodes_searched': processed_episodes,
-            'results': results[:max_results],
+            'results': top_results,
             'search_type': 'location_search',
             'timestamp': datetime.now().isoformat()
-        }
+        }))
 
-    def _load_location_index(self) -> Dict[str, Any]:
+    def _load_location_index(self) -> Mapping[str, Any]:
         """Load location index."""
-        return {
-            'episodes': {
-                'ep002': {
-                    'title': 'Comedy Night Live',
-                    'scenes': [
-                        {
-                            'start_time': 0.0,
-                            'end_time': 600.0,
-                            'location': 'stage',
-                            'description': 'Comedians performing on stage',
-                            'people': ['Jared', 'Sarah'],
-                            'visual_context': {
-                                'camera_angle': 'wide',
-                                'lighting': 'spotlight',
-                                'audience_visible': True
-                            }
-                        },
-                        {
-                            'start_time': 600.0,
-                            'end_time': 900.0,
-                            'location': 'backstage',
-                            'description': 'Comedians preparing backstage',
-                            'people': ['Jared', 'Sarah', 'Crew'],
-                            'visual_context': {
-                                'camera_angle': 'close-up',
-                                'lighting': 'natural',
-                                'audience_visible': False
-                            }
-                        },
-                        {
-                            'start_time': 900.0,
-                            'end_time': 1200.0,
-                            'location': 'audience',
-                            'description': 'Audience reactions and interactions',
-                            'people': ['Audience'],
-                            'visual_context': {
-                                'camera_angle': 'wide',
-                                'lighting': 'house_lights',
-                                'audience_visible': True
-                            }
-                        }
-                    ]
-                }
-            },
-            'index_type': 'location_index',
-            'last_updated': datetime.now().isoformat()
-        }
+        return _location_index()
+
 
     def _search_episode_locations(self, episode_data: Dict[str, Any], location_query: str,
                                  time_range: Optional[Dict[str, str]], include_visual_context: bool) -> List[Dict[str, Any]]:
@@ -1282,17 +2146,24 @@ class LocationSearchTool(RobustTool):
         results = []
         query_lower = location_query.lower()
 
-        for scene in scenes:
-            scene_location = scene.get('location', '').lower()
-            scene_description = scene.get('description', '').lower()
+        if time_range:
+            start_time = _parse_time(time_range.get('start_time', '00:00:00'))
+            end_time = _parse_time(time_range.get('end_time', '23:59:59'))
 
-            # Check time range
-            if time_range:
-                start_time = self._parse_time(time_range.get('start_time', '00:00:00'))
-                end_time = self._parse_time(time_range.get('end_time', '23:59:59'))
+        # Scene fields are lowercased and mapped by location once at index load
+        columns = episode_data.get('_scene_columns')
+        if columns is None:
+            columns = SceneColumns(scenes)
 
-                if scene['end_time'] < start_time or scene['start_time'] > end_time:
-                    continue
+        scene_ids = columns.matching_ids(query_lower)
+        if time_range:
+            in_range = set(columns.timeline.overlapping(start_time, end_time))
+            scene_ids = [scene_id for scene_id in scene_ids if scene_id in in_range]
+
+        for scene_id in scene_ids:
+            scene = scenes[scene_id]
+            scene_location = columns.locations_lower[scene_id]
+            scene_description = columns.descriptions_lower[scene_id]
 
             # Calculate location match score
             match_score = 0
@@ -1315,30 +2186,288 @@ class LocationSearchTool(RobustTool):
                     'duration': scene['end_time'] - scene['start_time'],
                     'location': scene['location'],
                     'description': scene['description'],
-                    'people': scene.get('people', []),
+                    'people': list(scene.get('people', [])),
                     'relevance_score': match_score,
                     'match_type': 'exact' if match_score >= 10 else 'partial'
                 }
 
                 if include_visual_context and 'visual_context' in scene:
-                    result['visual_context'] = scene['visual_context']
+                    result['visual_context'] = dict(scene['visual_context'])
 
                 results.append(result)
 
         return results
 
-    def _parse_time(self, time_str: str) -> float:
-        """Convert time string to seconds."""
-        try:
-            parts = time_str.split(':')
-            if len(parts) == 3:
-                return float(parts[0]) * 3600 + float(parts[1]) * 60 + float(parts[2])
-            elif len(parts) == 2:
-                return float(parts[0]) * 60 + float(parts[1])
-            else:
-                return float(parts[0])
-        except:
-            return 0.0
+@lru_cache(maxsize=1)
+def _comprehensive_index() -> Mapping[str, Any]:
+    """Comprehensive search index shared by every tool instance, built on first use."""
+    return _freeze_index(_attach_segment_features({
+        'episodes': {
+            'ep001': {
+                'title': 'The Future of AI',
+                'segments': [
+                    {
+                        'start_time': 0.0, 'end_time': 300.0,
+                        'text': 'Host introduces the topic of AI and its future impact',
+                        'topics': ['ai', 'future', 'technology'],
+                        'context': {'location': 'studio', 'people': ['Host', 'Dr. Smith']},
+                        'type': 'discussion'
+                    },
+                    {
+                        'start_time': 300.0, 'end_time': 900.0,
+                        'text': 'Detailed discussion about machine learning algorithms',
+                        'topics': ['machine learning', 'algorithms', 'ai'],
+                        'context': {'location': 'studio', 'people': ['Dr. Smith', 'Jane Doe']},
+                        'type': 'technical'
+                    }
+                ]
+            },
+            'ep002': {
+                'title': 'Comedy Night Live',
+                'segments': [
+                    {
+                        'start_time': 0.0, 'end_time': 60.0,
+                        'text': 'Jared welcomes the audience to comedy night',
+                        'topics': ['comedy', 'introduction'],
+                        'context': {'location': 'stage', 'people': ['Jared']},
+                        'type': 'introduction',
+                        'joke': False
+                    },
+                    {
+                        'start_time': 60.0, 'end_time': 120.0,
+                        'text': 'Jared tells a science joke about atoms',
+                        'topics': ['science', 'comedy'],
+                        'context': {'location': 'stage', 'people': ['Jared']},
+                        'type': 'joke',
+                        'joke': True,
+                        'joke_topics': ['science', 'atoms'],
+                        'laughter_score': 0.87
+                    },
+                    {
+                        'start_time': 180.0, 'end_time': 240.0,
+                        'text': 'Sarah tells a farming joke about scarecrows',
+                        'topics': ['farming', 'comedy'],
+                        'context': {'location': 'stage', 'people': ['Sarah']},
+                        'type': 'joke',
+                        'joke': True,
+                        'joke_topics': ['farming', 'awards'],
+                        'laughter_score': 0.92
+                    }
+                ]
+            }
+        },
+        'index_type': 'comprehensive',
+        'last_updated': datetime.now().isoformat()
+    }))
+
+SegmentScorer = Callable[[SegmentFeatures], List[Tuple[int, float, Dict[str, Any]]]]
+
+def _score_term_column(masks: List[int], query_masks: List[Tuple[int, int]], weight: float, detail: str,
+                       scores: Dict[int, float], details: Dict[int, Dict[str, Any]]) -> None:
+    """Score one term criterion for the scored segments from its bitmask column."""
+    if not query_masks:
+        return
+    any_mask = 0
+    for _, mask in query_masks:
+        any_mask |= mask
+    for i in scores:
+        segment_mask = masks[i]
+        if segment_mask & any_mask:
+            matches = sum(count * (segment_mask & mask).bit_count() for count, mask in query_masks)
+            scores[i] += matches * weight
+            details[i][detail] = matches
+
+def _compile_criteria(criteria: Dict[str, Any]) -> SegmentScorer:
+    """Compile advanced search criteria into a scorer over whole episodes.
+
+    Query terms are lowercased and the time range resolved once per request;
+    the returned function scores an episode's segments one criterion at a
+    time, running only the criteria actually present. When every criterion
+    is a term list, only segments in the postings of a query term are scored.
+
+    Args:
+        criteria: The ``search_criteria`` parameter of an advanced search.
+
+    Returns:
+        A function of an episode's SegmentFeatures returning (segment id,
+        match score, per-criterion details) for every segment that scored.
+    """
+    checks = []
+
+    if 'topics' in criteria:
+        topics_lower = [topic.lower() for topic in criteria['topics']]
+
+        def check_topics(features, scores, details):
+            _score_term_column(features.topic_masks, features.query_masks('topics', topics_lower), 2,
+                               'topic_match', scores, details)
+        checks.append(check_topics)
+
+    if 'joke_topics' in criteria:
+        joke_topics_lower = [topic.lower() for topic in criteria['joke_topics']]
+
+        def check_joke_topics(features, scores, details):
+            _score_term_column(features.joke_topic_masks, features.query_masks('joke_topics', joke_topics_lower), 3,
+                               'joke_topic_match', scores, details)
+        checks.append(check_joke_topics)
+
+    if 'context' in criteria:
+        # A context query matches segments whose location and people contain
+        # all of its words
+        context_words = frozenset(_TOKEN_RE.findall(criteria['context'].lower()))
+
+        def check_context(features, scores, details):
+            if not context_words:
+                return
+            context_tokens = features.context_tokens
+            for i in scores:
+                if context_words <= context_tokens[i]:
+                    scores[i] += 2
+                    details[i]['context_match'] = True
+        checks.append(check_context)
+
+    if 'locations' in criteria:
+        locations_lower = [location.lower() for location in criteria['locations']]
+
+        def check_locations(features, scores, details):
+            _score_term_column(features.location_masks, features.query_masks('locations', locations_lower), 1.5,
+                               'location_match', scores, details)
+        checks.append(check_locations)
+
+    if 'people' in criteria:
+        people_lower = [person.lower() for person in criteria['people']]
+
+        def check_people(features, scores, details):
+            _score_term_column(features.people_masks, features.query_masks('people', people_lower), 1.5,
+                               'people_match', scores, details)
+        checks.append(check_people)
+
+    if 'time_range' in criteria:
+        start_time = _parse_time(criteria['time_range']['start_time'])
+        end_time = _parse_time(criteria['time_range']['end_time'])
+
+        def check_time_range(features, scores, details):
+            start_times, end_times = features.start_times, features.end_times
+            for i in scores:
+                if not (end_times[i] < start_time or start_times[i] > end_time):
+                    scores[i] += 1
+                    details[i]['time_match'] = True
+        checks.append(check_time_range)
+
+    if 'min_duration' in criteria:
+        min_duration = criteria['min_duration']
+
+        def check_min_duration(features, scores, details):
+            durations = features.durations
+            for i in scores:
+                if durations[i] >= min_duration:
+                    scores[i] += 0.5
+                    details[i]['min_duration_match'] = True
+        checks.append(check_min_duration)
+
+    if 'max_duration' in criteria:
+        max_duration = criteria['max_duration']
+
+        def check_max_duration(features, scores, details):
+            durations = features.durations
+            for i in scores:
+                if durations[i] <= max_duration:
+                    scores[i] += 0.5
+                    details[i]['max_duration_match'] = True
+        checks.append(check_max_duration)
+
+    # Context, time and duration criteria can score any segment; term criteria
+    # only segments that carry one of the query terms
+    term_keys = ('topics', 'joke_topics', 'locations', 'people')
+    query_terms = None
+    if not any(key in criteria for key in ('context', 'time_range', 'min_duration', 'max_duration')):
+        query_terms = {term.lower() for key in term_keys for term in criteria.get(key, ())}
+
+    def score(features: SegmentFeatures) -> List[Tuple[int, float, Dict[str, Any]]]:
+        segment_ids = range(len(features.durations)) if query_terms is None else features.candidates(query_terms)
+        # Criteria add to the scores in a fixed order, as the per-segment
+        # scoring did, so float totals come out identical
+        scores = dict.fromkeys(segment_ids, 0)
+        details: Dict[int, Dict[str, Any]] = defaultdict(dict)
+        for check in checks:
+            check(features, scores, details)
+        return [(i, match_score, details[i]) for i, match_score in scores.items() if match_score > 0]
+
+    return score
+
+# Fields the compact result formats read, extracted per result in one C call
+_SUMMARY_FIELDS = itemgetter('segment_id', 'start_time', 'end_time', 'comprehensive_score', 'text')
+_TIMESTAMP_FIELDS = itemgetter('segment_id', 'start_time', 'end_time', 'comprehensive_score')
+
+_ADVANCED_SEARCH_SCHEMA = _freeze_schema({
+    'type': 'object',
+    'required': ['search_criteria'],
+    'properties': {
+        'search_criteria': {
+            'type': 'object',
+            'properties': {
+                'topics': {
+                    'type': 'array',
+                    'items': {'type': 'string'},
+                    'description': 'Topics to include'
+                },
+                'joke_topics': {
+                    'type': 'array',
+                    'items': {'type': 'string'},
+                    'description': 'Joke topics to include'
+                },
+                'context': {
+                    'type': 'string',
+                    'description': 'Context to search for'
+                },
+                'time_range': {
+                    'type': 'object',
+                    'properties': {
+                        'start_time': {'type': 'string', 'format': 'time'},
+                        'end_time': {'type': 'string', 'format': 'time'}
+                    },
+                    'description': 'Time range to search'
+                },
+                'locations': {
+                    'type': 'array',
+                    'items': {'type': 'string'},
+                    'description': 'Locations to include'
+                },
+                'people': {
+                    'type': 'array',
+                    'items': {'type': 'string'},
+                    'description': 'People to include'
+                },
+                'min_duration': {
+                    'type': 'number',
+                    'description': 'Minimum segment duration'
+                },
+                'max_duration': {
+                    'type': 'number',
+                    'description': 'Maximum segment duration'
+                }
+            },
+            'description': 'Complex search criteria'
+        },
+        'episode_ids': {
+            'type': 'array',
+            'items': {'type': 'string'},
+            'description': 'Specific episode IDs to search'
+        },
+        'max_results': {
+            'type': 'integer',
+            'default': 15,
+            'description': 'Maximum number of results to return'
+        },
+        'result_format': {
+            'type': 'string',
+            'enum': ['detailed', 'summary', 'timestamps'],
+            'default': 'detailed',
+            'description': 'Format of results'
+        },
+        'cache_ttl': _CACHE_TTL_SCHEMA,
+        'raw_bytes': _RAW_BYTES_SCHEMA
+    }
+})
 
 class AdvancedSearchTool(RobustTool):
     """Tool for performing complex searches combining multiple criteria."""
@@ -1351,74 +2480,8 @@ class AdvancedSearchTool(RobustTool):
 
     def _define_validation_schema(self) -> Dict[str, Any]:
         """Define validation schema for advanced search."""
-        return {
-            'type': 'object',
-            'required': ['search_criteria'],
-            'properties': {
-                'search_criteria': {
-                    'type': 'object',
-                    'properties': {
-                        'topics': {
-                            'type': 'array',
-                            'items': {'type': 'string'},
-                            'description': 'Topics to include'
-                        },
-                        'joke_topics': {
-                            'type': 'array',
-                            'items': {'type': 'string'},
-                            'description': 'Joke topics to include'
-                        },
-                        'context': {
-                            'type': 'string',
-                            'description': 'Context to search for'
-                        },
-                        'time_range': {
-                            'type': 'object',
-                            'properties': {
-                                'start_time': {'type': 'string', 'format': 'time'},
-                                'end_time': {'type': 'string', 'format': 'time'}
-                            },
-                            'description': 'Time range to search'
-                        },
-                        'locations': {
-                            'type': 'array',
-                            'items': {'type': 'string'},
-                            'description': 'Locations to include'
-                        },
-                        'people': {
-                            'type': 'array',
-                            'items': {'type': 'string'},
-                            'description': 'People to include'
-                        },
-                        'min_duration': {
-                            'type': 'number',
-                            'description': 'Minimum segment duration'
-                        },
-                        'max_duration': {
-                            'type': 'number',
-                            'description': 'Maximum segment duration'
-                        }
-                    },
-                    'description': 'Complex search criteria'
-                },
-                'episode_ids': {
-                    'type': 'array',
-                    'items': {'type': 'string'},
-                    'description': 'Specific episode IDs to search'
-                },
-                'max_results': {
-                    'type': 'integer',
-                    'default': 15,
-                    'description': 'Maximum number of results to return'
-                },
-                'result_format': {
-                    'type': 'string',
-                    'enum': ['detailed', 'summary', 'timestamps'],
-                    'default': 'detailed',
-                    'description': 'Format of results'
-                }
-            }
-        }
+        return _ADVANCED_SEARCH_SCHEMA
+
 
     def _define_fallback_strategies(self) -> List[Dict[str, Any]]:
         """Define fallback strategies."""
@@ -1433,241 +2496,200 @@ class AdvancedSearchTool(RobustTool):
 
         # Load comprehensive index
         comprehensive_index = self._load_comprehensive_index()
-
-        results = []
+        cached = _SEARCH_RESULTS.get(self.name, comprehensive_index, parameters)
+        if cached is not None:
+            return cached
+        # Resolve the criteria once for every episode searched
+        scorer = _compile_criteria(criteria)
+
+        episodes = comprehensive_index['episodes']
+        hits = []
+        matches_found = 0
         processed_episodes = 0
 
         # Search through episodes
-        for episode_id, episode_data in comprehensive_index['episodes'].items():
+        for episode_id, episode_data in episodes.items():
             if episode_ids and episode_id not in episode_ids:
                 continue
 
             processed_episodes += 1
-            episode_results = self._search_episode_advanced(
-                episode_data, criteria, result_format
+            # No episode can contribute more than max_results to the top results
+            episode_hits, episode_matches = self._search_episode_advanced(
+                episode_id, episode_data, criteria, result_format, scorer, max_results
             )
-
-            # Add episode info
-            for result in episode_results:
-                result['episode_id'] = episode_id
-                result['episode_title'] = episode_data.get('title', 'Untitled Episode')
-
-            results.extend(episode_results)
+            hits.extend(episode_hits)
+            matches_found += episode_matches
 
             # Stop if we have enough results
-            if len(results) >= max_results:
+            if matches_found >= max_results:
                 break
 
-        # Sort by comprehensive relevance score
-        results.sort(key=lambda x: x.get('comprehensive_score', 0), reverse=True)
+        # Select the best comprehensive scores without sorting every hit
+        top_hits = heapq.nlargest(max_results, hits, key=lambda hit: hit.score)
+        top_results = [self._build_result(hit, episodes[hit.episode_id]) for hit in top_hits]
 
         # Format results
-        formatted_results = self._format_results(results, result_format)
+        formatted_results = self._format_results(top_results, result_format)
 
-        return {
+        return _SEARCH_RESULTS.put(self.name, comprehensive_index, parameters, _search_response(parameters, {
             'search_criteria': criteria,
-            'results_found': len(results),
+            'results_found': matches_found,
             'episodes_searched': processed_episodes,
             'results': formatted_results,
             'search_type': 'advanced_search',
             'timestamp': datetime.now().isoformat()
-        }
+        }))
 
-    def _load_comprehensive_index(self) -> Dict[str, Any]:
+    def _load_comprehensive_index(self) -> Mapping[str, Any]:
         """Load comprehensive search index."""
-        return {
-            'episodes': {
-                'ep001': {
-                    'title': 'The Future of AI',
-                    'segments': [
-                        {
-                            'start_time': 0.0, 'end_time': 300.0,
-                            'text': 'Host introduces the topic of AI and its future impact',
-                            'topics': ['ai', 'future', 'technology'],
-                            'context': {'location': 'studio', 'people': ['Host', 'Dr. Smith']},
-                            'type': 'discussion'
-                        },
-                        {
-                            'start_time': 300.0, 'end_time': 900.0,
-                            'text': 'Detailed discussion about machine learning algorithms',
-                            'topics': ['machine learning', 'algorithms', 'ai'],
-                            'context': {'location': 'studio', 'people': ['Dr. Smith', 'Jane Doe']},
-                            'type': 'technical'
-                        }
-                    ]
-                },
-                'ep002': {
-                    'title': 'Comedy Night Live',
-                    'segments': [
-                        {
-                            'start_time': 0.0, 'end_time': 60.0,
-                            'text': 'Jared welcomes the audience to comedy night',
-                            'topics': ['comedy', 'introduction'],
-                            'context': {'location': 'stage', 'people': ['Jared']},
-                            'type': 'introduction',
-                            'joke': False
-                        },
-                        {
-                            'start_time': 60.0, 'end_time': 120.0,
-                            'text': 'Jared tells a science joke about atoms',
-                            'topics': ['science', 'comedy'],
-                            'context': {'location': 'stage', 'people': ['Jared']},
-                            'type': 'joke',
-                            'joke': True,
-                            'joke_topics': ['science', 'atoms'],
-                            'laughter_score': 0.87
-                        },
-                        {
-                            'start_time': 180.0, 'end_time': 240.0,
-                            'text': 'Sarah tells a farming joke about scarecrows',
-                            'topics': ['farming', 'comedy'],
-                            'context': {'location': 'stage', 'people': ['Sarah']},
-                            'type': 'joke',
-                            'joke': True,
-                            'joke_topics': ['farming', 'awards'],
-                            'laughter_score': 0.92
-                        }
-                    ]
-                }
-            },
-            'index_type': 'comprehensive',
-            'last_updated': datetime.now().isoformat()
-        }
+        return _comprehensive_index()
 
-    def _search_episode_advanced(self, episode_data: Dict[str, Any], criteria: Dict[str, Any],
-                                result_format: str) -> List[Dict[str, Any]]:
-        """Search episode using advanced criteria."""
-        segments = episode_data.get('segments', [])
-        results = []
 
-        for segment in segments:
-            # Calculate comprehensive match score
-            match_score = 0
-            score_details = {}
-
-            # Topic matching
-            if 'topics' in criteria:
-                segment_topics = segment.get('topics', [])
-                topic_matches = sum(1 for topic in criteria['topics']
-                                   if topic.lower() in [st.lower() for st in segment_topics])
-                if topic_matches > 0:
-                    match_score += topic_matches * 2
-                    score_details['topic_match'] = topic_matches
-
-            # Joke topic matching
-            if 'joke_topics' in criteria and segment.get('joke', False):
-                joke_topics = segment.get('joke_topics', [])
-                joke_matches = sum(1 for topic in criteria['joke_topics']
-                                  if topic.lower() in [jt.lower() for jt in joke_topics])
-                if joke_matches > 0:
-                    match_score += joke_matches * 3
-                    score_details['joke_topic_match'] = joke_matches
-
-            # Context matching
-            if 'context' in criteria:
-                segment_context = segment.get('context', {})
-                context_text = f"{segment_context.get('location', '')} {segment_context.get('people', [])}"
-                if criteria['context'].lower() in context_text.lower():
-                    match_score += 2
-                    score_details['context_match'] = True
-
-            # Location matching
-            if 'locations' in criteria:
-                segment_location = segment.get('context', {}).get('location', '').lower()
-                location_matches = sum(1 for location in criteria['locations']
-                                      if location.lower() == segment_location)
-                if location_matches > 0:
-                    match_score += location_matches * 1.5
-                    score_details['location_match'] = location_matches
-
-            # People matching
-            if 'people' in criteria:
-                segment_people = [p.lower() for p in segment.get('context', {}).get('people', [])]
-                people_matches = sum(1 for person in criteria['people']
-                                    if person.lower() in segment_people)
-                if people_matches > 0:
-                    match_score += people_matches * 1.5
-                    score_details['people_match'] = people_matches
-
-            # Time range matching
-            if 'time_range' in criteria:
-                segment_start = segment['start_time']
-                segment_end = segment['end_time']
-                start_time = self._parse_time(criteria['time_range']['start_time'])
-                end_time = self._parse_time(criteria['time_range']['end_time'])
-
-                if not (segment_end < start_time or segment_start > end_time):
-                    match_score += 1
-                    score_details['time_match'] = True
+    def _search_episode_advanced(self, episode_id: str, episode_data: Dict[str, Any], criteria: Dict[str, Any],
+                                result_format: str, scorer: Optional[SegmentScorer] = None,
+                                top_k: Optional[int] = None) -> Tuple[List[SegmentHit], int]:
+        """Search episode using advanced criteria.
 
-            # Duration matching
-            duration = segment['end_time'] - segment['start_time']
-            if 'min_duration' in criteria and duration >= criteria['min_duration']:
-                match_score += 0.5
-                score_details['min_duration_match'] = True
-            if 'max_duration' in criteria and duration <= criteria['max_duration']:
-                match_score += 0.5
-                score_details['max_duration_match'] = True
+        ``scorer`` is the compiled form of ``criteria``; it is compiled here
+        when the caller has not already done so.
 
-            if match_score > 0:
-                result = {
-                    'segment_id': f"seg_{len(results)}",
-                    'start_time': segment['start_time'],
-                    'end_time': segment['end_time'],
-                    'duration': duration,
-                    'text': segment['text'],
-                    'comprehensive_score': match_score,
-                    'score_details': score_details,
-                    'context': segment.get('context', {})
-                }
-
-                if segment.get('joke', False):
-                    result['joke_info'] = {
-                        'joke_topics': segment.get('joke_topics', []),
-                        'laughter_score': segment.get('laughter_score', 0)
-                    }
+        Returns:
+            SegmentHits for the matching segments, only the ``top_k`` best when
+            given (see _build_result), and the number of matching segments
+        """
+        segments = episode_data.get('segments', [])
+        if not segments:
+            return [], 0
+        if scorer is None:
+            scorer = _compile_criteria(criteria)
+
+        # Segment features are lowercased once at index load
+        features = episode_data.get('_features')
+        if features is None:
+            features = SegmentFeatures(segments)
+
+        # Hit numbers count every match, so they are assigned before the cut
+        scored = scorer(features)
+        numbered = enumerate(scored)
+        if top_k is not None and len(scored) > top_k:
+            numbered = sorted(heapq.nlargest(top_k, numbered, key=lambda item: item[1][1]))
+
+        hits = [
+            SegmentHit(match_score, episode_id, i, hit_number, score_details)
+            for hit_number, (i, match_score, score_details) in numbered
+        ]
+        return hits, len(scored)
+
+    def _build_result(self, hit: SegmentHit, episode_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the detailed result record of a segment hit."""
+        segment = episode_data['segments'][hit.segment_id]
+        result = {
+            'segment_id': f"seg_{hit.hit_number}",
+            'start_time': segment['start_time'],
+            'end_time': segment['end_time'],
+            'duration': segment['end_time'] - segment['start_time'],
+            'text': segment['text'],
+            'comprehensive_score': hit.score,
+            'score_details': hit.score_details,
+            'context': copy.deepcopy(segment.get('context', {}))
+        }
 
-                results.append(result)
+        if segment.get('joke', False):
+            result['joke_info'] = {
+                'joke_topics': list(segment.get('joke_topics', [])),
+                'laughter_score': segment.get('laughter_score', 0)
+            }
 
-        return results
+        result['episode_id'] = hit.episode_id
+        result['episode_title'] = episode_data.get('title', 'Untitled Episode')
+        return result
 
     def _format_results(self, results: List[Dict[str, Any]], format_type: str) -> List[Dict[str, Any]]:
         """Format results according to specified format."""
         if format_type == 'summary':
             return [{
-                'segment_id': r['segment_id'],
-                'start_time': r['start_time'],
-                'end_time': r['end_time'],
-                'score': r['comprehensive_score'],
-                'text_preview': r['text'][:50] + '...'
-            } for r in results]
+                'segment_id': segment_id,
+                'start_time': start_time,
+                'end_time': end_time,
+                'score': score,
+                'text_preview': text[:50] + '...'
+            } for segment_id, start_time, end_time, score, text in map(_SUMMARY_FIELDS, results)]
 
         elif format_type == 'timestamps':
             return [{
-                'segment_id': r['segment_id'],
-                'timestamps': f"{r['start_time']:.1f}-{r['end_time']:.1f}",
-                'score': r['comprehensive_score']
-            } for r in results]
+                'segment_id': segment_id,
+                'timestamps': f"{start_time:.1f}-{end_time:.1f}",
+                'score': score
+            } for segment_id, start_time, end_time, score in map(_TIMESTAMP_FIELDS, results)]
 
         else:  # detailed
             return results
 
-    def _parse_time(self, time_str: str) -> float:
-        """Convert time string to seconds."""
-        try:
-            parts = time_str.split(':')
-            if len(parts) == 3:
-                return float(parts[0]) * 3600 + float(parts[1]) * 60 + float(parts[2])
-            elif len(parts) == 2:
-                return float(parts[0]) * 60 + float(parts[1])
-            else:
-                return float(parts[0])
-        except:
-            return 0.0
+_INDEX_MANAGEMENT_SCHEMA = _freeze_schema({
+    'type': 'object',
+    'required': ['operation'],
+    'properties': {
+        'operation': {
+            'type': 'string',
+            'enum': ['create', 'update', 'optimize', 'status', 'delete'],
+            'description': 'Index operation to perform'
+        },
+        'index_type': {
+            'type': 'string',
+            'enum': ['topic', 'joke', 'context', 'timestamp', 'location', 'comprehensive'],
+            'description': 'Type of index to manage'
+        },
+        'episode_ids': {
+            'type': 'array',
+            'items': {'type': 'string'},
+            'description': 'Episode IDs to include in index'
+        },
+        'force_rebuild': {
+            'type': 'boolean',
+            'default': False,
+            'description': 'Force complete rebuild of index'
+        },
+        'index_name': {
+            'type': 'string',
+            'description': 'Name for the index'
+        }
+    }
+})
 
 class SearchIndexManagementTool(RobustTool):
     """Tool for creating and managing search indexes."""
 
+    # Known indexes by name (mock registry); shared by every instance and
+    # changed in place by the management operations
+    # In a real implementation, this would be a database or file system
+    _MOCK_INDEXES: Dict[str, Dict[str, Any]] = {
+        'comprehensive_index_123': {
+            'index_name': 'comprehensive_index_123',
+            'index_type': 'comprehensive',
+            'episode_count': 50,
+            'created_at': '2024-01-01T00:00:00Z',
+            'status': 'active'
+        },
+        'joke_index_456': {
+            'index_name': 'joke_index_456',
+            'index_type': 'joke',
+            'episode_count': 20,
+            'created_at': '2024-01-05T10:00:00Z',
+            'status': 'active'
+        }
+    }
+
+    # Supported query types per index type; read-only and shared
+    _QUERY_TYPES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+        'topic': ('topic_search', 'keyword_search'),
+        'joke': ('joke_search', 'humor_search'),
+        'context': ('context_search', 'scene_search'),
+        'timestamp': ('timestamp_search', 'time_range_search'),
+        'location': ('location_search', 'scene_search'),
+        'comprehensive': ('topic_search', 'joke_search', 'context_search',
+                          'timestamp_search', 'location_search', 'advanced_search')
+    })
+
     def __init__(self):
         super().__init__(
             name="search_index_management",
@@ -1676,36 +2698,8 @@ class SearchIndexManagementTool(RobustTool):
 
     def _define_validation_schema(self) -> Dict[str, Any]:
         """Define validation schema for search index management."""
-        return {
-            'type': 'object',
-            'required': ['operation'],
-            'properties': {
-                'operation': {
-                    'type': 'string',
-                    'enum': ['create', 'update', 'optimize', 'status', 'delete'],
-                    'description': 'Index operation to perform'
-                },
-                'index_type': {
-                    'type': 'string',
-                    'enum': ['topic', 'joke', 'context', 'timestamp', 'location', 'comprehensive'],
-                    'description': 'Type of index to manage'
-                },
-                'episode_ids': {
-                    'type': 'array',
-                    'items': {'type': 'string'},
-                    'description': 'Episode IDs to include in index'
-                },
-                'force_rebuild': {
-                    'type': 'boolean',
-                    'default': False,
-                    'description': 'Force complete rebuild of index'
-                },
-                'index_name': {
-                    'type': 'string',
-                    'description': 'Name for the index'
-                }
-            }
-        }
+        return _INDEX_MANAGEMENT_SCHEMA
+
 
     def _define_fallback_strategies(self) -> List[Dict[str, Any]]:
         """Define fallback strategies."""
@@ -1718,23 +2712,36 @@ class SearchIndexManagementTool(RobustTool):
         episode_ids = parameters.get('episode_ids', [])
         force_rebuild = parameters.get('force_rebuild', False)
         index_name = parameters.get('index_name', f"{index_type}_index_{execution_id}")
+        # One timestamp for everything this operation records
+        now = datetime.now().isoformat()
 
         if operation == 'create':
-            return self._create_index(index_type, episode_ids, index_name, force_rebuild)
+            # Only named indexes are registered; anonymous ones could never be
+            # looked up again and would accumulate in the shared registry
+            persist = 'index_name' in parameters
+            result = self._create_index(index_type, episode_ids, index_name, force_rebuild, now, persist)
         elif operation == 'update':
-            return self._update_index(index_type, episode_ids, index_name)
+            result = self._update_index(index_type, episode_ids, index_name, now)
         elif operation == 'optimize':
-            return self._optimize_index(index_type, index_name)
+            result = self._optimize_index(index_type, index_name, now)
         elif operation == 'status':
             return self._get_index_status(index_type, index_name)
         elif operation == 'delete':
-            return self._delete_index(index_name)
+            result = self._delete_index(index_name)
         else:
             raise ValueError(f"Unknown operation: {operation}")
 
+        # Cached search results may describe the index as it was before this change
+        if result.get('status') == 'success':
+            _SEARCH_RESULTS.invalidate()
+        return result
+
     def _create_index(self, index_type: str, episode_ids: List[str], index_name: str,
-                     force_rebuild: bool) -> Dict[str, Any]:
-        """Create a new search index."""
+                     force_rebuild: bool, now: str, persist: bool = True) -> Dict[str, Any]:
+        """Create a new search index, stamped with the ISO time ``now``.
+
+        The index is added to the shared registry only when ``persist`` is set.
+        """
         # Check if index already exists
         existing_index = self._check_existing_index(index_name)
         if existing_index and not force_rebuild:
@@ -1743,7 +2750,7 @@ class SearchIndexManagementTool(RobustTool):
                 'index_name': index_name,
                 'index_type': index_type,
                 'message': 'Index already exists',
-                'existing_index': existing_index
+                'existing_index': dict(existing_index)
             }
 
         # Simulate index creation
@@ -1751,21 +2758,24 @@ class SearchIndexManagementTool(RobustTool):
             'index_name': index_name,
             'index_type': index_type,
             'episode_count': len(episode_ids) if episode_ids else 10,
-            'created_at': datetime.now().isoformat(),
+            'created_at': now,
             'status': 'created',
             'size': '1.2MB',
             'query_types': self._get_query_types_for_index(index_type)
         }
+        if persist:
+            self._MOCK_INDEXES[index_name] = index_data
 
         return {
             'operation': 'create',
             'status': 'success',
-            'index': index_data,
+            'index': dict(index_data),
             'message': f'Successfully created {index_type} index'
         }
 
-    def _update_index(self, index_type: str, episode_ids: List[str], index_name: str) -> Dict[str, Any]:
-        """Update an existing search index."""
+    def _update_index(self, index_type: str, episode_ids: List[str], index_name: str,
+                      now: str) -> Dict[str, Any]:
+        """Update an existing search index, stamped with the ISO time ``now``."""
         # Check if index exists
         existing_index = self._check_existing_index(index_name)
         if not existing_index:
@@ -1776,21 +2786,21 @@ class SearchIndexManagementTool(RobustTool):
             }
 
         # Simulate index update
-        updated_index = existing_index.copy()
-        updated_index['last_updated'] = datetime.now().isoformat()
+        updated_index = existing_index
+        updated_index['last_updated'] = now
         updated_index['episode_count'] += len(episode_ids)
         updated_index['status'] = 'updated'
 
         return {
             'operation': 'update',
             'status': 'success',
-            'index': updated_index,
+            'index': dict(updated_index),
             'message': f'Successfully updated {index_type} index',
             'episodes_added': len(episode_ids)
         }
 
-    def _optimize_index(self, index_type: str, index_name: str) -> Dict[str, Any]:
-        """Optimize an existing search index."""
+    def _optimize_index(self, index_type: str, index_name: str, now: str) -> Dict[str, Any]:
+        """Optimize an existing search index, stamped with the ISO time ``now``."""
         # Check if index exists
         existing_index = self._check_existing_index(index_name)
         if not existing_index:
@@ -1801,15 +2811,15 @@ class SearchIndexManagementTool(RobustTool):
             }
 
         # Simulate optimization
-        optimized_index = existing_index.copy()
-        optimized_index['last_optimized'] = datetime.now().isoformat()
+        optimized_index = existing_index
+        optimized_index['last_optimized'] = now
         optimized_index['optimization_level'] = 'high'
         optimized_index['query_performance'] = 'improved'
 
         return {
             'operation': 'optimize',
             'status': 'success',
-            'index': optimized_index,
+            'index': dict(optimized_index),
             'message': f'Successfully optimized {index_type} index',
             'performance_improvement': '25% faster queries'
         }
@@ -1843,8 +2853,8 @@ class SearchIndexManagementTool(RobustTool):
 
     def _delete_index(self, index_name: str) -> Dict[str, Any]:
         """Delete an existing search index."""
-        # Check if index exists
-        existing_index = self._check_existing_index(index_name)
+        # Remove the index if it exists
+        existing_index = self._MOCK_INDEXES.pop(index_name, None)
         if not existing_index:
             return {
                 'status': 'error',
@@ -1862,38 +2872,11 @@ class SearchIndexManagementTool(RobustTool):
 
     def _check_existing_index(self, index_name: str) -> Optional[Dict[str, Any]]:
         """Check if index exists (mock implementation)."""
-        # In a real implementation, this would check a database or file system
-        mock_indexes = {
-            'comprehensive_index_123': {
-                'index_name': 'comprehensive_index_123',
-                'index_type': 'comprehensive',
-                'episode_count': 50,
-                'created_at': '2024-01-01T00:00:00Z',
-                'status': 'active'
-            },
-            'joke_index_456': {
-                'index_name': 'joke_index_456',
-                'index_type': 'joke',
-                'episode_count': 20,
-                'created_at': '2024-01-05T10:00:00Z',
-                'status': 'active'
-            }
-        }
-
-        return mock_indexes.get(index_name)
+        return self._MOCK_INDEXES.get(index_name)
 
-    def _get_query_types_for_index(self, index_type: str) -> List[str]:
+    def _get_query_types_for_index(self, index_type: str) -> Tuple[str, ...]:
         """Get supported query types for index type."""
-        query_types = {
-            'topic': ['topic_search', 'keyword_search'],
-            'joke': ['joke_search', 'humor_search'],
-            'context': ['context_search', 'scene_search'],
-            'timestamp': ['timestamp_search', 'time_range_search'],
-            'location': ['location_search', 'scene_search'],
-            'comprehensive': ['topic_search', 'joke_search', 'context_search',
-                            'timestamp_search', 'location_search', 'advanced_search']
-        }
-        return query_types.get(index_type, [])
+        return self._QUERY_TYPES.get(index_type, ())
 
 if __name__ == "__main__":
     # Example usage
@@ -14,16 +14,21 @@ This module provides an enhanced base agent class that integrates:
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import inspect
 import json
 import logging
+import os
+import threading
 import time
 import uuid
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 # Import all the modern AI frameworks
 try:
@@ -72,6 +77,13 @@ try:
     except ImportError:
         OPENTELEMETRY_AVAILABLE = False
 
+    # Prefer the gRPC exporter when its extra is installed
+    try:
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter as GrpcOTLPSpanExporter
+        OTLP_GRPC_AVAILABLE = True
+    except ImportError:
+        OTLP_GRPC_AVAILABLE = False
+
     # LangFuse imports
     try:
         from langfuse import Langfuse
@@ -85,9 +97,109 @@ try:
     from agents.robust_tool import RobustTool, ToolResult
 
 except ImportError as e:
-    logging.warning(f"Failed to import some AI frameworks: {e}")
+    logging.warning("Failed to import some AI frameworks: %s", e)
     logging.warning("Some features may be limited, but core functionality will still work.")
 
+# Frameworks tried by execute_task("auto"), most preferred first
+AUTO_FRAMEWORK_ORDER = ('langgraph', 'crewai', 'langchain')
+
+# LangChain invocations arriving within this many seconds of each other are
+# sent to the executor as one abatch call of at most LANGCHAIN_MAX_BATCH inputs
+LANGCHAIN_BATCH_WINDOW = 0.01
+LANGCHAIN_MAX_BATCH = 8
+
+# Lazily built agent attribute backing each executable framework
+FRAMEWORK_INTEGRATIONS = {
+    'langchain': 'langchain_agent',
+    'crewai': 'crewai_agent',
+    'langgraph': 'langgraph_workflow',
+}
+
+# BatchSpanProcessor settings sized for bursts of per-tool spans; each can be
+# overridden with the matching OTEL_BSP_* environment variable
+SPAN_PROCESSOR_DEFAULTS = {
+    'max_queue_size': ('OTEL_BSP_MAX_QUEUE_SIZE', 4096),
+    'schedule_delay_millis': ('OTEL_BSP_SCHEDULE_DELAY', 1000),
+    'max_export_batch_size': ('OTEL_BSP_MAX_EXPORT_BATCH_SIZE', 256),
+    'export_timeout_millis': ('OTEL_BSP_EXPORT_TIMEOUT', 10000),
+}
+
+def _span_processor_settings() -> Dict[str, int]:
+    """Read BatchSpanProcessor settings, ignoring OTEL_BSP_* values that are not integers."""
+    settings = {}
+    for param, (env_var, default) in SPAN_PROCESSOR_DEFAULTS.items():
+        value = os.environ.get(env_var)
+        try:
+            settings[param] = default if value is None else int(value)
+        except ValueError:
+            logging.warning("Ignoring invalid %s=%r, using %d", env_var, value, default)
+            settings[param] = default
+    return settings
+
+def _create_span_processor() -> BatchSpanProcessor:
+    """Create the OTLP span processor shared by agents and the orchestrator.
+
+    Uses the gRPC exporter when available and falls back to OTLP over HTTP.
+    """
+    if OTLP_GRPC_AVAILABLE:
+        otlp_exporter = GrpcOTLPSpanExporter(endpoint="http://localhost:4317")
+    else:
+        otlp_exporter = OTLPSpanExporter(endpoint="http://localhost:4318/v1/traces")
+
+    return BatchSpanProcessor(otlp_exporter, **_span_processor_settings())
+
+@lru_cache(maxsize=1)
+def _framework_executor() -> ThreadPoolExecutor:
+    """Shared worker pool for running blocking framework executions concurrently."""
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix='enhanced-agent')
+
+_background_loop_lock = threading.Lock()
+_background_loop_instance: Optional[asyncio.AbstractEventLoop] = None
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Event loop kept running on a daemon thread for async framework calls.
+
+    Reusing one loop avoids per-call loop setup and lets client connection
+    pools bound to it persist across calls. Guarded by a lock because the
+    first calls can arrive from several worker threads at once.
+    """
+    global _background_loop_instance
+    with _background_loop_lock:
+        if _background_loop_instance is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='enhanced-agent-loop', daemon=True).start()
+            _background_loop_instance = loop
+        return _background_loop_instance
+
+def _run_coroutine(coro: Awaitable[Any]) -> Any:
+    """Run a coroutine to completion from synchronous code.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+
+    Raises:
+        RuntimeError: If called from a coroutine running on the background loop
+    """
+    loop = _background_loop()
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+
+    # Waiting on the background loop from inside it would block every other
+    # call sharing the loop, so nested use has to await the coroutine instead
+    if running_loop is loop:
+        coro.close()
+        raise RuntimeError(
+            "Synchronous agent methods cannot be called from the agent event loop; "
+            "await the async variant (e.g. execute_with_langgraph or "
+            "execute_enhanced_workflow_async) instead"
+        )
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
 # Enhanced Agent Tool with LangChain integration
 class EnhancedAgentTool(AgentTool):
     """Agent tool that integrates with LangChain and other frameworks."""
@@ -101,13 +213,40 @@ class EnhancedAgentTool(AgentTool):
             config: Optional tool configuration
         """
         super().__init__(name, description, config)
-        self.langchain_tool = None
-        self.crewai_tool = None
-        self.langgraph_node = None
+        # Framework wrappers are built on first access and reused afterwards
+        self._langchain_tool = None
+        self._langchain_func = None
+        self._crewai_tool = None
+        self._crewai_func = None
+        self._langgraph_node = None
+
+    @property
+    def langchain_tool(self) -> LangChainBaseTool:
+        """LangChain wrapper around this tool's execute, built on first access."""
+        if self._langchain_tool is None:
+            self.create_langchain_tool(self.execute)
+        return self._langchain_tool
+
+    @property
+    def crewai_tool(self) -> Optional[CrewAIBaseTool]:
+        """CrewAI wrapper around this tool's execute, or None without CrewAI."""
+        if self._crewai_tool is None:
+            self.create_crewai_tool(self.execute)
+        return self._crewai_tool
+
+    @property
+    def langgraph_node(self) -> Optional[ToolNode]:
+        """LangGraph node for this tool, or None without LangGraph."""
+        if self._langgraph_node is None:
+            self.create_langgraph_node()
+        return self._langgraph_node
 
     def create_langchain_tool(self, func: Callable, return_direct: bool = False) -> LangChainBaseTool:
         """Create a LangChain tool from a function.
 
+        The wrapper is cached, so repeated calls with the same function return
+        the existing tool instead of re-decorating it.
+
         Args:
             func: Function to wrap as a tool
             return_direct: Whether to return tool output directly
@@ -115,6 +254,9 @@ class EnhancedAgentTool(AgentTool):
         Returns:
             LangChain tool instance
         """
+        if self._langchain_tool is not None and self._langchain_func == func:
+            return self._langchain_tool
+
         from langchain_core.tools import tool
 
         @tool
@@ -122,8 +264,10 @@ class EnhancedAgentTool(AgentTool):
             """LangChain tool wrapper."""
             return func(*args, **kwargs)
 
-        self.langchain_tool = langchain_tool_wrapper
-        return self.langchain_tool
+        self._langchain_tool = langchain_tool_wrapper
+        self._langchain_func = func
+        self._langgraph_node = None
+        return self._langchain_tool
 
     def create_crewai_tool(self, func: Callable) -> Optional[CrewAIBaseTool]:
         """Create a CrewAI tool from a function.
@@ -137,13 +281,16 @@ class EnhancedAgentTool(AgentTool):
         if not CREWAI_AVAILABLE:
             return None
 
-        crewai_tool = CrewAIBaseTool(
+        if self._crewai_tool is not None and self._crewai_func == func:
+            return self._crewai_tool
+
+        self._crewai_tool = CrewAIBaseTool(
             name=self.name,
             description=self.description,
             func=func
         )
-        self.crewai_tool = crewai_tool
-        return crewai_tool
+        self._crewai_func = func
+        return self._crewai_tool
 
     def create_langgraph_node(self) -> Optional[ToolNode]:
         """Create a LangGraph node from this tool.
@@ -151,17 +298,49 @@ class EnhancedAgentTool(AgentTool):
         Returns:
             LangGraph ToolNode or None if LangGraph not available
         """
-        if not LANGRAPH_AVAILABLE or not self.langchain_tool:
+        if not LANGRAPH_AVAILABLE:
             return None
 
-        node = ToolNode([self.langchain_tool])
-        self.langgraph_node = node
-        return node
+        if self._langgraph_node is None:
+            self._langgraph_node = ToolNode([self.langchain_tool])
+        return self._langgraph_node
 
 # Enhanced Base Agent with all frameworks
 class EnhancedBaseAgent(BaseAgent):
     """Enhanced base agent with all modern AI frameworks integrated."""
 
+    # Chat clients shared by every agent, keyed by (model, temperature), so their
+    # HTTP connection pools are reused instead of reopened per agent
+    _llm_cache: Dict[Tuple[str, Optional[float]], BaseLanguageModel] = {}
+
+    # Import-time framework availability; each agent copies it so failed
+    # initializations can be recorded per agent
+    _FRAMEWORK_SUPPORT = {
+        'langchain': True,
+        'crewai': CREWAI_AVAILABLE,
+        'langgraph': LANGRAPH_AVAILABLE,
+        'opentelemetry': OPENTELEMETRY_AVAILABLE,
+        'langfuse': LANGFUSE_AVAILABLE
+    }
+
+    @classmethod
+    def _get_llm(cls, model: str, temperature: Optional[float] = None) -> BaseLanguageModel:
+        """Get the shared chat client for a model, creating it on first use.
+
+        Args:
+            model: Model name
+            temperature: Sampling temperature, or None for the client default
+
+        Returns:
+            Shared ChatOpenAI instance
+        """
+        key = (model, temperature)
+        llm = cls._llm_cache.get(key)
+        if llm is None:
+            kwargs = {} if temperature is None else {"temperature": temperature}
+            llm = cls._llm_cache.setdefault(key, ChatOpenAI(model=model, **kwargs))
+        return llm
+
     def __init__(self, agent_name: str, config_path: Optional[str] = None):
         """Initialize the enhanced agent.
 
@@ -171,72 +350,95 @@ class EnhancedBaseAgent(BaseAgent):
         """
         super().__init__(agent_name, config_path)
 
-        # Initialize framework integrations
-        self.langchain_agent = None
-        self.crewai_agent = None
-        self.langgraph_workflow = None
-        self.telemetry_tracer = None
-        self.langfuse_handler = None
+        # Framework integrations are bootstrapped on first use; an entry is
+        # switched off here if its initialization fails
+        self.frameworks_available = dict(self._FRAMEWORK_SUPPORT)
 
-        # Initialize framework availability
-        self.frameworks_available = {
-            'langchain': True,
-            'crewai': CREWAI_AVAILABLE,
-            'langgraph': LANGRAPH_AVAILABLE,
-            'opentelemetry': OPENTELEMETRY_AVAILABLE,
-            'langfuse': LANGFUSE_AVAILABLE
-        }
+        # LangChain micro-batching state, owned by the background event loop
+        self._langchain_queue: Optional[asyncio.Queue] = None
+        self._langchain_batcher: Optional[asyncio.Task] = None
 
-        # Initialize observability
-        self._initialize_observability()
+        self.logger.info("Initialized enhanced agent '%s' with frameworks: %s", self.name, self.frameworks_available)
 
-        # Initialize LangChain agent
-        self._initialize_langchain_agent()
+    @cached_property
+    def telemetry_tracer(self) -> Optional[Any]:
+        """OpenTelemetry tracer, initialized on first use."""
+        return self._initialize_tracing()
 
-        # Initialize CrewAI agent
-        self._initialize_crewai_agent()
+    @cached_property
+    def langfuse_handler(self) -> Optional[Any]:
+        """LangFuse callback handler, initialized on first use."""
+        return self._initialize_langfuse()
 
-        # Initialize LangGraph workflow
-        self._initialize_langgraph_workflow()
+    @cached_property
+    def langchain_agent(self) -> Optional[Any]:
+        """LangChain agent executor, initialized on first use."""
+        return self._initialize_langchain_agent()
 
-        self.logger.info(f"Initialized enhanced agent '{self.name}' with frameworks: {self.frameworks_available}")
+    @cached_property
+    def crewai_agent(self) -> Optional[Any]:
+        """CrewAI agent, initialized on first use."""
+        return self._initialize_crewai_agent()
 
-    def _initialize_observability(self) -> None:
-        """Initialize OpenTelemetry and LangFuse for observability."""
-        # Initialize OpenTelemetry
-        if OPENTELEMETRY_AVAILABLE:
-            try:
-                trace.set_tracer_provider(TracerProvider())
-                otlp_exporter = OTLPSpanExporter(endpoint="http://localhost:4318/v1/traces")
-                span_processor = BatchSpanProcessor(otlp_exporter)
-                trace.get_tracer_provider().add_span_processor(span_processor)
-                self.telemetry_tracer = trace.get_tracer(__name__)
-                self.logger.info("OpenTelemetry tracing initialized")
-            except Exception as e:
-                self.logger.error(f"Failed to initialize OpenTelemetry: {e}")
-                self.frameworks_available['opentelemetry'] = False
+    @cached_property
+    def langgraph_workflow(self) -> Optional[Any]:
+        """Compiled LangGraph workflow, initialized on first use."""
+        return self._initialize_langgraph_workflow()
 
-        # Initialize LangFuse
-        if LANGFUSE_AVAILABLE:
-            try:
-                self.langfuse_handler = CallbackHandler(
-                    public_key="your-public-key",
-                    secret_key="your-secret-key",
-                    host="https://cloud.langfuse.com"
-                )
-                self.logger.info("LangFuse analytics initialized")
-            except Exception as e:
-                self.logger.error(f"Failed to initialize LangFuse: {e}")
-                self.frameworks_available['langfuse'] = False
+    def _initialize_tracing(self) -> Optional[Any]:
+        """Initialize OpenTelemetry tracing.
 
-    def _initialize_langchain_agent(self) -> None:
-        """Initialize LangChain agent with tools."""
+        Returns:
+            Tracer, or None if OpenTelemetry is unavailable
+        """
+        if not OPENTELEMETRY_AVAILABLE:
+            return None
+
+        try:
+            trace.set_tracer_provider(TracerProvider())
+            trace.get_tracer_provider().add_span_processor(_create_span_processor())
+            tracer = trace.get_tracer(__name__)
+            self.logger.info("OpenTelemetry tracing initialized")
+            return tracer
+        except Exception as e:
+            self.logger.error("Failed to initialize OpenTelemetry: %s", e)
+            self.frameworks_available['opentelemetry'] = False
+            return None
+
+    def _initialize_langfuse(self) -> Optional[Any]:
+        """Initialize LangFuse analytics.
+
+        Returns:
+            Callback handler, or None if LangFuse is unavailable
+        """
+        if not LANGFUSE_AVAILABLE:
+            return None
+
+        try:
+            handler = CallbackHandler(
+                public_key="your-public-key",
+                secret_key="your-secret-key",
+                host="https://cloud.langfuse.com"
+            )
+            self.logger.info("LangFuse analytics initialized")
+            return handler
+        except Exception as e:
+            self.logger.error("Failed to initialize LangFuse: %s", e)
+            self.frameworks_available['langfuse'] = False
+            return None
+
+    def _initialize_langchain_agent(self) -> Optional[Any]:
+        """Initialize LangChain agent with tools.
+
+        Returns:
+            Agent executor, or None if initialization failed
+        """
         try:
             # Create LangChain tools from our agent tools
             langchain_tools = []
             for tool_name, agent_tool in self.tools.items():
                 if isinstance(agent_tool, EnhancedAgentTool):
-                    langchain_tool = agent_tool.create_langchain_tool(agent_tool.execute)
+                    langchain_tool = agent_tool.langchain_tool
                     if langchain_tool:
                         langchain_tools.append(langchain_tool)
 
@@ -252,7 +454,7 @@ class EnhancedBaseAgent(BaseAgent):
             from langchain.agents import create_openai_functions_agent
             from langchain.agents.agent import AgentExecutor
 
-            llm = ChatOpenAI(model=self.model, temperature=0)
+            llm = self._get_llm(self.model, temperature=0)
 
             # Create the agent
             agent = create_openai_functions_agent(
@@ -262,61 +464,73 @@ class EnhancedBaseAgent(BaseAgent):
             )
 
             # Create agent executor
-            self.langchain_agent = AgentExecutor(
+            langchain_agent = AgentExecutor(
                 agent=agent,
                 tools=langchain_tools,
-                verbose=True,
+                verbose=self.logger.isEnabledFor(logging.DEBUG),
                 handle_parsing_errors=True,
                 callbacks=[self.langfuse_handler] if self.langfuse_handler else None
             )
 
-            self.logger.info(f"LangChain agent initialized with {len(langchain_tools)} tools")
+            self.logger.info("LangChain agent initialized with %s tools", len(langchain_tools))
+            return langchain_agent
 
         except Exception as e:
-            self.logger.error(f"Failed to initialize LangChain agent: {e}")
+            self.logger.error("Failed to initialize LangChain agent: %s", e)
             self.frameworks_available['langchain'] = False
+            return None
 
-    def _initialize_crewai_agent(self) -> None:
-        """Initialize CrewAI agent."""
+    def _initialize_crewai_agent(self) -> Optional[Any]:
+        """Initialize CrewAI agent.
+
+        Returns:
+            CrewAI agent, or None if CrewAI is unavailable
+        """
         if not CREWAI_AVAILABLE:
-            return
+            return None
 
         try:
             # Create CrewAI tools from our agent tools
             crewai_tools = []
             for tool_name, agent_tool in self.tools.items():
                 if isinstance(agent_tool, EnhancedAgentTool):
-                    crewai_tool = agent_tool.create_crewai_tool(agent_tool.execute)
+                    crewai_tool = agent_tool.crewai_tool
                     if crewai_tool:
                         crewai_tools.append(crewai_tool)
 
             # Create CrewAI agent
-            self.crewai_agent = Agent(
+            crewai_agent = Agent(
                 role=self.role,
                 goal=self.system_prompt,
                 backstory=f"AI agent specialized in {self.role}",
                 tools=crewai_tools,
-                verbose=True,
+                verbose=self.logger.isEnabledFor(logging.DEBUG),
                 allow_delegation=True
             )
 
-            self.logger.info(f"CrewAI agent initialized with {len(crewai_tools)} tools")
+            self.logger.info("CrewAI agent initialized with %s tools", len(crewai_tools))
+            return crewai_agent
 
         except Exception as e:
-            self.logger.error(f"Failed to initialize CrewAI agent: {e}")
+            self.logger.error("Failed to initialize CrewAI agent: %s", e)
             self.frameworks_available['crewai'] = False
+            return None
 
-    def _initialize_langgraph_workflow(self) -> None:
-        """Initialize LangGraph workflow."""
+    def _initialize_langgraph_workflow(self) -> Optional[Any]:
+        """Initialize LangGraph workflow.
+
+        Returns:
+            Compiled workflow, or None if LangGraph is unavailable
+        """
         if not LANGRAPH_AVAILABLE:
-            return
+            return None
 
         try:
             # Create LangGraph nodes from our tools
             tool_nodes = {}
             for tool_name, agent_tool in self.tools.items():
                 if isinstance(agent_tool, EnhancedAgentTool):
-                    node = agent_tool.create_langgraph_node()
+                    node = agent_tool.langgraph_node
                     if node:
                         tool_nodes[tool_name] = node
 
@@ -340,13 +554,21 @@ class EnhancedBaseAgent(BaseAgent):
             workflow.set_entry_point("human")
 
             # Compile workflow
-            self.langgraph_workflow = workflow.compile()
+            langgraph_workflow = workflow.compile()
 
-            self.logger.info(f"LangGraph workflow initialized with {len(tool_nodes)} tool nodes")
+            self.logger.info("LangGraph workflow initialized with %s tool nodes", len(tool_nodes))
+            return langgraph_workflow
 
         except Exception as e:
-            self.logger.error(f"Failed to initialize LangGraph workflow: {e}")
+            self.logger.error("Failed to initialize LangGraph workflow: %s", e)
             self.frameworks_available['langgraph'] = False
+            return None
+
+    def _execution_span(self, name: str):
+        """Return a tracing span for a framework execution, or a no-op context without a tracer."""
+        if self.telemetry_tracer:
+            return self.telemetry_tracer.start_as_current_span(name)
+        return contextlib.nullcontext()
 
     def execute_with_langchain(self, task: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Execute a task using LangChain agent.
@@ -363,12 +585,11 @@ class EnhancedBaseAgent(BaseAgent):
 
         try:
             # Start observability span
-            if self.telemetry_tracer:
-                with self.telemetry_tracer.start_as_current_span(f"{self.name}_langchain_execution"):
-                    result = self.langchain_agent.invoke({
-                        "input": task,
-                        "chat_history": context.get("chat_history", []) if context else []
-                    })
+            with self._execution_span(f"{self.name}_langchain_execution"):
+                result = _run_coroutine(self._invoke_langchain({
+                    "input": task,
+                    "chat_history": context.get("chat_history", []) if context else []
+                }))
 
             # Update confidence metrics
             success = result.get("output", "").strip() != ""
@@ -382,10 +603,66 @@ class EnhancedBaseAgent(BaseAgent):
             }
 
         except Exception as e:
-            self.logger.error(f"LangChain execution failed: {e}")
+            self.logger.error("LangChain execution failed: %s", e)
             self.update_confidence_after_execution("langchain_execution", False)
             return {"error": str(e), "success": False, "framework": "langchain"}
 
+    async def _invoke_langchain(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Invoke the LangChain agent, coalescing concurrent calls into batches.
+
+        Args:
+            payload: Agent executor input
+
+        Returns:
+            Agent executor output for this payload
+        """
+        # Batching state lives on the background loop; anywhere else, invoke directly
+        if asyncio.get_running_loop() is not _background_loop():
+            return await self.langchain_agent.ainvoke(payload)
+
+        if self._langchain_queue is None:
+            self._langchain_queue = asyncio.Queue()
+
+        future = asyncio.get_running_loop().create_future()
+        self._langchain_queue.put_nowait((payload, future))
+
+        # The batcher exits once the queue is empty, so an idle agent holds no
+        # task; the next invocation starts a fresh one
+        if self._langchain_batcher is None or self._langchain_batcher.done():
+            self._langchain_batcher = asyncio.create_task(self._drain_langchain_queue())
+        return await future
+
+    async def _drain_langchain_queue(self) -> None:
+        """Send queued LangChain invocations as abatch calls until the queue is empty."""
+        loop = asyncio.get_running_loop()
+        queue = self._langchain_queue
+
+        while not queue.empty():
+            batch = [queue.get_nowait()]
+            deadline = loop.time() + LANGCHAIN_BATCH_WINDOW
+            while len(batch) < LANGCHAIN_MAX_BATCH:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            payloads = [payload for payload, _ in batch]
+            try:
+                outputs = await self.langchain_agent.abatch(payloads, return_exceptions=True)
+            except Exception as e:
+                outputs = [e] * len(batch)
+
+            for (_, future), output in zip(batch, outputs):
+                if future.done():
+                    continue
+                if isinstance(output, Exception):
+                    future.set_exception(output)
+                else:
+                    future.set_result(output)
+
     def execute_with_crewai(self, task: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Execute a task using CrewAI agent.
 
@@ -413,13 +690,12 @@ class EnhancedBaseAgent(BaseAgent):
                 agents=[self.crewai_agent],
                 tasks=[crewai_task],
                 process=Process.sequential,
-                verbose=True
+                verbose=self.logger.isEnabledFor(logging.DEBUG)
             )
 
             # Start observability span
-            if self.telemetry_tracer:
-                with self.telemetry_tracer.start_as_current_span(f"{self.name}_crewai_execution"):
-                    result = crew.kickoff()
+            with self._execution_span(f"{self.name}_crewai_execution"):
+                result = crew.kickoff()
 
             # Update confidence metrics
             success = result.strip() != ""
@@ -432,7 +708,7 @@ class EnhancedBaseAgent(BaseAgent):
             }
 
         except Exception as e:
-            self.logger.error(f"CrewAI execution failed: {e}")
+            self.logger.error("CrewAI execution failed: %s", e)
             self.update_confidence_after_execution("crewai_execution", False)
             return {"error": str(e), "success": False, "framework": "crewai"}
 
@@ -451,13 +727,12 @@ class EnhancedBaseAgent(BaseAgent):
 
         try:
             # Start observability span
-            if self.telemetry_tracer:
-                with self.telemetry_tracer.start_as_current_span(f"{self.name}_langgraph_execution"):
-                    # Execute workflow
-                    result = await self.langgraph_workflow.ainvoke({
-                        "messages": [HumanMessage(content=task)],
-                        "context": context or {}
-                    })
+            with self._execution_span(f"{self.name}_langgraph_execution"):
+                # Execute workflow
+                result = await self.langgraph_workflow.ainvoke({
+                    "messages": [HumanMessage(content=task)],
+                    "context": context or {}
+                })
 
             # Update confidence metrics
             success = result.get("messages", [{}])[-1].get("content", "").strip() != ""
@@ -470,7 +745,7 @@ class EnhancedBaseAgent(BaseAgent):
             }
 
         except Exception as e:
-            self.logger.error(f"LangGraph execution failed: {e}")
+            self.logger.error("LangGraph execution failed: %s", e)
             self.update_confidence_after_execution("langgraph_execution", False)
             return {"error": str(e), "success": False, "framework": "langgraph"}
 
@@ -487,17 +762,16 @@ class EnhancedBaseAgent(BaseAgent):
         """
         framework = framework.lower()
 
-        # Auto-select framework based on availability and confidence
+        # Race the available frameworks and keep the first successful answer.
+        # A losing run cannot be interrupted once started, so agents whose
+        # frameworks can call tools try one framework at a time instead
         if framework == "auto":
-            # Try frameworks in order of preference
-            if self.frameworks_available['langgraph']:
-                return self.execute_with_langgraph(task, context)
-            elif self.frameworks_available['crewai']:
-                return self.execute_with_crewai(task, context)
-            elif self.frameworks_available['langchain']:
-                return self.execute_with_langchain(task, context)
-            else:
+            frameworks = self._bootstrap_frameworks(AUTO_FRAMEWORK_ORDER)
+            if not frameworks:
                 return {"error": "No AI frameworks available", "success": False}
+            if len(frameworks) == 1 or self._has_framework_tools():
+                return self._execute_in_order(task, frameworks, context)
+            return _run_coroutine(self._execute_first_success(task, frameworks, context))
 
         # Execute with specified framework
         if framework == "langchain":
@@ -505,10 +779,104 @@ class EnhancedBaseAgent(BaseAgent):
         elif framework == "crewai":
             return self.execute_with_crewai(task, context)
         elif framework == "langgraph":
-            return asyncio.run(self.execute_with_langgraph(task, context))
+            return _run_coroutine(self.execute_with_langgraph(task, context))
         else:
             return {"error": f"Unknown framework: {framework}", "success": False}
 
+    def _bootstrap_frameworks(self, frameworks: Tuple[str, ...]) -> List[str]:
+        """Initialize framework integrations ahead of a concurrent run.
+
+        Builds the shared tracer and each requested integration on the calling
+        thread, so racing executions never initialize them concurrently.
+
+        Args:
+            frameworks: Framework names in order of preference
+
+        Returns:
+            The frameworks whose integrations are usable, in the same order
+        """
+        if self.telemetry_tracer is None:
+            self.logger.debug("Running frameworks without tracing spans")
+
+        return [
+            name for name in frameworks
+            if self.frameworks_available[name]
+            and getattr(self, FRAMEWORK_INTEGRATIONS[name]) is not None
+        ]
+
+    def _has_framework_tools(self) -> bool:
+        """Check whether any of this agent's tools are exposed to the framework integrations."""
+        return any(isinstance(agent_tool, EnhancedAgentTool) for agent_tool in self.tools.values())
+
+    def _execute_in_order(self, task: str, frameworks: List[str],
+                          context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a task on one framework at a time until one succeeds.
+
+        Args:
+            task: Task description
+            frameworks: Framework names in order of preference
+            context: Optional context for the task
+
+        Returns:
+            The first successful result, or the most preferred framework's
+            result when none succeed
+        """
+        first_result = None
+        for name in frameworks:
+            result = self.execute_task(task, name, context)
+            if result.get("success"):
+                return result
+            if first_result is None:
+                first_result = result
+        return first_result
+
+    async def _execute_first_success(self, task: str, frameworks: List[str],
+                                     context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a task on several frameworks at once and return the first success.
+
+        LangChain and CrewAI block on their LLM calls, so they run on the shared
+        framework executor; LangGraph is awaited directly. Once a success arrives
+        the LangGraph run and executor runs that have not started are cancelled.
+        Executor runs already under way cannot be interrupted: they finish in the
+        background and their results are discarded, so only agents without
+        framework tools are raced.
+
+        Args:
+            task: Task description
+            frameworks: Framework names in order of preference
+            context: Optional context for the task
+
+        Returns:
+            The first successful result, or the most preferred framework's
+            result when none succeed
+        """
+        loop = asyncio.get_running_loop()
+        executor = _framework_executor()
+        runners = {
+            'langchain': lambda: loop.run_in_executor(executor, self.execute_with_langchain, task, context),
+            'crewai': lambda: loop.run_in_executor(executor, self.execute_with_crewai, task, context),
+            'langgraph': lambda: self.execute_with_langgraph(task, context),
+        }
+        pending = {asyncio.ensure_future(runners[name]()): name for name in frameworks}
+        results = {}
+
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    name = pending.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        results[name] = {"error": str(e), "success": False, "framework": name}
+                    if results[name].get("success"):
+                        return results[name]
+        finally:
+            for future in pending:
+                future.cancel()
+
+        return results[frameworks[0]]
+
     def get_available_frameworks(self) -> Dict[str, bool]:
         """Get availability status of all frameworks.
 
@@ -520,12 +888,13 @@ class EnhancedBaseAgent(BaseAgent):
     def get_framework_status(self) -> Dict[str, Any]:
         """Get detailed status of all framework integrations.
 
+        Integrations not used yet are initialized here, so availability
+        reflects any initialization failure.
+
         Returns:
             Dictionary with framework status information
         """
-        status = {
-            "agent_name": self.name,
-            "frameworks": self.frameworks_available.copy(),
+        integrations = {
             "langchain_agent": bool(self.langchain_agent),
             "crewai_agent": bool(self.crewai_agent),
             "langgraph_workflow": bool(self.langgraph_workflow),
@@ -534,16 +903,26 @@ class EnhancedBaseAgent(BaseAgent):
                 "langfuse": bool(self.langfuse_handler)
             }
         }
+        status = {
+            "agent_name": self.name,
+            "frameworks": self.frameworks_available.copy(),
+            **integrations
+        }
         return status
 
     def enhanced_execute_tool(self, tool_name: str, parameters: Dict[str, Any],
                             framework: str = "auto") -> Dict[str, Any]:
         """Execute a tool using enhanced framework capabilities.
 
+        The tool always runs directly with the given parameters. In auto mode
+        that result is reported as is; naming a framework additionally has
+        that framework's agent process the call and its result.
+
         Args:
             tool_name: Name of the tool to execute
             parameters: Tool parameters
-            framework: Framework to use for execution
+            framework: Framework to use for execution, or 'auto' to skip
+                the framework round trip
 
         Returns:
             Dictionary with execution results
@@ -551,22 +930,24 @@ class EnhancedBaseAgent(BaseAgent):
         # First execute with base agent
         base_result = super().execute_tool(tool_name, parameters)
 
-        # Enhance with framework capabilities
+        # The caller already chose the tool and its parameters, so auto mode
+        # does not pay for an LLM round trip just to re-plan the same call
         if framework == "auto":
-            # Use the most appropriate framework based on tool type
-            if "search" in tool_name.lower() or "retrieve" in tool_name.lower():
-                framework = "langchain"
-            elif "collaborate" in tool_name.lower() or "team" in tool_name.lower():
-                framework = "crewai"
-            else:
-                framework = "langgraph"
-
-        # Execute with selected framework
-        framework_result = self.execute_task(
-            f"Execute tool {tool_name} with parameters {parameters}",
-            framework=framework,
-            context={"tool_result": base_result.to_dict()}
-        )
+            framework = "direct"
+            framework_result = {
+                "success": base_result.success,
+                "result": base_result.data,
+                "framework": framework
+            }
+            if not base_result.success:
+                framework_result["error"] = base_result.error
+        else:
+            # Execute with selected framework
+            framework_result = self.execute_task(
+                f"Execute tool {tool_name} with parameters {parameters}",
+                framework=framework,
+                context={"tool_result": base_result.to_dict()}
+            )
 
         # Combine results
         return {
@@ -604,12 +985,12 @@ class EnhancedBaseAgent(BaseAgent):
                 prompt = PromptTemplate.from_template(
                     "Execute workflow {workflow_name} with steps: {steps}"
                 )
-                chain = LLMChain(llm=ChatOpenAI(model=self.model), prompt=prompt)
+                chain = LLMChain(llm=self._get_llm(self.model), prompt=prompt)
                 workflow["langchain_chain"] = chain
                 workflow["frameworks_used"].append("langchain")
 
             except Exception as e:
-                self.logger.error(f"Failed to create LangChain workflow: {e}")
+                self.logger.error("Failed to create LangChain workflow: %s", e)
 
         # Create CrewAI workflow
         if self.frameworks_available['crewai']:
@@ -627,7 +1008,7 @@ class EnhancedBaseAgent(BaseAgent):
                 workflow["frameworks_used"].append("crewai")
 
             except Exception as e:
-                self.logger.error(f"Failed to create CrewAI workflow: {e}")
+                self.logger.error("Failed to create CrewAI workflow: %s", e)
 
         # Create LangGraph workflow
         if self.frameworks_available['langgraph']:
@@ -665,7 +1046,7 @@ class EnhancedBaseAgent(BaseAgent):
                 workflow["frameworks_used"].append("langgraph")
 
             except Exception as e:
-                self.logger.error(f"Failed to create LangGraph workflow: {e}")
+                self.logger.error("Failed to create LangGraph workflow: %s", e)
 
         workflow["status"] = "ready" if workflow["frameworks_used"] else "failed"
         return workflow
@@ -673,6 +1054,21 @@ class EnhancedBaseAgent(BaseAgent):
     def execute_enhanced_workflow(self, workflow: Dict[str, Any], inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Execute an enhanced workflow created with create_enhanced_workflow.
 
+        Args:
+            workflow: Workflow definition
+            inputs: Input parameters
+
+        Returns:
+            Dictionary with workflow execution results
+        """
+        return _run_coroutine(self.execute_enhanced_workflow_async(workflow, inputs))
+
+    async def execute_enhanced_workflow_async(self, workflow: Dict[str, Any], inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute an enhanced workflow on all of its frameworks concurrently.
+
+        LangChain and CrewAI block on their LLM calls, so they run on the shared
+        framework executor; LangGraph is awaited directly.
+
         Args:
             workflow: Workflow definition
             inputs: Input parameters
@@ -687,18 +1083,19 @@ class EnhancedBaseAgent(BaseAgent):
             "errors": []
         }
 
-        # Execute with each framework that was used to create the workflow
+        loop = asyncio.get_running_loop()
+        executor = _framework_executor()
+        frameworks = []
+        runs = []
+
+        # Start each framework that was used to create the workflow
         for framework in workflow.get("frameworks_used", []):
             try:
                 if framework == "langchain" and "langchain_chain" in workflow:
-                    langchain_result = workflow["langchain_chain"].run({
+                    run = loop.run_in_executor(executor, workflow["langchain_chain"].run, {
                         "workflow_name": workflow["name"],
                         "steps": str(workflow["steps"])
                     })
-                    results["framework_results"]["langchain"] = {
-                        "success": True,
-                        "result": langchain_result
-                    }
 
                 elif framework == "crewai" and "crewai_tasks" in workflow:
                     crew = Crew(
@@ -706,28 +1103,37 @@ class EnhancedBaseAgent(BaseAgent):
                         tasks=workflow["crewai_tasks"],
                         process=Process.sequential
                     )
-                    crewai_result = crew.kickoff()
-                    results["framework_results"]["crewai"] = {
-                        "success": True,
-                        "result": crewai_result
-                    }
+                    run = loop.run_in_executor(executor, crew.kickoff)
 
                 elif framework == "langgraph" and "langgraph_workflow" in workflow:
-                    langgraph_result = asyncio.run(workflow["langgraph_workflow"].ainvoke({
+                    run = workflow["langgraph_workflow"].ainvoke({
                         "messages": [HumanMessage(content=f"Execute workflow {workflow['name']}")]
-                    }))
-                    results["framework_results"]["langgraph"] = {
-                        "success": True,
-                        "result": langgraph_result
-                    }
+                    })
+
+                else:
+                    continue
 
             except Exception as e:
+                # Surface setup failures alongside the framework's own errors
+                run = loop.create_future()
+                run.set_exception(e)
+
+            frameworks.append(framework)
+            runs.append(run)
+
+        for framework, outcome in zip(frameworks, await asyncio.gather(*runs, return_exceptions=True)):
+            if isinstance(outcome, Exception):
                 results["framework_results"][framework] = {
                     "success": False,
-                    "error": str(e)
+                    "error": str(outcome)
                 }
                 results["success"] = False
-                results["errors"].append(f"{framework}: {str(e)}")
+                results["errors"].append(f"{framework}: {str(outcome)}")
+            else:
+                results["framework_results"][framework] = {
+                    "success": True,
+                    "result": outcome
+                }
 
         return results
 
@@ -745,7 +1151,7 @@ class EnhancedBaseAgent(BaseAgent):
             **framework_status,
             "enhanced_capabilities": {
                 "multi_framework_execution": True,
-                "observability_integration": any([self.telemetry_tracer, self.langfuse_handler]),
+                "observability_integration": any(framework_status["observability"].values()),
                 "workflow_orchestration": any([
                     self.frameworks_available['langchain'],
                     self.frameworks_available['crewai'],
@@ -772,26 +1178,14 @@ class EnhancedToolBasedAgent(EnhancedBaseAgent):
             tool_description = tool_config["description"]
             tool_params_config = tool_config.get("parameters", {})
 
-            # Create enhanced agent tool wrapper
-            enhanced_tool = EnhancedAgentTool(
+            # Create enhanced agent tool wrapper; framework wrappers are built
+            # lazily when the framework integrations first ask for them
+            tools[tool_name] = EnhancedAgentTool(
                 name=tool_name,
                 description=tool_description,
                 config=tool_params_config
             )
 
-            # Create LangChain tool
-            enhanced_tool.create_langchain_tool(enhanced_tool.execute)
-
-            # Create CrewAI tool if available
-            if CREWAI_AVAILABLE:
-                enhanced_tool.create_crewai_tool(enhanced_tool.execute)
-
-            # Create LangGraph node if available
-            if LANGRAPH_AVAILABLE:
-                enhanced_tool.create_langgraph_node()
-
-            tools[tool_name] = enhanced_tool
-
         return tools
 
 # Enhanced Workflow Orchestrator
@@ -828,12 +1222,10 @@ class EnhancedWorkflowOrchestrator:
         if OPENTELEMETRY_AVAILABLE:
             try:
                 trace.set_tracer_provider(TracerProvider())
-                otlp_exporter = OTLPSpanExporter(endpoint="http://localhost:4318/v1/traces")
-                span_processor = BatchSpanProcessor(otlp_exporter)
-                trace.get_tracer_provider().add_span_processor(span_processor)
+                trace.get_tracer_provider().add_span_processor(_create_span_processor())
                 self.telemetry_tracer = trace.get_tracer(__name__)
             except Exception as e:
-                logging.error(f"Failed to initialize OpenTelemetry for orchestrator: {e}")
+                logging.error("Failed to initialize OpenTelemetry for orchestrator: %s", e)
 
         if LANGFUSE_AVAILABLE:
             try:
@@ -843,7 +1235,7 @@ class EnhancedWorkflowOrchestrator:
                     host="https://cloud.langfuse.com"
                 )
             except Exception as e:
-                logging.error(f"Failed to initialize LangFuse for orchestrator: {e}")
+                logging.error("Failed to initialize LangFuse for orchestrator: %s", e)
 
     def get_enhanced_agent(self, agent_name: str) -> EnhancedBaseAgent:
         """Get or create an enhanced agent instance.
@@ -929,7 +1321,7 @@ class EnhancedWorkflowOrchestrator:
 
             # Stop on failure
             if not step_result.get("success"):
-                logging.error(f"Workflow {workflow_name} failed at step {step_key}")
+                logging.error("Workflow %s failed at step %s", workflow_name, step_key)
                 break
 
         workflow_success = all(r.get("success", False) for r in results.values())
@@ -999,11 +1391,11 @@ class EnhancedWorkflowOrchestrator:
                 prompt = PromptTemplate.from_template(
                     "Execute multi-framework workflow {workflow_name} with steps: {steps}"
                 )
-                chain = LLMChain(llm=ChatOpenAI(model="gpt-4o"), prompt=prompt)
+                chain = LLMChain(llm=EnhancedBaseAgent._get_llm("gpt-4o"), prompt=prompt)
                 workflow["frameworks"]["langchain"] = chain
 
             except Exception as e:
-                logging.error(f"Failed to create LangChain workflow: {e}")
+                logging.error("Failed to create LangChain workflow: %s", e)
 
         # Create CrewAI version
         if CREWAI_AVAILABLE:
@@ -1022,7 +1414,7 @@ class EnhancedWorkflowOrchestrator:
                 }
 
             except Exception as e:
-                logging.error(f"Failed to create CrewAI workflow: {e}")
+                logging.error("Failed to create CrewAI workflow: %s", e)
 
         # Create LangGraph version
         if LANGRAPH_AVAILABLE:
@@ -1059,7 +1451,7 @@ class EnhancedWorkflowOrchestrator:
                 workflow["frameworks"]["langgraph"] = graph.compile()
 
             except Exception as e:
-                logging.error(f"Failed to create LangGraph workflow: {e}")
+                logging.error("Failed to create LangGraph workflow: %s", e)
 
         return workflow
 
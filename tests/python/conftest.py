@@ -0,0 +1,18 @@
+"""Shared test setup for the agent packages.
+
+Agent modules import their siblings as ``agents.<module>`` while the sources live
+in ``agents/library``, so expose both directories under the ``agents`` package.
+"""
+
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.parent
+
+if "agents" not in sys.modules:
+    agents_package = types.ModuleType("agents")
+    agents_package.__path__ = [str(ROOT / "agents"), str(ROOT / "agents" / "library")]
+    sys.modules["agents"] = agents_package
+
+sys.path.insert(0, str(ROOT / "agents" / "crews"))
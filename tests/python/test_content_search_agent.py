@@ -0,0 +1,259 @@
+"""
+Unit tests for the content search agent tools.
+
+The tools fall back to their built-in sample episodes, so these tests run the
+real search paths without any index files on disk.
+"""
+
+import copy
+import json
+import threading
+
+import pytest
+
+import agents.content_search_agent as content_search
+from agents.content_search_agent import (
+    AdvancedSearchTool,
+    ContextSearchTool,
+    JokeSearchTool,
+    LocationSearchTool,
+    SearchIndexManagementTool,
+    SearchResultCache,
+    TimestampSearchTool,
+    TopicSearchTool,
+    TranscriptIndex,
+)
+from agents.robust_tool import ValidationError
+
+
+TRANSCRIPT = """[00:00] Host: Welcome to the show about AI.
+[00:15] Guest: Machine learning keeps improving.
+[00:30] Host: Comedy and AI make odd partners.
+"""
+
+
+class TestTranscriptIndex:
+    """Tests for the per-transcript inverted index"""
+
+    def test_candidates_find_substring_matches(self):
+        """Candidates cover every segment with a token containing the term"""
+        index = TranscriptIndex(content_search._parse_transcript(TRANSCRIPT))
+
+        assert index.candidates("ai") == {0, 2}
+        assert index.candidates("machine learn") == {1}
+        assert index.candidates("podcast") == set()
+
+    def test_word_memo_stays_bounded(self, monkeypatch):
+        """Old words are evicted once the memo is full, without changing answers"""
+        monkeypatch.setattr(content_search, "_MAX_CACHED_WORDS", 2)
+        index = TranscriptIndex(content_search._parse_transcript(TRANSCRIPT))
+
+        for word in ("host", "guest", "comedy", "host"):
+            index.candidates(word)
+
+        assert len(index._word_candidates) == 2
+        assert index.candidates("guest") == {1}
+
+
+class TestSearchResultCache:
+    """Tests for the shared search result cache"""
+
+    def test_caching_is_opt_in(self):
+        """Results are not stored unless a positive cache_ttl is passed"""
+        cache = SearchResultCache()
+        index = {}
+        cache.put("topic_search", index, {"q": "AI"}, {"results": [1]})
+
+        assert cache.get("topic_search", index, {"q": "AI"}) is None
+        assert cache.get("topic_search", index, {"q": "AI", "cache_ttl": 60}) is None
+
+    def test_hits_are_independent_deep_copies(self):
+        """Mutating a returned or stored result never changes later hits"""
+        cache = SearchResultCache()
+        index = {}
+        params = {"q": "AI", "cache_ttl": 60}
+        result = {"results": [{"priority": "High"}]}
+
+        cache.put("topic_search", index, params, result)
+        result["results"][0]["priority"] = "MUTATED"
+        first = cache.get("topic_search", index, params)
+        first["results"][0]["priority"] = "MUTATED"
+
+        assert cache.get("topic_search", index, params) == {"results": [{"priority": "High"}]}
+
+    def test_results_are_keyed_by_index(self):
+        """A result computed against one index is never served for another"""
+        cache = SearchResultCache()
+        params = {"q": "AI", "cache_ttl": 60}
+        cache.put("topic_search", {"episodes": {}}, params, {"results": [1]})
+
+        assert cache.get("topic_search", {"episodes": {}}, params) is None
+
+    @pytest.mark.parametrize("ttl", [None, "60", -1, float("nan"), True])
+    def test_invalid_ttl_is_rejected(self, ttl):
+        """cache_ttl values that are not non-negative seconds raise ValidationError"""
+        with pytest.raises(ValidationError):
+            SearchResultCache().get("topic_search", {}, {"q": "AI", "cache_ttl": ttl})
+
+
+class TestTopicSearchTool:
+    """Tests for TopicSearchTool"""
+
+    def test_results_are_plain_json(self):
+        """Topic results, including their context, serialize with the json module"""
+        data = TopicSearchTool().execute({"search_terms": ["AI"]}).data
+
+        assert json.loads(json.dumps(data)) == data
+        assert type(data["results"][0]["context"]) is list
+
+    def test_found_terms_keep_query_order_and_case(self):
+        """Each hit lists the query terms it contains, as the caller wrote them"""
+        data = TopicSearchTool().execute({"search_terms": ["Ethical", "ai", "podcast"]}).data
+
+        found = [result["found_terms"] for result in data["results"]]
+        assert ["Ethical", "ai"] in found
+        assert all(terms and "podcast" not in terms for terms in found)
+        assert all(
+            all(term.lower() in result["text"].lower() for term in result["found_terms"])
+            for result in data["results"]
+        )
+
+    def test_search_runs_on_the_calling_thread(self):
+        """Searching many episodes does not start worker threads"""
+        tool = TopicSearchTool()
+        index = tool._load_or_create_search_index()
+        episode = next(iter(index["episodes"].values()))
+        tool._search_index = {
+            "episodes": {f"ep{i:03d}": episode for i in range(8)},
+            "last_updated": index["last_updated"],
+        }
+        before = set(threading.enumerate())
+
+        data = tool._execute_core({"search_terms": ["AI"], "max_results": 100}, "test")
+
+        assert data["episodes_searched"] == 8
+        assert set(threading.enumerate()) <= before
+
+    def test_none_cache_ttl_is_a_validation_error(self):
+        """cache_ttl=None is reported as invalid input rather than a TypeError"""
+        with pytest.raises(ValidationError):
+            TopicSearchTool().execute({"search_terms": ["AI"], "cache_ttl": None})
+
+    def test_cached_results_do_not_leak_mutations(self):
+        """Editing one caller's results leaves a cached repeat untouched"""
+        tool = TopicSearchTool()
+        params = {"search_terms": ["AI"], "cache_ttl": 60}
+
+        first = tool.execute(params).data
+        first["results"][0]["found_terms"].append("MUTATED")
+        second = tool.execute(params).data
+
+        assert "MUTATED" not in second["results"][0]["found_terms"]
+
+    def test_tool_instances_do_not_share_cached_results(self):
+        """Each tool instance's own index decides whether a cached result applies"""
+        params = {"search_terms": ["AI"], "cache_ttl": 60}
+        first = TopicSearchTool()
+        first.execute(params)
+        second = TopicSearchTool()
+        second._search_index = {"episodes": {}, "last_updated": None}
+
+        assert second.execute(params).data["results"] == []
+
+
+class TestTimestampSearchTool:
+    """Tests for TimestampSearchTool"""
+
+    @pytest.mark.parametrize("time_specification", [
+        {"relative_time": {"position": "middle"}},
+        {"relative_time": {"percentage": 50}},
+        {"time_range": {"start_time": "00:00:00", "end_time": "00:01:00"}},
+        {"exact_time": "00:00:20"},
+    ])
+    def test_distances_are_float_seconds(self, time_specification):
+        """Overlapping segments report a distance of 0.0, never int 0"""
+        data = TimestampSearchTool()._execute_core(
+            {"time_specification": time_specification, "search_radius": 30.0}, "test"
+        )
+
+        distances = [result["distance_from_target"] for result in data["results"]]
+        assert 0.0 in distances
+        assert all(type(distance) is float for distance in distances)
+
+
+def scribble(value):
+    """Mutate every nested list and dict inside a result."""
+    if isinstance(value, dict):
+        for item in value.values():
+            scribble(item)
+        value["MUTATED"] = True
+    elif isinstance(value, list):
+        for item in value:
+            scribble(item)
+        value.append("MUTATED")
+
+
+class TestSharedIndexes:
+    """Tests for the index singletons shared by every tool instance"""
+
+    @pytest.mark.parametrize("tool_class, parameters", [
+        (JokeSearchTool, {"topics": ["science", "farming"]}),
+        (ContextSearchTool, {"context_query": "Jared live on stage"}),
+        (LocationSearchTool, {"location_query": "stage"}),
+        (AdvancedSearchTool, {"search_criteria": {"joke_topics": ["science"], "people": ["jared"]}}),
+    ])
+    def test_mutating_results_leaves_the_index_intact(self, tool_class, parameters):
+        """Results own their nested values, so editing them never changes later searches"""
+        first = tool_class()._execute_core(parameters, "test")
+        expected = json.dumps(first["results"], sort_keys=True)
+
+        scribble(first["results"])
+        second = tool_class()._execute_core(parameters, "test")
+
+        assert json.dumps(second["results"], sort_keys=True) == expected
+
+
+@pytest.fixture
+def index_registry(monkeypatch):
+    registry = copy.deepcopy(SearchIndexManagementTool._MOCK_INDEXES)
+    monkeypatch.setattr(SearchIndexManagementTool, "_MOCK_INDEXES", registry)
+    return registry
+
+
+class TestSearchIndexManagementTool:
+    """Tests for SearchIndexManagementTool"""
+
+    def test_anonymous_creates_are_not_registered(self, index_registry):
+        """Creating an index without a name leaves the shared registry unchanged"""
+        before = dict(index_registry)
+
+        for _ in range(3):
+            result = SearchIndexManagementTool()._execute_core({"operation": "create", "index_type": "joke"}, "test")
+            assert result["status"] == "success"
+
+        assert index_registry == before
+
+    def test_named_indexes_persist_across_instances(self, index_registry):
+        """A named index can be updated and queried from another instance"""
+        SearchIndexManagementTool()._execute_core({"operation": "create", "index_name": "mine"}, "test")
+        SearchIndexManagementTool()._execute_core(
+            {"operation": "update", "index_name": "mine", "episode_ids": ["ep001"]}, "test"
+        )
+
+        status = SearchIndexManagementTool()._execute_core({"operation": "status", "index_name": "mine"}, "test")
+
+        assert status["index"]["status"] == "updated"
+        assert status["index"]["episode_count"] == 11
+
+    @pytest.mark.parametrize("operation", ["create", "update", "optimize"])
+    def test_responses_do_not_expose_the_registry(self, index_registry, operation):
+        """Editing a returned index never changes the registered one"""
+        parameters = {"operation": operation, "index_name": "joke_index_456", "force_rebuild": True}
+        result = SearchIndexManagementTool()._execute_core(parameters, "test")
+
+        result["index"]["status"] = "CORRUPTED"
+        status = SearchIndexManagementTool()._execute_core(
+            {"operation": "status", "index_name": "joke_index_456"}, "test"
+        )
+
+        assert status["index"]["status"] != "CORRUPTED"
@@ -0,0 +1,350 @@
+"""
+Unit tests for the enhanced base agent.
+
+Framework integrations are replaced with stand-ins on a real agent built from a
+temporary configuration, so these tests cover the agent's own orchestration
+without calling an LLM provider.
+"""
+
+import asyncio
+import gc
+import json
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("langchain_community")
+
+import agents.enhanced_base_agent as enhanced
+from agents.enhanced_base_agent import EnhancedAgentTool, EnhancedBaseAgent
+from agents.robust_tool import ToolResult
+
+
+class StubTool(EnhancedAgentTool):
+    """Enhanced tool exposed to the framework integrations, echoing its parameters."""
+
+    def __init__(self, name, description, success=True):
+        super().__init__(name, description)
+        self.success = success
+        self.executions = []
+
+    def _create_implementation(self):
+        return None
+
+    def execute(self, parameters):
+        self.executions.append(parameters)
+        if not self.success:
+            return ToolResult(success=False, error="tool failed", execution_id="exec_1_stub")
+        return ToolResult(success=True, data={"echo": parameters}, execution_id="exec_1_stub")
+
+
+class RecordingAgent(EnhancedBaseAgent):
+    """Agent whose framework executions are scripted per test."""
+
+    def __init__(self, *args, outcomes=None, tools=None, **kwargs):
+        self.outcomes = outcomes or {}
+        self.agent_tools = tools or {}
+        self.calls = []
+        self.cancelled = []
+        super().__init__(*args, **kwargs)
+        for name in enhanced.FRAMEWORK_INTEGRATIONS:
+            self.frameworks_available[name] = name in self.outcomes
+            self.__dict__[enhanced.FRAMEWORK_INTEGRATIONS[name]] = object() if name in self.outcomes else None
+
+    def _initialize_tools(self):
+        return self.agent_tools
+
+    def _record(self, framework):
+        delay, success = self.outcomes[framework]
+        self.calls.append(framework)
+        return delay, {"success": success, "framework": framework}
+
+    def execute_with_langchain(self, task, context=None):
+        delay, result = self._record("langchain")
+        time.sleep(delay)
+        return result
+
+    def execute_with_crewai(self, task, context=None):
+        delay, result = self._record("crewai")
+        time.sleep(delay)
+        return result
+
+    async def execute_with_langgraph(self, task, context=None):
+        delay, result = self._record("langgraph")
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append("langgraph")
+            raise
+        return result
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "agents_config.json"
+    path.write_text(json.dumps({"agents": {"tester": {"name": "tester", "role": "tester"}}}))
+    return str(path)
+
+
+class TestAutoExecution:
+    """Tests for execute_task in auto mode"""
+
+    def test_agents_without_tools_race_frameworks(self, config_path):
+        """The first success wins and a slower LangGraph run is cancelled"""
+        agent = RecordingAgent("tester", config_path, outcomes={
+            "langgraph": (1.0, True), "crewai": (0.0, False), "langchain": (0.05, True),
+        })
+
+        result = agent.execute_task("task")
+
+        assert result["framework"] == "langchain"
+        assert sorted(agent.calls) == ["crewai", "langchain", "langgraph"]
+        deadline = time.monotonic() + 1
+        while not agent.cancelled and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert agent.cancelled == ["langgraph"]
+
+    def test_agents_with_tools_run_one_framework_at_a_time(self, config_path):
+        """Frameworks that can call tools never run concurrently"""
+        agent = RecordingAgent("tester", config_path, tools={"stub": StubTool("stub", "Stub tool")}, outcomes={
+            "langgraph": (0.0, False), "crewai": (0.0, True), "langchain": (0.0, True),
+        })
+
+        result = agent.execute_task("task")
+
+        assert result["framework"] == "crewai"
+        assert agent.calls == ["langgraph", "crewai"]
+
+    def test_failures_report_the_preferred_framework(self, config_path):
+        """When every framework fails, the most preferred one's result is returned"""
+        agent = RecordingAgent("tester", config_path, tools={"stub": StubTool("stub", "Stub tool")}, outcomes={
+            "langgraph": (0.0, False), "langchain": (0.0, False),
+        })
+
+        result = agent.execute_task("task")
+
+        assert result == {"success": False, "framework": "langgraph"}
+        assert agent.calls == ["langgraph", "langchain"]
+
+
+class TestEnhancedExecuteTool:
+    """Tests for enhanced_execute_tool"""
+
+    def test_auto_mode_reports_the_direct_result(self, config_path):
+        """Auto mode runs the tool once and skips the framework round trip"""
+        tool = StubTool("stub", "Stub tool")
+        agent = RecordingAgent("tester", config_path, tools={"stub": tool}, outcomes={"langchain": (0.0, True)})
+
+        result = agent.enhanced_execute_tool("stub", {"query": "AI", "limit": 3})
+
+        assert tool.executions == [{"query": "AI", "limit": 3}]
+        assert agent.calls == []
+        assert result["framework_used"] == "direct"
+        assert result["framework_result"] == {
+            "success": True, "result": {"echo": {"query": "AI", "limit": 3}}, "framework": "direct"
+        }
+        assert result["success"] is True
+
+    def test_auto_mode_reports_tool_errors(self, config_path):
+        """A failing tool fails the direct result with the tool's error"""
+        agent = RecordingAgent("tester", config_path, tools={"stub": StubTool("stub", "Stub tool", success=False)})
+
+        result = agent.enhanced_execute_tool("stub", {})
+
+        assert result["framework_result"] == {
+            "success": False, "result": None, "framework": "direct", "error": "tool failed"
+        }
+        assert result["success"] is False
+
+    def test_named_framework_processes_the_tool_result(self, config_path):
+        """Naming a framework runs it after a single tool execution"""
+        tool = StubTool("stub", "Stub tool")
+        agent = RecordingAgent("tester", config_path, tools={"stub": tool}, outcomes={"langchain": (0.0, True)})
+
+        result = agent.enhanced_execute_tool("stub", {"query": "AI"}, framework="langchain")
+
+        assert len(tool.executions) == 1
+        assert agent.calls == ["langchain"]
+        assert result["framework_used"] == "langchain"
+        assert result["success"] is True
+
+
+class FailingLangChainAgent(EnhancedBaseAgent):
+    """Agent whose LangChain integration fails to initialize."""
+
+    def __init__(self, *args, **kwargs):
+        self.initialized = []
+        super().__init__(*args, **kwargs)
+
+    def _initialize_tools(self):
+        return {}
+
+    def _initialize_langchain_agent(self):
+        self.initialized.append("langchain")
+        self.frameworks_available["langchain"] = False
+        return None
+
+
+class TestFrameworkStatus:
+    """Tests for framework status reporting"""
+
+    def test_status_reflects_failed_initialization_before_first_use(self, config_path):
+        """A framework that cannot initialize is reported unavailable straight away"""
+        agent = FailingLangChainAgent("tester", config_path)
+
+        status = agent.get_framework_status()
+
+        assert status["frameworks"]["langchain"] is False
+        assert status["langchain_agent"] is False
+        assert agent.get_enhanced_status()["frameworks"]["langchain"] is False
+        assert agent.initialized == ["langchain"]
+
+    def test_status_reports_built_integrations(self, config_path):
+        """Integrations that initialize are reported as available and built"""
+        agent = RecordingAgent("tester", config_path, outcomes={"langchain": (0.0, True)})
+
+        status = agent.get_framework_status()
+
+        assert status["frameworks"]["langchain"] is True
+        assert status["langchain_agent"] is True
+
+
+class TestRunCoroutine:
+    """Tests for running coroutines on the shared background loop"""
+
+    def test_runs_coroutines_from_synchronous_code(self):
+        """Calls from plain threads run on the shared background loop"""
+        async def loop_name():
+            return threading.current_thread().name
+
+        assert enhanced._run_coroutine(loop_name()) == "enhanced-agent-loop"
+
+    def test_concurrent_first_use_starts_one_loop(self, monkeypatch):
+        """Threads racing to start the background loop all get the same one"""
+        monkeypatch.setattr(enhanced, "_background_loop_instance", None)
+        barrier = threading.Barrier(8)
+
+        def first_use(_):
+            barrier.wait()
+            return enhanced._background_loop()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            loops = set(pool.map(first_use, range(8)))
+
+        assert len(loops) == 1
+        loop = loops.pop()
+        loop.call_soon_threadsafe(loop.stop)
+
+    def test_reentrant_use_raises_without_blocking_the_loop(self):
+        """Nested synchronous calls fail fast and leave the loop responsive"""
+        async def nested():
+            with pytest.raises(RuntimeError, match="async variant"):
+                enhanced._run_coroutine(asyncio.sleep(0))
+            return "done"
+
+        loop = enhanced._background_loop()
+        assert asyncio.run_coroutine_threadsafe(nested(), loop).result(timeout=5) == "done"
+        assert enhanced._run_coroutine(asyncio.sleep(0, result="still running")) == "still running"
+
+
+class TestSpanProcessorSettings:
+    """Tests for reading span processor settings from the environment"""
+
+    def test_invalid_values_fall_back_to_defaults(self, monkeypatch, caplog):
+        """A malformed OTEL_BSP_* value is ignored without affecting the others"""
+        monkeypatch.setenv("OTEL_BSP_MAX_QUEUE_SIZE", "lots")
+        monkeypatch.setenv("OTEL_BSP_SCHEDULE_DELAY", "500")
+
+        settings = enhanced._span_processor_settings()
+
+        assert settings["max_queue_size"] == enhanced.SPAN_PROCESSOR_DEFAULTS["max_queue_size"][1]
+        assert settings["schedule_delay_millis"] == 500
+        assert "OTEL_BSP_MAX_QUEUE_SIZE" in caplog.text
+
+
+class BatchingExecutor:
+    """Stand-in agent executor recording the size of each abatch call."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    async def abatch(self, payloads, return_exceptions=False):
+        self.batch_sizes.append(len(payloads))
+        await asyncio.sleep(0.05)
+        return [
+            ValueError(payload["input"]) if payload["input"].startswith("bad") else {"output": payload["input"]}
+            for payload in payloads
+        ]
+
+
+class BatchingAgent(EnhancedBaseAgent):
+    """Agent whose LangChain executor is a BatchingExecutor."""
+
+    def _initialize_tools(self):
+        return {}
+
+    def _initialize_langchain_agent(self):
+        return BatchingExecutor()
+
+
+def invoke_langchain(agent, text):
+    return enhanced._run_coroutine(agent._invoke_langchain({"input": text, "chat_history": []}))
+
+
+class TestLangChainBatching:
+    """Tests for coalescing concurrent LangChain invocations"""
+
+    def test_concurrent_calls_are_coalesced(self, config_path):
+        """Concurrent invocations share abatch calls and each gets its own output"""
+        agent = BatchingAgent("tester", config_path)
+        inputs = [f"task {i}" for i in range(20)]
+
+        with ThreadPoolExecutor(max_workers=len(inputs)) as pool:
+            outputs = list(pool.map(lambda text: invoke_langchain(agent, text), inputs))
+
+        assert outputs == [{"output": text} for text in inputs]
+        batch_sizes = agent.langchain_agent.batch_sizes
+        assert sum(batch_sizes) == len(inputs)
+        assert len(batch_sizes) < len(inputs)
+        assert max(batch_sizes) <= enhanced.LANGCHAIN_MAX_BATCH
+
+    def test_item_errors_reach_only_their_caller(self, config_path):
+        """A failing input raises for its own caller while batch-mates succeed"""
+        agent = BatchingAgent("tester", config_path)
+
+        def call(text):
+            try:
+                return invoke_langchain(agent, text)
+            except ValueError as e:
+                return f"error: {e}"
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            outputs = list(pool.map(call, ["ok 1", "bad 2", "ok 3", "ok 4"]))
+
+        assert outputs == [{"output": "ok 1"}, "error: bad 2", {"output": "ok 3"}, {"output": "ok 4"}]
+
+    def test_execution_succeeds_without_a_tracer(self, config_path):
+        """Without OpenTelemetry the task still runs, just outside a span"""
+        agent = BatchingAgent("tester", config_path)
+        agent.telemetry_tracer = None
+
+        result = agent.execute_with_langchain("task")
+
+        assert result == {"success": True, "result": "task", "intermediate_steps": [], "framework": "langchain"}
+
+    def test_idle_agents_are_released(self, config_path):
+        """The batcher stops once drained, so it does not keep the agent alive"""
+        agent = BatchingAgent("tester", config_path)
+        assert invoke_langchain(agent, "task") == {"output": "task"}
+        batcher = agent._langchain_batcher
+        agent_ref = weakref.ref(agent)
+
+        enhanced._run_coroutine(asyncio.sleep(0.01))
+        del agent
+        gc.collect()
+
+        assert batcher.done()
+        assert agent_ref() is None
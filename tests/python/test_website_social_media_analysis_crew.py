@@ -0,0 +1,212 @@
+"""
+Unit tests for the website & social media analysis crew.
+
+The crew is assembled by hand around stand-in CrewAI objects, so these tests
+cover the crew's own orchestration without calling an LLM provider.
+"""
+
+import asyncio
+import gc
+import json
+import sys
+import threading
+import types
+import weakref
+
+# The crew imports its analyst definitions from a config module that is not
+# checked in; these tests build the crew by hand, so an empty one suffices
+try:
+    import agents.website_social_media_analyst_config  # noqa: F401
+except ImportError:
+    analyst_config = types.ModuleType("agents.website_social_media_analyst_config")
+    analyst_config.agents = {}
+    sys.modules[analyst_config.__name__] = analyst_config
+
+import website_social_media_analysis_crew as crew_module
+from website_social_media_analysis_crew import WebsiteSocialMediaAnalysisCrew
+
+
+class RecordingCrew:
+    """Stand-in CrewAI crew that records which instance ran each kickoff."""
+
+    def __init__(self, log=None, lock=None):
+        self.log = log if log is not None else []
+        self.lock = lock or threading.Lock()
+        self.outputs = []
+
+    def copy(self):
+        return RecordingCrew(self.log, self.lock)
+
+    async def kickoff_async(self, inputs):
+        # Per-run state, as a real CrewAI crew keeps task outputs between runs
+        self.outputs.append(inputs["time_period"])
+        await asyncio.sleep(0.01)
+        with self.lock:
+            self.log.append((id(self), tuple(self.outputs)))
+        return "raw results"
+
+
+def make_crew(crew=None):
+    """Build an analysis crew without loading agent configuration."""
+    instance = WebsiteSocialMediaAnalysisCrew.__new__(WebsiteSocialMediaAnalysisCrew)
+    instance.config_path = "unused.json"
+    instance.agents = {}
+    instance.crewai_agents = {}
+    instance._agent_list = None
+    instance.crew = crew
+    instance.logger = crew_module.logging.getLogger(__name__)
+    instance.config = {"agents": {}}
+    instance._result_cache = crew_module.OrderedDict()
+    instance._result_cache_lock = threading.Lock()
+    instance._inflight = {}
+    instance.rate_limit_hits = 0
+    return instance
+
+
+class TestRunBatch:
+    """Tests for concurrent batch analysis"""
+
+    def test_each_kickoff_runs_on_its_own_crew_copy(self):
+        """Concurrent analyses never share per-run crew state"""
+        shared = RecordingCrew()
+        crew = make_crew(shared)
+        periods = ["last_7_days", "last_30_days", "last_90_days", "last_year"]
+
+        results = crew.run_batch([{"time_period": period} for period in periods])
+
+        assert [result["analysis_period"] for result in results] == periods
+        assert all(result["success"] for result in results)
+        assert shared.outputs == []
+        assert len({crew_id for crew_id, _ in shared.log}) == len(periods)
+        assert all(len(outputs) == 1 for _, outputs in shared.log)
+
+
+class TestResultReuse:
+    """Tests for coalescing and caching comprehensive analyses"""
+
+    def test_concurrent_identical_analyses_share_one_kickoff(self):
+        """Identical in-flight requests wait on a single crew run"""
+        shared = RecordingCrew()
+        crew = make_crew(shared)
+        params = {"time_period": "last_7_days"}
+
+        async def run_all():
+            return await asyncio.gather(*(crew.run_comprehensive_analysis_async(params) for _ in range(5)))
+
+        results = asyncio.run(run_all())
+
+        assert len(shared.log) == 1
+        assert all(result == results[0] for result in results)
+        assert len({id(result) for result in results}) == len(results)
+
+    def test_cached_results_are_reused_until_bypassed(self):
+        """A repeat analysis hits the cache unless bypass_cache is set"""
+        shared = RecordingCrew()
+        crew = make_crew(shared)
+        params = {"time_period": "last_30_days"}
+
+        crew.run_comprehensive_analysis(params)
+        crew.run_comprehensive_analysis(params)
+        assert len(shared.log) == 1
+
+        crew.run_comprehensive_analysis(params, bypass_cache=True)
+        assert len(shared.log) == 2
+
+
+class StubAgent:
+    """Stand-in CrewAI agent."""
+
+
+def fake_crewai():
+    """Namespace mimicking the CrewAI classes _build_crew constructs."""
+    def model(**kwargs):
+        return types.SimpleNamespace(**kwargs)
+    return types.SimpleNamespace(Task=model, Crew=model, Process=types.SimpleNamespace(sequential="sequential"))
+
+
+class TestBuildCrew:
+    """Tests for crew construction"""
+
+    def test_builds_analyst_tasks_and_report_join(self, monkeypatch):
+        """Every analyst gets an async task and the report task waits on all of them"""
+        monkeypatch.setattr(crew_module, "_get_crewai", fake_crewai)
+        agents = tuple(StubAgent() for _ in crew_module._CREW_AGENT_ORDER)
+
+        crew = WebsiteSocialMediaAnalysisCrew._build_crew(agents)
+
+        *analyst_tasks, report_task = crew.tasks
+        assert crew.agents == list(agents)
+        assert all(task.async_execution for task in analyst_tasks)
+        assert report_task.agent is agents[-1]
+        assert report_task.context == analyst_tasks
+
+    def test_built_crews_are_not_retained(self, monkeypatch):
+        """Dropping a crew releases its agents"""
+        monkeypatch.setattr(crew_module, "_get_crewai", fake_crewai)
+        agents = tuple(StubAgent() for _ in crew_module._CREW_AGENT_ORDER)
+        agent_ref = weakref.ref(agents[0])
+
+        crew = WebsiteSocialMediaAnalysisCrew._build_crew(agents)
+        del crew, agents
+        gc.collect()
+
+        assert agent_ref() is None
+
+
+class StubWorkflowAgent:
+    """Stand-in enhanced agent whose workflow leaves every section to sample data."""
+
+    def execute_enhanced_workflow(self, workflow_name, inputs, framework="auto"):
+        return {"success": True, "results": {}}
+
+
+class TestResultContract:
+    """Tests for the shape of results returned by the run_* methods"""
+
+    def test_comprehensive_analysis_is_plain_json(self):
+        """Results serialize with the standard json module and index like dicts"""
+        crew = make_crew(RecordingCrew())
+
+        result = crew.run_comprehensive_analysis({"time_period": "last_30_days"})
+
+        json.dumps(result)
+        recommendations = result["results"]["recommendations"]
+        assert isinstance(recommendations["quick_wins"], list)
+        assert recommendations["quick_wins"][0]["priority"] == "High"
+        assert type(result["results"]["website_analysis"]["traffic_metrics"]) is dict
+
+    def test_mutating_a_result_does_not_leak_into_later_results(self):
+        """Callers own their copy; cached results and sample data stay intact"""
+        crew = make_crew(RecordingCrew())
+        params = {"time_period": "last_30_days"}
+
+        first = crew.run_comprehensive_analysis(params)
+        first["results"]["recommendations"]["quick_wins"][0]["priority"] = "MUTATED"
+        second = crew.run_comprehensive_analysis(params)
+
+        assert second["results"]["recommendations"]["quick_wins"][0]["priority"] == "High"
+
+    def test_enhanced_analysis_is_plain_json(self):
+        """Enhanced results serialize and match their JSON bytes encoding"""
+        crew = make_crew()
+        crew.agents["website_social_media_crew"] = StubWorkflowAgent()
+        params = {"time_period": "last_7_days"}
+
+        result = crew.run_enhanced_analysis(params)
+
+        json.dumps(result)
+        assert result["results"]["action_plan"] == json.loads(
+            crew.run_enhanced_analysis(params, as_json=True)
+        )["results"]["action_plan"]
+
+    def test_json_output_reuses_encoded_sample_sections(self, monkeypatch):
+        """as_json splices pre-encoded sample sections and matches indented json.dumps"""
+        monkeypatch.setattr(crew_module, "_ENCODED_SECTIONS", {})
+        crew = make_crew(RecordingCrew())
+        params = {"time_period": "last_30_days"}
+
+        encoded = crew.run_comprehensive_analysis(params, as_json=True)
+
+        assert crew_module._ENCODED_SECTIONS
+        assert encoded.decode() == json.dumps(json.loads(encoded), indent=2)
+        assert json.loads(encoded) == crew.run_comprehensive_analysis(params)